@@ -1,29 +1,82 @@
 import os
+import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
-from pdf2image import convert_from_path
+from PIL import Image
+from pypdf import PdfReader
 
 
 # Converts each page of a PDF to a PNG image.
+# Pages are rendered in small chunks by a pool of pdftoppm processes, directly at
+# a size that fits `max_dim`, and written straight to disk by pdftoppm, so
+# memory use doesn't grow with the number of pages.
 
+DPI = 200
+CHUNK_PAGES = 8
 
-def convert(pdf_path, output_dir, max_dim=1000):
-    images = convert_from_path(pdf_path, dpi=200)
 
-    for i, image in enumerate(images):
-        # Scale image if needed to keep width/height under `max_dim`
-        width, height = image.size
-        if width > max_dim or height > max_dim:
-            scale_factor = min(max_dim / width, max_dim / height)
-            new_width = int(width * scale_factor)
-            new_height = int(height * scale_factor)
-            image = image.resize((new_width, new_height))
-        
-        image_path = os.path.join(output_dir, f"page_{i+1}.png")
-        image.save(image_path)
-        print(f"Saved page {i+1} as {image_path} (size: {image.size})")
+# Returns pdftoppm's size for a page: None to render at 200 DPI, or `max_dim` to
+# scale the longer side to `max_dim` if 200 DPI would be larger than that.
+def page_scale_to(longest_side_pts, max_dim):
+    return max_dim if longest_side_pts / 72 * DPI > max_dim else None
 
-    print(f"Converted {len(images)} pages to PNG images")
+
+# Splits the pages into runs of at most `chunk_pages` consecutive pages that are
+# rendered with the same size, so each run is one pdftoppm call.
+def make_chunks(scale_tos, chunk_pages=CHUNK_PAGES):
+    chunks = []
+    for page_number, scale_to in enumerate(scale_tos, 1):
+        if chunks:
+            first, last, chunk_scale_to = chunks[-1]
+            if chunk_scale_to == scale_to and last - first + 1 < chunk_pages:
+                chunks[-1] = (first, page_number, scale_to)
+                continue
+        chunks.append((page_number, page_number, scale_to))
+    return chunks
+
+
+# Renders pages `first`..`last` with one pdftoppm process. Returns a list of
+# (page number, image path, image size).
+def render_chunk(pdf_path, output_dir, first, last, scale_to):
+    # pdftoppm names its files "<prefix>-<zero-padded page number>.png"
+    prefix = f".chunk-{first}"
+    cmd = ["pdftoppm", "-png", "-r", str(DPI), "-f", str(first), "-l", str(last)]
+    if scale_to is not None:
+        cmd += ["-scale-to", str(scale_to)]
+    subprocess.run(cmd + [pdf_path, os.path.join(output_dir, prefix)], check=True, capture_output=True)
+
+    results = []
+    for name in os.listdir(output_dir):
+        if not (name.startswith(prefix + "-") and name.endswith(".png")):
+            continue
+        page_number = int(name[len(prefix) + 1:-len(".png")])
+        image_path = os.path.join(output_dir, f"page_{page_number}.png")
+        os.replace(os.path.join(output_dir, name), image_path)
+        with Image.open(image_path) as image:  # Only reads the header
+            results.append((page_number, image_path, image.size))
+    return sorted(results)
+
+
+def convert(pdf_path, output_dir, max_dim=1000, jobs=None):
+    scale_tos = [
+        page_scale_to(max(float(page.cropbox.width), float(page.cropbox.height)), max_dim)
+        for page in PdfReader(pdf_path).pages
+    ]
+    jobs = jobs or os.cpu_count() or 1
+    # Smaller chunks for short PDFs, so that every worker gets pages
+    chunks = make_chunks(scale_tos, max(1, min(CHUNK_PAGES, -(-len(scale_tos) // jobs))))
+
+    with ThreadPoolExecutor(jobs) as executor:
+        futures = [
+            executor.submit(render_chunk, pdf_path, output_dir, first, last, scale_to)
+            for first, last, scale_to in chunks
+        ]
+        for future in futures:
+            for page_number, image_path, size in future.result():
+                print(f"Saved page {page_number} as {image_path} (size: {size})")
+
+    print(f"Converted {len(scale_tos)} pages to PNG images")
 
 
 if __name__ == "__main__":
@@ -1,22 +1,100 @@
 import json
 import sys
+import textwrap
+from collections import defaultdict
 
 from pypdf import PdfReader
+from pypdf.generic import IndirectObject
 
 
 # Extracts data for the fillable form fields in a PDF and outputs JSON that
 # Claude uses to fill the fields. See forms.md.
 
 
+# Identifies a PDF object by its object number, or None for direct objects.
+def object_key(obj):
+    ref = obj if isinstance(obj, IndirectObject) else getattr(obj, "indirect_reference", None)
+    return (ref.idnum, ref.generation) if ref is not None else None
+
+
 # This matches the format used by PdfReader `get_fields` and `update_page_form_field_values` methods.
-def get_full_annotation_field_id(annotation):
-    components = []
-    while annotation:
-        field_name = annotation.get('/T')
-        if field_name:
-            components.append(field_name)
-        annotation = annotation.get('/Parent')
-    return ".".join(reversed(components)) if components else None
+# Pass the same `name_cache` dict for every annotation of a document: widgets of
+# large forms share parent fields, and each parent's name is only built once.
+def get_full_annotation_field_id(annotation, name_cache=None):
+    key = object_key(annotation)
+    if name_cache is not None and key is not None and key in name_cache:
+        return name_cache[key]
+
+    parent = annotation.get('/Parent')
+    parent_id = get_full_annotation_field_id(parent, name_cache) if parent else None
+    field_name = annotation.get('/T')
+    field_id = ".".join(c for c in (parent_id, field_name) if c) or None
+
+    if name_cache is not None and key is not None:
+        name_cache[key] = field_id
+    return field_id
+
+
+# The field names used by PdfReader `get_fields`, which (unlike annotation ids)
+# prefer "/TM" and keep empty "/T" components.
+def get_qualified_field_name(field, name_cache):
+    key = object_key(field)
+    if key is not None and key in name_cache:
+        return name_cache[key]
+
+    if "/TM" in field:
+        name = field["/TM"]
+    elif "/Parent" in field:
+        name = get_qualified_field_name(field["/Parent"].get_object(), name_cache) + "." + field.get("/T", "")
+    else:
+        name = field.get("/T", "")
+
+    if key is not None:
+        name_cache[key] = name
+    return name
+
+
+def get_normal_appearance_states(annotation):
+    return list(annotation["/AP"].get_object()["/N"].get_object().keys())
+
+
+# Yields (field_id, field) like PdfReader `get_fields().items()`, in the same
+# order, with each field reduced to the "/FT", "/Kids" and "/_States_" entries
+# used here. `get_fields` checks every field against all fields parsed before
+# it, which takes minutes on forms with thousands of fields; this walks the
+# field tree once and remembers visited fields by object number.
+def iter_fields(reader: PdfReader):
+    acro_form = reader.trailer["/Root"].get("/AcroForm")
+    if acro_form is None:
+        return
+    top_fields = acro_form.get_object().get("/Fields")
+    if top_fields is None:
+        return
+
+    visited = set()
+    name_cache = {}
+    pending = [f.get_object() for f in reversed(top_fields.get_object())]
+    while pending:
+        obj = pending.pop()
+        if "/T" not in obj and "/TM" not in obj:
+            continue
+        key = object_key(obj) or id(obj)
+        if key in visited:
+            continue
+        visited.add(key)
+
+        ft = obj.get("/FT", "")
+        kids = obj.get("/Kids")
+        field = {"/FT": ft, "/Kids": kids}
+        if ft == "/Ch" and obj.get("/Opt"):
+            field["/_States_"] = obj["/Opt"]
+        elif ft == "/Btn" and "/AP" in obj:
+            states = get_normal_appearance_states(obj)
+            field["/_States_"] = states if "/Off" in states else states + ["/Off"]
+        yield get_qualified_field_name(obj, name_cache), field
+
+        if kids:
+            pending.extend(k.get_object() for k in reversed(kids))
 
 
 def make_field_dict(field, field_id):
@@ -50,17 +128,9 @@ def make_field_dict(field, field_id):
     return field_dict
 
 
-# Returns a list of fillable PDF fields:
-# [
-#   {
-#     "field_id": "name",
-#     "page": 1,
-#     "type": ("text", "checkbox", "radio_group", or "choice")
-#     // Per-type additional fields described in forms.md
-#   },
-# ]
-def get_field_info(reader: PdfReader):
-    fields = reader.get_fields()
+# Yields the fillable PDF fields page by page, in the order of get_field_info.
+def iter_field_info(reader: PdfReader):
+    fields = dict(iter_fields(reader))
 
     field_info_by_id = {}
     possible_radio_names = set()
@@ -80,11 +150,12 @@ def get_field_info(reader: PdfReader):
     # all choices have the same field name.
     # See https://westhealth.github.io/exploring-fillable-forms-with-pdfrw.html
     radio_fields_by_id = {}
+    name_cache = {}
 
     for page_index, page in enumerate(reader.pages):
         annotations = page.get('/Annots', [])
         for ann in annotations:
-            field_id = get_full_annotation_field_id(ann)
+            field_id = get_full_annotation_field_id(ann, name_cache)
             if field_id in field_info_by_id:
                 field_info_by_id[field_id]["page"] = page_index + 1
                 field_info_by_id[field_id]["rect"] = ann.get('/Rect')
@@ -115,34 +186,53 @@ def get_field_info(reader: PdfReader):
 
     # Some PDFs have form field definitions without corresponding annotations,
     # so we can't tell where they are. Ignore these fields for now.
-    fields_with_location = []
+    fields_by_page = defaultdict(list)
     for field_info in field_info_by_id.values():
         if "page" in field_info:
-            fields_with_location.append(field_info)
+            fields_by_page[field_info["page"]].append(field_info)
         else:
             print(f"Unable to determine location for field id: {field_info.get('field_id')}, ignoring")
+    for field_info in radio_fields_by_id.values():
+        fields_by_page[field_info["page"]].append(field_info)
 
-    # Sort by page number, then Y position (flipped in PDF coordinate system), then X.
+    # Sort each page's fields by Y position (flipped in PDF coordinate system), then X.
     def sort_key(f):
         if "radio_options" in f:
             rect = f["radio_options"][0]["rect"] or [0, 0, 0, 0]
         else:
             rect = f.get("rect") or [0, 0, 0, 0]
-        adjusted_position = [-rect[1], rect[0]]
-        return [f.get("page"), adjusted_position]
-    
-    sorted_fields = fields_with_location + list(radio_fields_by_id.values())
-    sorted_fields.sort(key=sort_key)
+        return [-rect[1], rect[0]]
+
+    for page_number in sorted(fields_by_page):
+        yield from sorted(fields_by_page[page_number], key=sort_key)
+
 
-    return sorted_fields
+# Returns a list of fillable PDF fields:
+# [
+#   {
+#     "field_id": "name",
+#     "page": 1,
+#     "type": ("text", "checkbox", "radio_group", or "choice")
+#     // Per-type additional fields described in forms.md
+#   },
+# ]
+def get_field_info(reader: PdfReader):
+    return list(iter_field_info(reader))
 
 
+# Writes the fields as they are produced; the file is the same as
+# json.dump(get_field_info(reader), f, indent=2) would write.
 def write_field_info(pdf_path: str, json_output_path: str):
     reader = PdfReader(pdf_path)
-    field_info = get_field_info(reader)
+    count = 0
     with open(json_output_path, "w") as f:
-        json.dump(field_info, f, indent=2)
-    print(f"Wrote {len(field_info)} fields to {json_output_path}")
+        f.write("[")
+        for field_info in iter_field_info(reader):
+            f.write(",\n" if count else "\n")
+            f.write(textwrap.indent(json.dumps(field_info, indent=2), "  "))
+            count += 1
+        f.write("\n]" if count else "]")
+    print(f"Wrote {count} fields to {json_output_path}")
 
 
 if __name__ == "__main__":
@@ -44,6 +44,14 @@ def fill_pdf_fields(input_pdf_path: str, fields_json_path: str, output_pdf_path:
     if has_error:
         sys.exit(1)
 
+    writer = fill_form(reader, fields_by_page)
+    with open(output_pdf_path, "wb") as f:
+        writer.write(f)
+
+
+# Returns a PdfWriter with a copy of the reader's PDF and the given field values
+# filled in. `fields_by_page` maps page numbers to {field_id: value} dicts.
+def fill_form(reader: PdfReader, fields_by_page):
     writer = PdfWriter(clone_from=reader)
     for page, field_values in fields_by_page.items():
         writer.update_page_form_field_values(writer.pages[page - 1], field_values, auto_regenerate=False)
@@ -51,9 +59,7 @@ def fill_pdf_fields(input_pdf_path: str, fields_json_path: str, output_pdf_path:
     # This seems to be necessary for many PDF viewers to format the form values correctly.
     # It may cause the viewer to show a "save changes" dialog even if the user doesn't make any changes.
     writer.set_need_appearances_writer(True)
-    
-    with open(output_pdf_path, "wb") as f:
-        writer.write(f)
+    return writer
 
 
 def validation_error_for_field_value(field_info, field_value):
@@ -92,6 +98,8 @@ def monkeypatch_pydpf_method():
     from pypdf.constants import FieldDictionaryAttributes
 
     original_get_inherited = DictionaryObject.get_inherited
+    if getattr(original_get_inherited, "is_patched", False):
+        return
 
     def patched_get_inherited(self, key: str, default = None):
         result = original_get_inherited(self, key, default)
@@ -100,6 +108,7 @@ def monkeypatch_pydpf_method():
                 result = [r[0] for r in result]
         return result
 
+    patched_get_inherited.is_patched = True
     DictionaryObject.get_inherited = patched_get_inherited
 
 
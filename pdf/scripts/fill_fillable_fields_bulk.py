@@ -0,0 +1,183 @@
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import ArrayObject, DictionaryObject, NameObject, TextStringObject
+
+from extract_form_field_info import get_field_info
+from fill_fillable_fields import fill_form, monkeypatch_pydpf_method, validation_error_for_field_value
+
+
+# Fills one fillable PDF form once per record of a CSV or JSON lines file, like a
+# mail merge. See forms.md.
+# The template is parsed, and its fields extracted, once; every record is
+# validated against those fields before anything is written. The filled copies
+# are then cloned from the parsed template by a pool of worker processes.
+
+# The parsed template in each worker process. Forked workers inherit the parent's
+# copy; others parse the template once when they start.
+_template = None
+
+
+def init_worker(input_pdf_path: str):
+    global _template
+    monkeypatch_pydpf_method()
+    if _template is None:
+        _template = PdfReader(input_pdf_path)
+
+
+# Reads records as {field_id: value} dicts.
+# CSV files have a header row of field IDs; empty cells leave the field unfilled.
+# Other files are JSON lines: one {"field_id": value, ...} object per line.
+def read_records(records_path: str):
+    if records_path.lower().endswith(".csv"):
+        with open(records_path, newline="") as f:
+            return [
+                {field_id: value for field_id, value in row.items() if field_id and value}
+                for row in csv.DictReader(f)
+            ]
+    with open(records_path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+# Groups a record's values by page as `fill_form` expects them, and returns
+# error messages for values that don't fit the template's fields.
+def group_record_values(fields_by_ids, record_number, record):
+    fields_by_page = {}
+    errors = []
+    for field_id, value in record.items():
+        existing_field = fields_by_ids.get(field_id)
+        if not existing_field:
+            errors.append(f"Record {record_number}: ERROR: `{field_id}` is not a valid field ID")
+            continue
+        err = validation_error_for_field_value(existing_field, value)
+        if err:
+            errors.append(f"Record {record_number}: {err}")
+            continue
+        fields_by_page.setdefault(existing_field["page"], {})[field_id] = value
+    return fields_by_page, errors
+
+
+# Moves all of the writer's top-level fields under a new parent field, so that
+# each record keeps its own values once several are merged into one PDF; for
+# example "last_name" becomes "record_1.last_name".
+def nest_fields(writer: PdfWriter, parent_name: str):
+    acro_form = writer.root_object["/AcroForm"].get_object()
+    top_fields = acro_form["/Fields"].get_object()
+    parent = writer._add_object(DictionaryObject({
+        NameObject("/T"): TextStringObject(parent_name),
+        NameObject("/Kids"): ArrayObject(top_fields),
+    }))
+    for field in top_fields:
+        field.get_object()[NameObject("/Parent")] = parent
+    acro_form[NameObject("/Fields")] = ArrayObject([parent])
+
+
+# Fills one record. Writes it to `output_pdf_path`, or returns the PDF bytes
+# (with its fields nested under "record_N") if that is None.
+def fill_record(record_number, fields_by_page, output_pdf_path):
+    writer = fill_form(_template, fields_by_page)
+    if output_pdf_path is not None:
+        with open(output_pdf_path, "wb") as f:
+            writer.write(f)
+        return output_pdf_path
+    nest_fields(writer, f"record_{record_number}")
+    output = io.BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+
+def fill_pdf_fields_bulk(input_pdf_path: str, records_path: str, output_path: str, merge=False, jobs=None):
+    reader = PdfReader(input_pdf_path)
+    fields_by_ids = {f["field_id"]: f for f in get_field_info(reader)}
+    records = read_records(records_path)
+
+    all_fields_by_page = []
+    has_error = False
+    for record_number, record in enumerate(records, 1):
+        fields_by_page, errors = group_record_values(fields_by_ids, record_number, record)
+        for err in errors:
+            print(err)
+        has_error = has_error or bool(errors)
+        all_fields_by_page.append(fields_by_page)
+    if has_error:
+        sys.exit(1)
+    if not records:
+        print(f"No records in {records_path}")
+        return
+
+    if merge:
+        output_pdf_paths = [None] * len(records)
+    else:
+        os.makedirs(output_path, exist_ok=True)
+        digits = len(str(len(records)))
+        output_pdf_paths = [
+            os.path.join(output_path, f"record_{n:0{digits}d}.pdf") for n in range(1, len(records) + 1)
+        ]
+
+    global _template
+    _template = reader
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(records)))
+    args = (range(1, len(records) + 1), all_fields_by_page, output_pdf_paths)
+    if jobs == 1:
+        init_worker(input_pdf_path)
+        results = map(fill_record, *args)
+        write_results(results, output_path, merge)
+    else:
+        with ProcessPoolExecutor(jobs, initializer=init_worker, initargs=(input_pdf_path,)) as executor:
+            # Send records in batches to keep the per-record overhead low
+            chunksize = max(1, min(64, len(records) // (jobs * 4)))
+            results = executor.map(fill_record, *args, chunksize=chunksize)
+            write_results(results, output_path, merge)
+
+
+# Consumes the filled records in order, appending them to one PDF if merging.
+def write_results(results, output_path, merge):
+    if not merge:
+        count = sum(1 for _ in results)
+        print(f"Wrote {count} filled PDFs to {output_path}")
+        return
+
+    merged = PdfWriter()
+    count = 0
+    for data in results:
+        merged.append(PdfReader(io.BytesIO(data)))
+        count += 1
+    merged.set_need_appearances_writer(True)
+    with open(output_path, "wb") as f:
+        merged.write(f)
+    print(f"Wrote {count} filled forms to {output_path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Fill a fillable PDF form once per record of a CSV or JSON lines file."
+    )
+    parser.add_argument("input_pdf", help="Fillable PDF form to use as the template")
+    parser.add_argument(
+        "records",
+        help="CSV file with a header row of field IDs, or JSON lines file with one "
+        '{"field_id": value} object per line',
+    )
+    parser.add_argument(
+        "output",
+        help="Directory for one filled PDF per record, or the output PDF with --merge",
+    )
+    parser.add_argument(
+        "--merge",
+        action="store_true",
+        help='Write all filled forms into one PDF; field IDs get a "record_N." prefix',
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count)",
+    )
+    args = parser.parse_args()
+    fill_pdf_fields_bulk(args.input_pdf, args.records, args.output, args.merge, args.jobs)
@@ -3,6 +3,7 @@ import sys
 
 from pypdf import PdfReader, PdfWriter
 from pypdf.annotations import FreeText
+from pypdf.generic import ArrayObject, NameObject
 
 
 # Fills a PDF by adding text annotations defined in `fields.json`. See forms.md.
@@ -25,43 +26,40 @@ def transform_coordinates(bbox, image_width, image_height, pdf_width, pdf_height
     return left, bottom, right, top
 
 
-def fill_pdf_form(input_pdf_path, fields_json_path, output_pdf_path):
-    """Fill the PDF form with data from fields.json"""
-    
-    # `fields.json` format described in forms.md.
-    with open(fields_json_path, "r") as f:
-        fields_data = json.load(f)
-    
-    # Open the PDF
-    reader = PdfReader(input_pdf_path)
-    writer = PdfWriter()
-    
-    # Copy all pages to writer
-    writer.append(reader)
-    
-    # Get PDF dimensions for each page
-    pdf_dimensions = {}
-    for i, page in enumerate(reader.pages):
-        mediabox = page.mediabox
-        pdf_dimensions[i + 1] = [mediabox.width, mediabox.height]
-    
-    # Process each form field
+# Returns {page number: (image width, image height, PDF width, PDF height)}, the
+# transform_coordinates arguments for each page that has fields, looked up once
+# per page.
+def get_page_transforms(reader, fields_data):
+    page_infos = {}
+    for page_info in fields_data["pages"]:
+        # The first entry for a page wins
+        page_infos.setdefault(page_info["page_number"], page_info)
+
+    transforms = {}
+    for field in fields_data["form_fields"]:
+        page_num = field["page_number"]
+        if page_num in transforms:
+            continue
+        page_info = page_infos[page_num]
+        mediabox = reader.pages[page_num - 1].mediabox
+        transforms[page_num] = (
+            page_info["image_width"],
+            page_info["image_height"],
+            mediabox.width,
+            mediabox.height,
+        )
+    return transforms
+
+
+# Returns (page number, FreeText annotation) for each field with text, in field order.
+def make_annotations(fields_data, page_transforms):
     annotations = []
     for field in fields_data["form_fields"]:
         page_num = field["page_number"]
-        
+
         # Get page dimensions and transform coordinates.
-        page_info = next(p for p in fields_data["pages"] if p["page_number"] == page_num)
-        image_width = page_info["image_width"]
-        image_height = page_info["image_height"]
-        pdf_width, pdf_height = pdf_dimensions[page_num]
-        
-        transformed_entry_box = transform_coordinates(
-            field["entry_bounding_box"],
-            image_width, image_height,
-            pdf_width, pdf_height
-        )
-        
+        transformed_entry_box = transform_coordinates(field["entry_bounding_box"], *page_transforms[page_num])
+
         # Skip empty fields
         if "entry_text" not in field or "text" not in field["entry_text"]:
             continue
@@ -69,7 +67,7 @@ def fill_pdf_form(input_pdf_path, fields_json_path, output_pdf_path):
         text = entry_text["text"]
         if not text:
             continue
-        
+
         font_name = entry_text.get("font", "Arial")
         font_size = str(entry_text.get("font_size", 14)) + "pt"
         font_color = entry_text.get("font_color", "000000")
@@ -85,24 +83,69 @@ def fill_pdf_form(input_pdf_path, fields_json_path, output_pdf_path):
             border_color=None,
             background_color=None,
         )
-        annotations.append(annotation)
-        # page_number is 0-based for pypdf
-        writer.add_annotation(page_number=page_num - 1, annotation=annotation)
-        
+        annotations.append((page_num, annotation))
+    return annotations
+
+
+# Adds the annotations, updating each page's "/Annots" once. Objects are still
+# added in field order, so the file is the same as calling
+# `writer.add_annotation` for each annotation.
+def add_annotations(writer, annotations):
+    new_annotations_by_page = {}
+    for page_num, annotation in annotations:
+        if page_num not in new_annotations_by_page:
+            # page_number is 0-based for pypdf
+            new_annotations_by_page[page_num] = (writer.pages[page_num - 1], [])
+        page, refs = new_annotations_by_page[page_num]
+        annotation[NameObject("/P")] = page.indirect_reference
+        refs.append(writer._add_object(annotation))
+
+    for page, refs in new_annotations_by_page.values():
+        if page.annotations is None:
+            page[NameObject("/Annots")] = ArrayObject()
+        page.annotations.extend(refs)
+
+
+# Writes a copy of the already-parsed PDF with the annotations for `fields_data`.
+# Returns the number of annotations added.
+def fill_parsed_pdf_form(reader, fields_data, output_pdf_path):
+    annotations = make_annotations(fields_data, get_page_transforms(reader, fields_data))
+
+    # Copy all pages to writer
+    writer = PdfWriter()
+    writer.append(reader)
+    add_annotations(writer, annotations)
+
     # Save the filled PDF
     with open(output_pdf_path, "wb") as output:
         writer.write(output)
-    
-    print(f"Successfully filled PDF form and saved to {output_pdf_path}")
-    print(f"Added {len(annotations)} text annotations")
+    return len(annotations)
+
+
+def fill_pdf_form(input_pdf_path, fields_json_path, output_pdf_path):
+    """Fill the PDF form with data from fields.json"""
+    fill_pdf_forms(input_pdf_path, [(fields_json_path, output_pdf_path)])
+
+
+def fill_pdf_forms(input_pdf_path, fields_json_and_output_paths):
+    """Fill the PDF form once for each (fields.json, output PDF) pair, parsing the PDF only once"""
+    reader = PdfReader(input_pdf_path)
+    for fields_json_path, output_pdf_path in fields_json_and_output_paths:
+        # `fields.json` format described in forms.md.
+        with open(fields_json_path, "r") as f:
+            fields_data = json.load(f)
+        count = fill_parsed_pdf_form(reader, fields_data, output_pdf_path)
+
+        print(f"Successfully filled PDF form and saved to {output_pdf_path}")
+        print(f"Added {count} text annotations")
 
 
 if __name__ == "__main__":
-    if len(sys.argv) != 4:
-        print("Usage: fill_pdf_form_with_annotations.py [input pdf] [fields.json] [output pdf]")
+    # More [fields.json] [output pdf] pairs fill the same PDF several times
+    if len(sys.argv) < 4 or len(sys.argv) % 2 != 0:
+        print("Usage: fill_pdf_form_with_annotations.py [input pdf] [fields.json] [output pdf] [[fields.json] [output pdf] ...]")
         sys.exit(1)
     input_pdf = sys.argv[1]
-    fields_json = sys.argv[2]
-    output_pdf = sys.argv[3]
-    
-    fill_pdf_form(input_pdf, fields_json, output_pdf)
\ No newline at end of file
+    pairs = list(zip(sys.argv[2::2], sys.argv[3::2]))
+
+    fill_pdf_forms(input_pdf, pairs)
\ No newline at end of file
@@ -15,6 +15,11 @@ import defusedxml.minidom
 import zipfile
 from pathlib import Path
 
+try:
+    import soffice
+except ImportError:  # Imported as ooxml.scripts.pack
+    from . import soffice
+
 
 def main():
     parser = argparse.ArgumentParser(description="Pack a directory into an Office file")
@@ -88,7 +93,10 @@ def pack_document(input_dir, output_file, validate=False):
 
 
 def validate_document(doc_path):
-    """Validate document by converting to HTML with soffice."""
+    """Validate document by converting to HTML with soffice.
+
+    Uses the warm LibreOffice service when available (see soffice.py).
+    """
     # Determine the correct filter based on file extension
     match doc_path.suffix.lower():
         case ".docx":
@@ -100,6 +108,12 @@ def validate_document(doc_path):
 
     with tempfile.TemporaryDirectory() as temp_dir:
         try:
+            try:
+                soffice.convert(doc_path, temp_dir, filter_name, timeout=10)
+                return True
+            except soffice.ServiceUnavailable:
+                pass  # Fall back to a one-shot soffice process
+
             result = subprocess.run(
                 [
                     "soffice",
@@ -122,7 +136,7 @@ def validate_document(doc_path):
         except FileNotFoundError:
             print("Warning: soffice not found. Skipping validation.", file=sys.stderr)
             return True
-        except subprocess.TimeoutExpired:
+        except (subprocess.TimeoutExpired, TimeoutError):
             print("Validation error: Timeout during conversion", file=sys.stderr)
             return False
         except Exception as e:
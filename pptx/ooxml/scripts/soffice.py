@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+"""
+Warm LibreOffice conversion service shared by the Office tooling.
+
+Starting `soffice --headless` costs several seconds per call. This module keeps
+one headless LibreOffice instance listening on a local UNO socket and sends
+conversions to it, so only the first call pays the startup cost. The instance
+is detached from the calling process and is reused by later invocations until
+it is stopped.
+
+Requests are serialized through a lock file (LibreOffice handles one document
+load at a time reliably), each request has a timeout, and a crashed or hung
+instance is killed and restarted automatically. Each user gets their own
+instance: the state directory and default port depend on the user ID, and a
+recorded PID is only killed while it still belongs to that user's instance.
+
+The UNO bridge (`import uno`, shipped as python3-uno / LibreOffice's bundled
+Python) is optional. When it is missing, or the service cannot be started,
+ServiceUnavailable is raised and callers fall back to a one-shot soffice
+subprocess. Set SOFFICE_SERVICE=0 to always use the fallback.
+
+Usage:
+    python soffice.py start   # start the warm instance
+    python soffice.py status
+    python soffice.py stop
+"""
+
+import getpass
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import uno
+    from com.sun.star.beans import PropertyValue
+    from com.sun.star.io import IOException as UnoIOException
+    from com.sun.star.lang import IllegalArgumentException
+
+    # Raised for unreadable documents or bad filters, not for a dead instance
+    DOCUMENT_ERRORS = (UnoIOException, IllegalArgumentException)
+except ImportError:
+    uno = None
+    DOCUMENT_ERRORS = ()
+
+try:
+    import fcntl
+except ImportError:  # Windows: requests are serialized per process only
+    fcntl = None
+
+# Keeps users on a shared host from reusing (or killing) each other's instance
+USER_ID = os.getuid() if hasattr(os, "getuid") else None
+
+HOST = "127.0.0.1"
+PORT = int(os.environ.get("SOFFICE_SERVICE_PORT", 2002 + (USER_ID or 0) % 20000))
+STATE_DIR = Path(tempfile.gettempdir()) / f"soffice-service-{USER_ID if USER_ID is not None else getpass.getuser()}"
+START_TIMEOUT = 30  # Seconds to wait for a new instance to accept connections
+DEFAULT_TIMEOUT = 60  # Seconds allowed per conversion request
+
+# PDF export filter for each document type (--convert-to picks these implicitly)
+PDF_FILTERS = {
+    "com.sun.star.presentation.PresentationDocument": "impress_pdf_Export",
+    "com.sun.star.sheet.SpreadsheetDocument": "calc_pdf_Export",
+    "com.sun.star.text.TextDocument": "writer_pdf_Export",
+}
+
+
+class ServiceUnavailable(Exception):
+    """The warm instance cannot be used; callers should run soffice directly."""
+
+
+class ConversionError(RuntimeError):
+    """LibreOffice failed to process the document."""
+
+
+def _group_commands(pgid):
+    """Return the command lines of the processes in a process group.
+
+    Returns None if processes can't be inspected on this platform.
+    """
+    proc = Path("/proc")
+    if proc.is_dir():
+        commands = []
+        for entry in proc.iterdir():
+            if not entry.name.isdigit():
+                continue
+            try:
+                # Fields after the parenthesized command name: state, ppid, pgrp, ...
+                fields = (entry / "stat").read_text().rsplit(")", 1)[1].split()
+                if int(fields[2]) == pgid:
+                    cmdline = (entry / "cmdline").read_bytes()
+                    commands.append(cmdline.replace(b"\0", b" ").decode(errors="replace"))
+            except (OSError, ValueError, IndexError):
+                continue  # Exited while scanning, or not readable
+        return commands
+    try:
+        result = subprocess.run(
+            ["ps", "-A", "-o", "pgid=,command="], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    commands = []
+    for line in result.stdout.splitlines():
+        group, _, command = line.strip().partition(" ")
+        if group.isdigit() and int(group) == pgid:
+            commands.append(command)
+    return commands
+
+
+def _props(**kwargs):
+    """Build a tuple of UNO PropertyValues from keyword arguments."""
+    props = []
+    for name, value in kwargs.items():
+        prop = PropertyValue()
+        prop.Name = name
+        prop.Value = value
+        props.append(prop)
+    return tuple(props)
+
+
+class ConversionService:
+    """Client for a detached headless LibreOffice listening on a UNO socket."""
+
+    def __init__(self, host=HOST, port=PORT, state_dir=STATE_DIR):
+        self.host = host
+        self.port = port
+        self.state_dir = Path(state_dir)
+        self.pid_file = self.state_dir / f"soffice-{port}.pid"
+        self.lock_file = self.state_dir / f"soffice-{port}.lock"
+        self.profile_dir = self.state_dir / f"profile-{port}"
+        # Every process of our instance has this argument on its command line
+        self._marker = f"-env:UserInstallation={self.profile_dir.as_uri()}"
+        self._process = None
+        self._thread_lock = threading.Lock()
+        self._desktop = None
+
+    # Process management
+
+    def _read_pid(self):
+        try:
+            return int(self.pid_file.read_text().strip())
+        except (OSError, ValueError):
+            return None
+
+    def _is_ours(self, pid):
+        """Return True if pid's process group is still this service's soffice.
+
+        The instance is started in a new session, so the recorded PID is also
+        its process group ID. The launcher may have exited while soffice.bin
+        lives on in the group, and after a crash or reboot the PID may belong
+        to an unrelated process, so the group's command lines are checked.
+        """
+        commands = _group_commands(pid)
+        if commands is None:
+            # Can't inspect processes: only trust an instance started here
+            return (
+                self._process is not None
+                and self._process.pid == pid
+                and self._process.poll() is None
+            )
+        return any(self._marker in command for command in commands)
+
+    def is_running(self):
+        """Return True if the recorded soffice instance is alive."""
+        pid = self._read_pid()
+        return pid is not None and self._is_ours(pid)
+
+    def _port_open(self):
+        try:
+            with socket.create_connection((self.host, self.port), timeout=1):
+                return True
+        except OSError:
+            return False
+
+    def start(self):
+        """Start the warm instance if it is not already running."""
+        if uno is None:
+            raise ServiceUnavailable("UNO bridge not available (install python3-uno)")
+        if self.is_running() and self._port_open():
+            return
+
+        self.stop()
+        self.state_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        cmd = [
+            "soffice",
+            "--headless",
+            "--invisible",
+            "--nologo",
+            "--norestore",
+            "--nodefault",
+            f"-env:UserInstallation={self.profile_dir.as_uri()}",
+            f"--accept=socket,host={self.host},port={self.port};urp;StarOffice.ComponentContext",
+        ]
+        try:
+            process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,  # Outlive the calling process
+            )
+        except FileNotFoundError:
+            raise ServiceUnavailable("soffice not found")
+        self._process = process
+        self.pid_file.write_text(str(process.pid))
+
+        deadline = time.monotonic() + START_TIMEOUT
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise ServiceUnavailable("soffice exited during startup")
+            if self._port_open():
+                return
+            time.sleep(0.25)
+        self.stop()
+        raise ServiceUnavailable("soffice did not start listening in time")
+
+    def stop(self):
+        """Kill the warm instance, if any."""
+        self._desktop = None
+        pid = self._read_pid()
+        if pid is not None and self._is_ours(pid):
+            try:
+                if hasattr(os, "killpg"):
+                    # The launcher forks soffice.bin, which holds the port; kill both
+                    os.killpg(pid, signal.SIGKILL)
+                else:
+                    os.kill(pid, signal.SIGTERM)
+            except OSError:
+                pass
+        self._process = None
+        self.pid_file.unlink(missing_ok=True)
+
+    def restart(self):
+        self.stop()
+        self.start()
+
+    # Request handling
+
+    @contextmanager
+    def _queued(self):
+        """Serialize requests across threads and processes."""
+        self.state_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with self._thread_lock:
+            with open(self.lock_file, "w") as lock:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _get_desktop(self):
+        if self._desktop is None:
+            local = uno.getComponentContext()
+            resolver = local.ServiceManager.createInstanceWithContext(
+                "com.sun.star.bridge.UnoUrlResolver", local
+            )
+            ctx = resolver.resolve(
+                f"uno:socket,host={self.host},port={self.port};urp;StarOffice.ComponentContext"
+            )
+            self._desktop = ctx.ServiceManager.createInstanceWithContext(
+                "com.sun.star.frame.Desktop", ctx
+            )
+        return self._desktop
+
+    def _run_with_timeout(self, func, timeout):
+        """Run func() in a worker thread; kill the instance if it hangs."""
+        outcome = {}
+
+        def target():
+            try:
+                outcome["result"] = func()
+            except Exception as e:
+                outcome["error"] = e
+
+        worker = threading.Thread(target=target, daemon=True)
+        worker.start()
+        worker.join(timeout)
+        if worker.is_alive():
+            self.stop()  # Hung instance; the next request starts a fresh one
+            raise TimeoutError(f"LibreOffice did not respond within {timeout}s")
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome.get("result")
+
+    def _submit(self, func, timeout):
+        """Run a request against the instance, restarting once if it crashed."""
+        with self._queued():
+            for attempt in range(2):
+                self.start()
+                try:
+                    return self._run_with_timeout(
+                        lambda: func(self._get_desktop()), timeout
+                    )
+                except (TimeoutError, ConversionError):
+                    raise
+                except DOCUMENT_ERRORS as e:
+                    raise ConversionError(getattr(e, "Message", "") or str(e))
+                except Exception as e:
+                    # Bridge errors (DisposedException, connection reset, ...)
+                    # mean the connection or instance died; reconnect, restarting
+                    # the instance if needed, and retry once.
+                    self._desktop = None
+                    if attempt == 1:
+                        self.stop()
+                        raise ServiceUnavailable(f"LibreOffice instance failed: {e}")
+                    if not (self.is_running() and self._port_open()):
+                        self.stop()
+
+    def _load(self, desktop, input_path, **props):
+        url = uno.systemPathToFileUrl(str(Path(input_path).resolve()))
+        doc = desktop.loadComponentFromURL(url, "_blank", 0, _props(Hidden=True, **props))
+        if doc is None:
+            raise ConversionError(f"LibreOffice could not open {input_path}")
+        return doc
+
+    def convert(self, input_path, outdir, convert_to, timeout=DEFAULT_TIMEOUT):
+        """Convert a document, mirroring `soffice --convert-to <convert_to>`.
+
+        Args:
+            input_path: Document to convert
+            outdir: Directory for the output file
+            convert_to: Target as "ext" or "ext:FilterName" (e.g. "pdf",
+                "html:impress_html_Export")
+            timeout: Seconds allowed for the conversion
+
+        Returns:
+            Path of the converted file
+        """
+        input_path = Path(input_path)
+        ext, _, filter_name = convert_to.partition(":")
+        output_path = Path(outdir) / f"{input_path.stem}.{ext}"
+
+        def run(desktop):
+            doc = self._load(desktop, input_path, ReadOnly=True)
+            try:
+                name = filter_name
+                if not name and ext == "pdf":
+                    name = next(
+                        (f for svc, f in PDF_FILTERS.items() if doc.supportsService(svc)),
+                        "writer_pdf_Export",
+                    )
+                url = uno.systemPathToFileUrl(str(output_path.resolve()))
+                doc.storeToURL(url, _props(FilterName=name) if name else ())
+            finally:
+                doc.close(True)
+            if not output_path.exists():
+                raise ConversionError(f"LibreOffice produced no {ext} output")
+            return output_path
+
+        return self._submit(run, timeout)
+
+    def recalculate(self, input_path, timeout=DEFAULT_TIMEOUT):
+        """Recalculate all formulas in a spreadsheet and save it in place."""
+
+        def run(desktop):
+            doc = self._load(desktop, input_path)
+            try:
+                doc.calculateAll()
+                doc.store()
+            finally:
+                doc.close(True)
+
+        self._submit(run, timeout)
+
+
+_service = None
+
+
+def get_service():
+    """Return the process-wide ConversionService.
+
+    Raises ServiceUnavailable if the service is disabled or UNO is missing.
+    """
+    global _service
+    if os.environ.get("SOFFICE_SERVICE", "1") == "0":
+        raise ServiceUnavailable("disabled by SOFFICE_SERVICE=0")
+    if uno is None:
+        raise ServiceUnavailable("UNO bridge not available (install python3-uno)")
+    if _service is None:
+        _service = ConversionService()
+    return _service
+
+
+def convert(input_path, outdir, convert_to, timeout=DEFAULT_TIMEOUT):
+    """Convert a document with the warm instance. See ConversionService.convert."""
+    return get_service().convert(input_path, outdir, convert_to, timeout)
+
+
+def recalculate(input_path, timeout=DEFAULT_TIMEOUT):
+    """Recalculate a spreadsheet with the warm instance."""
+    get_service().recalculate(input_path, timeout)
+
+
+def main():
+    if len(sys.argv) != 2 or sys.argv[1] not in {"start", "stop", "status"}:
+        print(__doc__)
+        sys.exit(1)
+
+    service = ConversionService()
+    command = sys.argv[1]
+    try:
+        if command == "start":
+            service.start()
+            print(f"LibreOffice service listening on {service.host}:{service.port}")
+        elif command == "stop":
+            service.stop()
+            print("LibreOffice service stopped")
+        else:
+            running = service.is_running() and service._port_open()
+            print("running" if running else "stopped")
+    except ServiceUnavailable as e:
+        sys.exit(f"Error: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""
+Benchmark the pptx scripts on synthetic presentations.
+
+Generates decks with python-pptx (slide count, shapes per slide, group
+nesting, text volume and images are configurable), then times each stage of
+the toolchain and records its peak memory:
+
+- inventory: extract_text_inventory + save_inventory
+- replace: apply_replacements with one replacement per inventory shape
+- rearrange: rearrange_presentation with reordered and duplicated slides
+- thumbnail: convert_to_images + create_grids (needs LibreOffice and pdftoppm)
+
+Every stage run happens in a fresh process, so timings include no warm caches
+from earlier stages and peak memory is the stage's own high-water mark. Stages
+that need LibreOffice always start a one-shot soffice process, even if the warm
+conversion service (ooxml/scripts/soffice.py) is running, and don't use the
+thumbnail render cache. Stages that need LibreOffice are skipped when soffice
+is not installed; everything else runs offline.
+
+Results are written as JSON. Pass a previous result file with --baseline to
+compare: stages that got slower than the threshold are reported and the exit
+status is 1.
+
+Usage:
+    python benchmark.py results.json
+    python benchmark.py results.json --scenario large --repeat 5
+    python benchmark.py results.json --slides 500 --shapes 12 --group-depth 2
+    python benchmark.py new.json --baseline old.json --threshold 0.2
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows: peak memory is not recorded
+    resource = None
+
+from PIL import Image
+from pptx import Presentation
+from pptx.util import Inches, Pt
+
+# Deck parameters for the built-in scenarios
+SCENARIOS = {
+    "small": {"slides": 10, "shapes": 5, "group_depth": 0, "paragraphs": 2, "images": 0},
+    "medium": {"slides": 50, "shapes": 10, "group_depth": 1, "paragraphs": 3, "images": 1},
+    "large": {"slides": 200, "shapes": 20, "group_depth": 2, "paragraphs": 4, "images": 2},
+}
+DEFAULT_SCENARIOS = ["small", "medium"]
+STAGES = ["inventory", "replace", "rearrange", "thumbnail"]
+SOFFICE_STAGES = {"thumbnail"}
+
+WORDS = (
+    "quarterly revenue growth market strategy customer team product launch "
+    "roadmap pipeline margin forecast region segment platform insight target "
+    "delivery milestone review budget hiring partner retention engagement"
+).split()
+IMAGE_SIZE = (320, 240)
+
+
+def sentence(rng, words):
+    """Return a sentence of pseudo-random words."""
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def create_deck(path, slides, shapes, group_depth, paragraphs, images, seed=0):
+    """Create a synthetic presentation and save it to path.
+
+    Args:
+        path: Output .pptx path
+        slides: Number of slides
+        shapes: Text boxes per slide
+        group_depth: How many group shapes each text box is nested in
+        paragraphs: Paragraphs per text box
+        images: Pictures per slide, each with unique (incompressible) pixels
+        seed: Random seed, so the same parameters give the same deck
+    """
+    rng = random.Random(seed)
+    prs = Presentation()
+    blank = prs.slide_layouts[6]
+    cols = max(1, int(shapes**0.5))
+    rows = -(-shapes // cols)
+    box_width = Inches(9.0 / cols)
+    box_height = Inches(6.5 / rows)
+
+    for _ in range(slides):
+        slide = prs.slides.add_slide(blank)
+        for idx in range(shapes):
+            container = slide.shapes
+            for _ in range(group_depth):
+                container = container.add_group_shape().shapes
+            box = container.add_textbox(
+                Inches(0.5) + box_width * (idx % cols),
+                Inches(0.5) + box_height * (idx // cols),
+                box_width,
+                box_height,
+            )
+            text_frame = box.text_frame
+            text_frame.word_wrap = True
+            for para_idx in range(paragraphs):
+                paragraph = (
+                    text_frame.paragraphs[0] if para_idx == 0 else text_frame.add_paragraph()
+                )
+                paragraph.text = sentence(rng, rng.randint(6, 18))
+                paragraph.font.size = Pt(14)
+
+        for idx in range(images):
+            pixels = rng.randbytes(IMAGE_SIZE[0] * IMAGE_SIZE[1] * 3)
+            stream = io.BytesIO()
+            Image.frombytes("RGB", IMAGE_SIZE, pixels).save(stream, "PNG")
+            stream.seek(0)
+            slide.shapes.add_picture(
+                stream, Inches(6 + idx * 0.5), Inches(4 + idx * 0.5), width=Inches(3)
+            )
+
+    prs.save(path)
+
+
+def write_replacements(deck_path, json_path):
+    """Write a replacement JSON that rewrites every inventory shape."""
+    from inventory import get_inventory_as_dict
+
+    rng = random.Random(1)
+    replacements = {}
+    for slide_key, shapes in get_inventory_as_dict(deck_path).items():
+        replacements[slide_key] = {
+            shape_key: {
+                "paragraphs": [
+                    {"text": sentence(rng, rng.randint(4, 12)), "font_size": 12.0}
+                    for _ in shape["paragraphs"]
+                ]
+            }
+            for shape_key, shape in shapes.items()
+        }
+    Path(json_path).write_text(json.dumps(replacements))
+
+
+def rearrange_sequence(slide_count):
+    """Reverse the deck, duplicate the first slide and drop every fifth one."""
+    sequence = [idx for idx in reversed(range(slide_count)) if idx % 5 != 4]
+    return sequence + [sequence[0]]
+
+
+def reset_peak_rss():
+    """Reset this process's peak resident set size to its current size.
+
+    Only possible on Linux (/proc/self/clear_refs); elsewhere the peak
+    includes everything since the process started.
+    """
+    try:
+        Path("/proc/self/clear_refs").write_text("5")
+    except OSError:
+        pass
+
+
+def peak_rss_mb():
+    """Return this process's peak resident set size in MB, if available."""
+    # Linux: VmHWM belongs to the address space, so unlike ru_maxrss it
+    # doesn't carry over the parent's peak into a spawned (fork + exec) worker,
+    # and reset_peak_rss can reset it
+    try:
+        status = Path("/proc/self/status").read_text()
+    except OSError:
+        status = ""
+    for line in status.splitlines():
+        if line.startswith("VmHWM:"):
+            return round(int(line.split()[1]) / 1024, 1)
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def run_stage(stage, deck_path, work_dir):
+    """Run one stage in the current process and return its measurements.
+
+    Called in a fresh worker process for every run.
+    """
+    deck_path = Path(deck_path)
+    work_dir = Path(work_dir)
+    # Time the one-shot soffice path, whether or not a warm service is up
+    os.environ["SOFFICE_SERVICE"] = "0"
+
+    # Import before measuring so module loading isn't part of the stage
+    import inventory
+    import rearrange
+    import replace
+    import thumbnail
+
+    if stage == "rearrange":
+        sequence = rearrange_sequence(len(Presentation(str(deck_path)).slides))
+
+    reset_peak_rss()
+    rss_before = peak_rss_mb()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if stage == "inventory":
+            result = inventory.extract_text_inventory(deck_path)
+            inventory.save_inventory(result, work_dir / "inventory.json")
+        elif stage == "replace":
+            replace.apply_replacements(
+                str(deck_path),
+                str(work_dir / "replacements.json"),
+                str(work_dir / "replaced.pptx"),
+            )
+        elif stage == "rearrange":
+            rearrange.rearrange_presentation(
+                deck_path, work_dir / "rearranged.pptx", sequence
+            )
+        elif stage == "thumbnail":
+            with tempfile.TemporaryDirectory(dir=work_dir) as temp_dir:
+                images = thumbnail.convert_to_images(
+                    deck_path, Path(temp_dir), thumbnail.THUMBNAIL_WIDTH
+                )
+                thumbnail.create_grids(
+                    images,
+                    thumbnail.DEFAULT_COLS,
+                    thumbnail.THUMBNAIL_WIDTH,
+                    work_dir / "thumbnails.jpg",
+                )
+        else:
+            raise ValueError(f"Unknown stage: {stage}")
+    seconds = time.perf_counter() - start
+
+    return {"seconds": seconds, "rss_before_mb": rss_before, "peak_rss_mb": peak_rss_mb()}
+
+
+def measure_stage(stage, deck_path, work_dir, repeat):
+    """Run a stage `repeat` times, each in a new process, and summarize."""
+    runs = []
+    for _ in range(repeat):
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+            runs.append(pool.submit(run_stage, stage, str(deck_path), str(work_dir)).result())
+
+    times = [run["seconds"] for run in runs]
+    peaks = [run["peak_rss_mb"] for run in runs if run["peak_rss_mb"] is not None]
+    baselines = [run["rss_before_mb"] for run in runs if run["rss_before_mb"] is not None]
+    return {
+        "status": "ok",
+        "runs": len(runs),
+        "min_seconds": round(min(times), 4),
+        "median_seconds": round(statistics.median(times), 4),
+        "peak_rss_mb": max(peaks) if peaks else None,
+        # Memory added by the stage itself, on top of the interpreter and imports
+        "stage_rss_mb": round(max(peaks) - min(baselines), 1) if peaks else None,
+    }
+
+
+def run_scenario(name, params, stages, repeat, soffice_available):
+    """Generate a deck for one scenario and benchmark the selected stages."""
+    with tempfile.TemporaryDirectory(prefix=f"pptx-bench-{name}-") as temp:
+        work_dir = Path(temp)
+        deck_path = work_dir / "deck.pptx"
+
+        start = time.perf_counter()
+        create_deck(deck_path, **params)
+        result = {
+            "deck": params,
+            "deck_bytes": deck_path.stat().st_size,
+            "generate_seconds": round(time.perf_counter() - start, 4),
+            "stages": {},
+        }
+        if "replace" in stages:
+            write_replacements(deck_path, work_dir / "replacements.json")
+
+        for stage in stages:
+            if stage in SOFFICE_STAGES and not soffice_available:
+                result["stages"][stage] = {
+                    "status": "skipped",
+                    "reason": "LibreOffice (soffice) or pdftoppm not found",
+                }
+                print(f"  {stage:<10} skipped (LibreOffice not available)")
+                continue
+
+            try:
+                stats = measure_stage(stage, deck_path, work_dir, repeat)
+            except Exception as e:
+                stats = {"status": "error", "error": str(e)}
+                print(f"  {stage:<10} error: {e}")
+            else:
+                peak = stats["peak_rss_mb"]
+                memory = f", peak {peak} MB" if peak is not None else ""
+                print(f"  {stage:<10} {stats['median_seconds']:.3f}s median{memory}")
+            result["stages"][stage] = stats
+        return result
+
+
+def compare_results(results, baseline, threshold):
+    """Return descriptions of stages that regressed against the baseline.
+
+    A stage regresses when its median time (or peak memory) grew by more than
+    `threshold` (a fraction) for the same scenario and deck parameters.
+    """
+    regressions = []
+    for name, current in results["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if previous is None or previous.get("deck") != current["deck"]:
+            continue
+        for stage, stats in current["stages"].items():
+            old = previous["stages"].get(stage, {})
+            if stats.get("status") != "ok" or old.get("status") != "ok":
+                continue
+            for metric in ("median_seconds", "peak_rss_mb"):
+                new_value, old_value = stats.get(metric), old.get(metric)
+                if new_value is None or not old_value:
+                    continue
+                change = (new_value - old_value) / old_value
+                if change > threshold:
+                    regressions.append(
+                        f"{name}/{stage}: {metric} {old_value} -> {new_value} "
+                        f"(+{change:.0%})"
+                    )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the pptx scripts on synthetic presentations.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"""
+Scenarios:
+{chr(10).join(f"  {name:<8} {params}" for name, params in SCENARIOS.items())}
+
+Deck options (--slides, --shapes, ...) define a "custom" scenario instead.
+        """,
+    )
+    parser.add_argument("output", help="Output JSON file for results")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help=f"Built-in scenario to run; repeatable (default: {', '.join(DEFAULT_SCENARIOS)})",
+    )
+    parser.add_argument("--slides", type=int, help="Slides in a custom deck")
+    parser.add_argument("--shapes", type=int, help="Text boxes per slide")
+    parser.add_argument("--group-depth", type=int, help="Group nesting of text boxes")
+    parser.add_argument("--paragraphs", type=int, help="Paragraphs per text box")
+    parser.add_argument("--images", type=int, help="Pictures per slide")
+    parser.add_argument(
+        "--stages",
+        default=",".join(STAGES),
+        help=f"Comma-separated stages to run (default: {','.join(STAGES)})",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per stage (default: 3)"
+    )
+    parser.add_argument("--baseline", help="Previous results JSON to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown or memory growth vs. baseline, as a fraction (default: 0.25)",
+    )
+    args = parser.parse_args()
+
+    stages = [stage.strip() for stage in args.stages.split(",") if stage.strip()]
+    unknown = [stage for stage in stages if stage not in STAGES]
+    if unknown:
+        print(f"Error: Unknown stage(s): {', '.join(unknown)}")
+        sys.exit(1)
+    if args.repeat < 1:
+        print("Error: --repeat must be at least 1")
+        sys.exit(1)
+
+    custom = {
+        key: getattr(args, key)
+        for key in ("slides", "shapes", "group_depth", "paragraphs", "images")
+        if getattr(args, key) is not None
+    }
+    scenarios = {name: SCENARIOS[name] for name in args.scenario or []}
+    if custom:
+        # Unspecified options fall back to the medium scenario
+        scenarios["custom"] = {**SCENARIOS["medium"], **custom}
+    if not scenarios:
+        scenarios = {name: SCENARIOS[name] for name in DEFAULT_SCENARIOS}
+
+    soffice_available = bool(shutil.which("soffice") and shutil.which("pdftoppm"))
+    results = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "soffice": soffice_available,
+        "repeat": args.repeat,
+        "scenarios": {},
+    }
+
+    for name, params in scenarios.items():
+        print(f"Scenario {name}: {params}")
+        results["scenarios"][name] = run_scenario(
+            name, params, stages, args.repeat, soffice_available
+        )
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(results, indent=2))
+    print(f"Results saved to: {output_path}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare_results(results, baseline, args.threshold)
+        if regressions:
+            print(f"Regressions against {args.baseline}:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            sys.exit(1)
+        print(f"No regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
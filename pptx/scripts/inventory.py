@@ -16,22 +16,26 @@ Classes:
 
 Main Functions:
     extract_text_inventory: Extract all text from a presentation
-    save_inventory: Save extracted data to JSON
+    iter_text_inventory: Extract text one slide at a time (for large decks)
+    save_inventory: Save extracted data to JSON or JSON lines
 
 Usage:
     python inventory.py input.pptx output.json
+    python inventory.py input.pptx output.jsonl
 """
 
 import argparse
+import copy
 import json
 import platform
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from PIL import Image, ImageDraw, ImageFont
 from pptx import Presentation
+from pptx.enum.dml import MSO_FILL
 from pptx.enum.text import PP_ALIGN
 from pptx.shapes.base import BaseShape
 
@@ -60,6 +64,9 @@ Examples:
   python inventory.py presentation.pptx inventory.json --issues-only
     Extracts only text shapes that have overflow or overlap issues
 
+  python inventory.py presentation.pptx inventory.jsonl
+    Writes JSON lines, one {"slide-N": {...}} object per slide
+
 The output JSON includes:
   - All text content organized by slide and shape
   - Correct absolute positions for shapes in groups
@@ -94,17 +101,28 @@ The output JSON includes:
             print(
                 "Filtering to include only text shapes with issues (overflow/overlap)"
             )
-        inventory = extract_text_inventory(input_path, issues_only=args.issues_only)
-
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        save_inventory(inventory, output_path)
+
+        # Stream slides straight to the output, counting as they go
+        total_slides = 0
+        total_shapes = 0
+
+        def counted(slides):
+            nonlocal total_slides, total_shapes
+            for slide_key, shapes in slides:
+                total_slides += 1
+                total_shapes += len(shapes)
+                yield slide_key, shapes
+
+        save_inventory(
+            counted(iter_inventory_dicts(input_path, issues_only=args.issues_only)),
+            output_path,
+        )
 
         print(f"Output saved to: {args.output}")
 
         # Report statistics
-        total_slides = len(inventory)
-        total_shapes = sum(len(shapes) for shapes in inventory.values())
         if args.issues_only:
             if total_shapes > 0:
                 print(
@@ -206,18 +224,22 @@ class ParagraphData:
                 if font.underline is not None:
                     self.underline = font.underline
 
-                # Handle color - both RGB and theme colors
-                try:
-                    # Try RGB color first
-                    if font.color.rgb:
-                        self.color = str(font.color.rgb)
-                except (AttributeError, TypeError):
-                    # Fall back to theme color
+                # Handle color - both RGB and theme colors. Read through
+                # font.fill rather than font.color: the latter converts the
+                # run to a solid fill, inserting an empty <a:solidFill/>.
+                if font.fill.type == MSO_FILL.SOLID:
+                    color = font.fill.fore_color
                     try:
-                        if font.color.theme_color:
-                            self.theme_color = font.color.theme_color.name
+                        # Try RGB color first
+                        if color.rgb:
+                            self.color = str(color.rgb)
                     except (AttributeError, TypeError):
-                        pass
+                        # Fall back to theme color
+                        try:
+                            if color.theme_color:
+                                self.theme_color = color.theme_color.name
+                        except (AttributeError, TypeError):
+                            pass
 
         # Add line spacing if set
         if hasattr(paragraph, "line_spacing") and paragraph.line_spacing is not None:
@@ -678,6 +700,29 @@ class ShapeData:
                 )
                 break
 
+    def bind_to(self, shape: BaseShape) -> "ShapeData":
+        """Return a copy of this ShapeData referring to another shape.
+
+        The other shape must have identical XML (e.g. the same shape in a copy
+        of the presentation), so all measurements are carried over as-is.
+        """
+        bound = copy.copy(self)
+        bound.shape = shape
+        bound.overlapping_shapes = dict(self.overlapping_shapes)
+        bound.warnings = list(self.warnings)
+        return bound
+
+    def refresh_text_metrics(self) -> None:
+        """Re-measure text-dependent properties after the shape's text changed.
+
+        Position, size and overlap data do not depend on the text, so only
+        frame overflow and bullet warnings are recomputed.
+        """
+        self.frame_overflow_bottom = None
+        self.warnings = []
+        self._estimate_frame_overflow()
+        self._detect_bullet_issues()
+
     @property
     def has_any_issues(self) -> bool:
         """Check if shape has any issues (overflow, overlap, or warnings)."""
@@ -911,24 +956,33 @@ def detect_overlaps(shapes: List[ShapeData]) -> None:
                 shape2.overlapping_shapes[shape1.shape_id] = overlap_area
 
 
-def extract_text_inventory(
+def release_slide(slide: Any) -> None:
+    """Drop python-pptx's cached proxy objects for a slide.
+
+    The slide part caches its Slide object (and the Slide its shape
+    collections) for the life of the presentation. Dropping the cache lets
+    the proxies, and anything hanging off them, be garbage-collected once the
+    caller no longer refers to them; the slide XML itself stays in the package.
+    """
+    slide.part.__dict__.pop("slide", None)
+
+
+def iter_text_inventory(
     pptx_path: Path, prs: Optional[Any] = None, issues_only: bool = False
-) -> InventoryData:
-    """Extract text content from all slides in a PowerPoint presentation.
+) -> Iterator[Tuple[str, Dict[str, ShapeData]]]:
+    """Extract text content slide by slide.
+
+    Yields (slide-N, {shape-N: ShapeData}) pairs in slide order, skipping
+    slides without text shapes. Only one slide's shapes are alive at a time
+    unless the caller keeps them, so memory stays flat on very large decks.
 
     Args:
         pptx_path: Path to the PowerPoint file
         prs: Optional Presentation object to use. If not provided, will load from pptx_path.
         issues_only: If True, only include shapes that have overflow or overlap issues
-
-    Returns a nested dictionary: {slide-N: {shape-N: ShapeData}}
-    Shapes are sorted by visual position (top-to-bottom, left-to-right).
-    The ShapeData objects contain the full shape information and can be
-    converted to dictionaries for JSON serialization using to_dict().
     """
     if prs is None:
         prs = Presentation(str(pptx_path))
-    inventory: InventoryData = {}
 
     for slide_idx, slide in enumerate(prs.slides):
         # Collect all valid shapes from this slide with absolute positions
@@ -937,6 +991,7 @@ def extract_text_inventory(
             shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
 
         if not shapes_with_positions:
+            release_slide(slide)
             continue
 
         # Convert to ShapeData with absolute positions and slide reference
@@ -949,6 +1004,7 @@ def extract_text_inventory(
             )
             for swp in shapes_with_positions
         ]
+        del shapes_with_positions
 
         # Sort by visual position and assign stable IDs in one step
         sorted_shapes = sort_shapes_by_position(shape_data_list)
@@ -963,21 +1019,56 @@ def extract_text_inventory(
         if issues_only:
             sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
 
+        release_slide(slide)
         if not sorted_shapes:
             continue
 
         # Create slide inventory using the stable shape IDs
-        inventory[f"slide-{slide_idx}"] = {
+        yield f"slide-{slide_idx}", {
             shape_data.shape_id: shape_data for shape_data in sorted_shapes
         }
+        del shape_data_list, sorted_shapes
 
-    return inventory
+
+def iter_inventory_dicts(
+    pptx_path: Path, prs: Optional[Any] = None, issues_only: bool = False
+) -> Iterator[Tuple[str, Dict[str, ShapeDict]]]:
+    """Like iter_text_inventory, but yield JSON-serializable dictionaries.
+
+    The ShapeData objects (and their shape references) are dropped as soon as
+    each slide is converted.
+    """
+    for slide_key, shapes in iter_text_inventory(pptx_path, prs, issues_only):
+        yield slide_key, {
+            shape_key: shape_data.to_dict() for shape_key, shape_data in shapes.items()
+        }
+
+
+def extract_text_inventory(
+    pptx_path: Path, prs: Optional[Any] = None, issues_only: bool = False
+) -> InventoryData:
+    """Extract text content from all slides in a PowerPoint presentation.
+
+    Args:
+        pptx_path: Path to the PowerPoint file
+        prs: Optional Presentation object to use. If not provided, will load from pptx_path.
+        issues_only: If True, only include shapes that have overflow or overlap issues
+
+    Returns a nested dictionary: {slide-N: {shape-N: ShapeData}}
+    Shapes are sorted by visual position (top-to-bottom, left-to-right).
+    The ShapeData objects contain the full shape information and can be
+    converted to dictionaries for JSON serialization using to_dict().
+
+    This keeps every slide's shapes in memory; use iter_text_inventory to
+    process large presentations one slide at a time.
+    """
+    return dict(iter_text_inventory(pptx_path, prs, issues_only))
 
 
 def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> InventoryDict:
     """Extract text inventory and return as JSON-serializable dictionaries.
 
-    This is a convenience wrapper around extract_text_inventory that returns
+    This is a convenience wrapper around iter_inventory_dicts that returns
     dictionaries instead of ShapeData objects, useful for testing and direct
     JSON serialization.
 
@@ -988,32 +1079,58 @@ def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> Invento
     Returns:
         Nested dictionary with all data serialized for JSON
     """
-    inventory = extract_text_inventory(pptx_path, issues_only=issues_only)
-
-    # Convert ShapeData objects to dictionaries
-    dict_inventory: InventoryDict = {}
-    for slide_key, shapes in inventory.items():
-        dict_inventory[slide_key] = {
-            shape_key: shape_data.to_dict() for shape_key, shape_data in shapes.items()
-        }
-
-    return dict_inventory
+    return dict(iter_inventory_dicts(pptx_path, issues_only=issues_only))
 
 
-def save_inventory(inventory: InventoryData, output_path: Path) -> None:
+def save_inventory(
+    inventory: Union[InventoryData, Iterable[Tuple[str, Dict[str, Any]]]],
+    output_path: Path,
+    json_lines: Optional[bool] = None,
+) -> None:
     """Save inventory to JSON file with proper formatting.
 
-    Converts ShapeData objects to dictionaries for JSON serialization.
+    Accepts either a full inventory dict or an iterable of (slide_key, shapes)
+    pairs such as iter_text_inventory() returns; slides are serialized and
+    written one at a time either way. Shapes may be ShapeData objects or
+    dictionaries from to_dict().
+
+    Args:
+        inventory: Inventory dict or iterable of (slide_key, shapes) pairs
+        output_path: Output file path
+        json_lines: Write JSON lines, one {"slide-N": {...}} object per slide.
+            Defaults to True for a .jsonl output path. Otherwise the output is
+            the same indented JSON object as for a fully built inventory.
     """
-    # Convert ShapeData objects to dictionaries
-    json_inventory: InventoryDict = {}
-    for slide_key, shapes in inventory.items():
-        json_inventory[slide_key] = {
-            shape_key: shape_data.to_dict() for shape_key, shape_data in shapes.items()
-        }
+    if json_lines is None:
+        json_lines = Path(output_path).suffix.lower() == ".jsonl"
+    slides = inventory.items() if isinstance(inventory, dict) else inventory
 
+    written = 0
     with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(json_inventory, f, indent=2, ensure_ascii=False)
+        if not json_lines:
+            f.write("{")
+        for slide_key, shapes in slides:
+            # Convert ShapeData objects to dictionaries
+            shape_dicts = {
+                shape_key: (
+                    shape_data.to_dict()
+                    if isinstance(shape_data, ShapeData)
+                    else shape_data
+                )
+                for shape_key, shape_data in shapes.items()
+            }
+            if json_lines:
+                f.write(json.dumps({slide_key: shape_dicts}, ensure_ascii=False))
+                f.write("\n")
+            else:
+                # Nest the slide at depth 1, matching json.dump(..., indent=2)
+                body = json.dumps(shape_dicts, indent=2, ensure_ascii=False)
+                f.write("," if written else "")
+                f.write(f"\n  {json.dumps(slide_key, ensure_ascii=False)}: ")
+                f.write(body.replace("\n", "\n  "))
+            written += 1
+        if not json_lines:
+            f.write("\n}" if written else "}")
 
 
 if __name__ == "__main__":
@@ -4,22 +4,78 @@ Rearrange PowerPoint slides based on a sequence of indices.
 
 Usage:
     python rearrange.py template.pptx output.pptx 0,34,34,50,52
+    python rearrange.py --assemble output.pptx a.pptx:0 b.pptx:3 a.pptx:5
 
 This will create output.pptx using slides from template.pptx in the specified order.
 Slides can be repeated (e.g., 34 appears twice).
+
+With --assemble, slides are taken from several presentations. Masters, layouts
+and themes that are identical across sources are stored once in the output.
 """
 
 import argparse
+import hashlib
+import io
+import re
 import shutil
 import sys
+from collections import Counter
 from copy import deepcopy
 from pathlib import Path
 
-import six
+from lxml import etree
 from pptx import Presentation
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import PartFactory, XmlPart
+from pptx.opc.packuri import PackURI
+from pptx.oxml.ns import qn
+from pptx.parts.image import ImagePart
+
+R_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+DSP_NS = "{http://schemas.microsoft.com/office/drawing/2008/diagram}"
+
+# Not in python-pptx's RELATIONSHIP_TYPE
+RT_DIAGRAM_DRAWING = "http://schemas.microsoft.com/office/2007/relationships/diagramDrawing"
+
+# Deck-level XML parts that duplicated slides keep pointing at
+SHARED_RELTYPES = {
+    RT.SLIDE_LAYOUT,
+    RT.SLIDE_MASTER,
+    RT.NOTES_MASTER,
+    RT.HANDOUT_MASTER,
+    RT.THEME,
+    RT.SLIDE,
+}
+
+# Parts that --assemble imports once per source deck; other parts reached
+# from a slide are imported once per slide
+DECK_LEVEL_CONTENT_TYPES = {
+    CT.PML_SLIDE_MASTER,
+    CT.PML_SLIDE_LAYOUT,
+    CT.PML_NOTES_MASTER,
+    CT.PML_HANDOUT_MASTER,
+    CT.OFC_THEME,
+}
+
+# Embedded documents and SmartArt are editable per slide, so they are copied,
+# not shared. python-pptx loads SmartArt parts as plain (non-XML) parts.
+COPIED_RELTYPES = {
+    RT.PACKAGE,
+    RT.OLE_OBJECT,
+    RT.DIAGRAM_DATA,
+    RT.DIAGRAM_LAYOUT,
+    RT.DIAGRAM_QUICK_STYLE,
+    RT.DIAGRAM_COLORS,
+    RT_DIAGRAM_DRAWING,
+}
 
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--assemble":
+        main_assemble(sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(
         description="Rearrange PowerPoint slides based on a sequence of indices.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -31,6 +87,10 @@ Examples:
   python rearrange.py template.pptx output.pptx 5,3,1,2,4
     Creates output.pptx with slides reordered as specified
 
+  python rearrange.py --assemble output.pptx a.pptx:0 b.pptx:3 a.pptx:5
+    Creates output.pptx from slides of several presentations; identical
+    masters, layouts and themes are stored once
+
 Note: Slide indices are 0-based (first slide is 0, second is 1, etc.)
         """,
     )
@@ -72,84 +132,398 @@ Note: Slide indices are 0-based (first slide is 0, second is 1, etc.)
         sys.exit(1)
 
 
+def remap_relationship_ids(element, rid_map):
+    """Rewrite every r:* relationship reference under element in one pass."""
+    for el in element.iter(etree.Element):
+        for key, value in el.attrib.items():
+            if key.startswith(R_NS) and value in rid_map:
+                el.set(key, rid_map[value])
+
+
+def edit_blob_xml(part, edit):
+    """Apply edit(element) to the XML of a part python-pptx loaded as a blob."""
+    element = etree.fromstring(part.blob)
+    edit(element)
+    part._blob = etree.tostring(
+        element, xml_declaration=True, encoding="UTF-8", standalone=True
+    )
+
+
+def remap_part_relationship_ids(part, rid_map):
+    """Rewrite a part's r:* relationship references, whether or not it is an XmlPart."""
+    if isinstance(part, XmlPart):
+        remap_relationship_ids(part._element, rid_map)
+    elif part.content_type.endswith("xml") and any(
+        old != new for old, new in rid_map.items()
+    ):
+        edit_blob_xml(part, lambda element: remap_relationship_ids(element, rid_map))
+
+
+def remap_diagram_drawing_ids(parts, slide_rid_map):
+    """Point copied SmartArt data parts at their slide's new drawing rIds.
+
+    A diagram data part names its drawing by the rId the drawing has on the
+    slide (dsp:dataModelExt relId), not by a relationship of its own.
+    """
+
+    def remap(element):
+        for ext in element.iter(DSP_NS + "dataModelExt"):
+            if ext.get("relId") in slide_rid_map:
+                ext.set("relId", slide_rid_map[ext.get("relId")])
+
+    for part in parts:
+        if part.content_type == CT.DML_DIAGRAM_DATA:
+            edit_blob_xml(part, remap)
+
+
+def next_partname_like(package, partname):
+    """Return an unused partname in the same family, e.g. chart7.xml for chart2.xml."""
+    template = re.sub(r"\d*(\.\w+)$", r"%d\1", str(partname))
+    return package.next_partname(template)
+
+
+def clone_part(part, package, cloned):
+    """Copy a part (and what it depends on) under a new partname.
+
+    cloned maps source partnames to their copies so a part referenced more
+    than once is only copied once.
+    """
+    key = str(part.partname)
+    if key not in cloned:
+        clone = PartFactory(
+            partname=next_partname_like(package, part.partname),
+            content_type=part.content_type,
+            package=package,
+            blob=part.blob,
+        )
+        cloned[key] = clone
+        rid_map = copy_relationships(part, clone, package, cloned)
+        remap_part_relationship_ids(clone, rid_map)
+    return cloned[key]
+
+
+def copy_relationships(source_part, target_part, package, cloned, skip=()):
+    """Recreate source_part's relationships on target_part.
+
+    Images, media and deck-level parts are shared. Slide-specific XML parts
+    (charts, comments, ...), SmartArt and editable embedded documents are
+    cloned.
+
+    Returns a dict mapping source rIds to the new rIds.
+    """
+    rid_map = {}
+    for rId, rel in source_part.rels.items():
+        if rel.reltype in skip:
+            continue
+        if rel.is_external:
+            new_rId = target_part.relate_to(rel.target_ref, rel.reltype, is_external=True)
+        else:
+            target = rel.target_part
+            if rel.reltype in COPIED_RELTYPES or (
+                isinstance(target, XmlPart) and rel.reltype not in SHARED_RELTYPES
+            ):
+                target = clone_part(target, package, cloned)
+            new_rId = target_part.relate_to(target, rel.reltype)
+        rid_map[rId] = new_rId
+    return rid_map
+
+
+def replace_children(target, source):
+    """Move source's attributes and children into target, emptying target first."""
+    target.attrib.clear()
+    for key, value in source.attrib.items():
+        target.set(key, value)
+    for child in list(target):
+        target.remove(child)
+    target.extend(list(source))
+
+
+def copy_slide_xml(source_part, new_part):
+    """Clone the source slide's XML into a freshly added slide.
+
+    The new slide's own spTree element is kept (its shapes proxy already
+    refers to it) but the layout placeholders add_slide created are replaced.
+    rIds still refer to the source slide's relationships afterwards.
+    """
+    clone = deepcopy(source_part._element)
+    new_spTree = new_part._element.cSld.spTree
+    clone_spTree = clone.cSld.spTree
+    replace_children(new_spTree, clone_spTree)
+    clone.cSld.replace(clone_spTree, new_spTree)
+    replace_children(new_part._element, clone)
+
+
+def layout_rId(slide_part):
+    """Return the rId of a slide part's slide layout relationship."""
+    return next(
+        rId for rId, rel in slide_part.rels.items() if rel.reltype == RT.SLIDE_LAYOUT
+    )
+
+
+def copy_notes(source_slide, new_slide):
+    """Copy speaker notes, if any, from one slide to another."""
+    if source_slide.has_notes_slide:
+        source_tree = source_slide.notes_slide.shapes._spTree
+        new_tree = new_slide.notes_slide.shapes._spTree
+        replace_children(new_tree, deepcopy(source_tree))
+
+
 def duplicate_slide(pres, index):
-    """Duplicate a slide in the presentation."""
+    """Duplicate a slide in the presentation.
+
+    The slide XML is cloned once and every relationship reference in it
+    (images, media, charts, OLE objects, hyperlinks, ...) is rewritten in a
+    single pass. Images and media are shared with the source slide instead of
+    being copied, so repeating a slide doesn't grow the package. Charts,
+    SmartArt and embedded documents are cloned so each copy stays editable on
+    its own. Speaker notes are copied.
+    """
     source = pres.slides[index]
+    source_part = source.part
 
     # Use source's layout to preserve formatting
     new_slide = pres.slides.add_slide(source.slide_layout)
+    new_part = new_slide.part
+    copy_slide_xml(source_part, new_part)
+
+    # Recreate relationships and rewrite all rIds in one pass
+    cloned = {}
+    rid_map = copy_relationships(
+        source_part,
+        new_part,
+        pres.part.package,
+        cloned,
+        skip={RT.SLIDE_LAYOUT, RT.NOTES_SLIDE},
+    )
+    for rId, rel in source_part.rels.items():
+        if rel.reltype == RT.SLIDE_LAYOUT:
+            rid_map[rId] = layout_rId(new_part)
+    remap_relationship_ids(new_part._element, rid_map)
+    remap_diagram_drawing_ids(cloned.values(), rid_map)
 
-    # Collect all image and media relationships from the source slide
-    image_rels = {}
-    for rel_id, rel in six.iteritems(source.part.rels):
-        if "image" in rel.reltype or "media" in rel.reltype:
-            image_rels[rel_id] = rel
-
-    # CRITICAL: Clear placeholder shapes to avoid duplicates
-    for shape in new_slide.shapes:
-        sp = shape.element
-        sp.getparent().remove(sp)
-
-    # Copy all shapes from source
-    for shape in source.shapes:
-        el = shape.element
-        new_el = deepcopy(el)
-        new_slide.shapes._spTree.insert_element_before(new_el, "p:extLst")
-
-        # Handle picture shapes - need to update the blip reference
-        # Look for all blip elements (they can be in pic or other contexts)
-        # Using the element's own xpath method without namespaces argument
-        blips = new_el.xpath(".//a:blip[@r:embed]")
-        for blip in blips:
-            old_rId = blip.get(
-                "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed"
-            )
-            if old_rId in image_rels:
-                # Create a new relationship in the destination slide for this image
-                old_rel = image_rels[old_rId]
-                # get_or_add returns the rId directly, or adds and returns new rId
-                new_rId = new_slide.part.rels.get_or_add(
-                    old_rel.reltype, old_rel._target
-                )
-                # Update the blip's embed reference to use the new relationship ID
-                blip.set(
-                    "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed",
-                    new_rId,
-                )
+    copy_notes(source, new_slide)
+    return new_slide
 
-    # Copy any additional image/media relationships that might be referenced elsewhere
-    for rel_id, rel in image_rels.items():
-        try:
-            new_slide.part.rels.get_or_add(rel.reltype, rel._target)
-        except Exception:
-            pass  # Relationship might already exist
 
-    return new_slide
+def is_deck_level_part(part):
+    """Whether a part can be shared by all slides imported from one source."""
+    return (
+        isinstance(part, ImagePart)
+        or part.partname.startswith("/ppt/media/")
+        or part.content_type in DECK_LEVEL_CONTENT_TYPES
+    )
 
 
-def delete_slide(pres, index):
-    """Delete a slide from the presentation."""
-    rId = pres.slides._sldIdLst[index].rId
-    pres.part.drop_rel(rId)
-    del pres.slides._sldIdLst[index]
+def content_digest(part, memo):
+    """Hash a part's content together with the parts it depends on.
 
+    Links back up the hierarchy (layout -> master) and to other slides are not
+    followed, so a master's digest covers its theme, layouts and images, and
+    identical masters from different files get the same digest.
+    """
+    if part not in memo:
+        digest = hashlib.sha256(part.blob)
+        for rId, rel in sorted(part.rels.items()):
+            if rel.is_external:
+                digest.update(rel.target_ref.encode())
+            elif rel.reltype not in {RT.SLIDE_MASTER, RT.SLIDE}:
+                digest.update(content_digest(rel.target_part, memo).encode())
+        memo[part] = digest.hexdigest()
+    return memo[part]
+
+
+class DeckAssembler:
+    """Copy slides from other presentations into one output presentation.
+
+    Masters (with their layouts and theme) are imported only if no master with
+    the same content digest is already in the output, and themes, images and
+    media are deduplicated by content hash, so merging many decks built from
+    the same template keeps a single copy of it.
+
+    Sources are imported one at a time: call end_source() after the last slide
+    of a source so its parts can be released.
+    """
 
-def reorder_slides(pres, slide_index, target_index):
-    """Move a slide from one position to another."""
-    slides = pres.slides._sldIdLst
+    def __init__(self, prs):
+        self.prs = prs
+        self.package = prs.part.package
+        self.partnames = {str(part.partname) for part in self.package.iter_parts()}
+        self.output_digests = {}
+        self.layouts = {}  # (master digest, layout digest) -> output SlideLayout
+        self.themes = {}  # blob digest -> output theme part
+        self.binaries = {}  # blob digest -> output part, for non-image media
+        self._start_source()
+
+        for master in prs.slide_masters:
+            self._index_layouts(master, master, self.output_digests)
+
+    def _start_source(self):
+        self.imported = {}  # source part -> output part
+        self.source_digests = {}
+
+    def end_source(self):
+        """Forget the current source's parts so it can be garbage-collected."""
+        self._start_source()
+
+    def _index_layouts(self, master, source_master, digests):
+        master_digest = content_digest(source_master.part, digests)
+        for layout, source_layout in zip(
+            master.slide_layouts, source_master.slide_layouts
+        ):
+            key = (master_digest, content_digest(source_layout.part, digests))
+            self.layouts.setdefault(key, layout)
+
+    def _next_partname(self, partname):
+        template = re.sub(r"\d*(\.\w+)$", r"%d\1", str(partname))
+        i = 1
+        while template % i in self.partnames:
+            i += 1
+        self.partnames.add(template % i)
+        return PackURI(template % i)
+
+    def import_part(self, part, slide_parts=None):
+        """Copy a part from the current source into the output, deduplicating.
+
+        Masters, layouts, themes, images and media are imported once per
+        source. Parts of a slide (charts, SmartArt, embedded documents, ...)
+        are cached in slide_parts, which add_slide starts afresh for every
+        slide, so each copy of a slide gets its own.
+        """
+        shared = slide_parts is None or is_deck_level_part(part)
+        imported = self.imported if shared else slide_parts
+        if part in imported:
+            return imported[part]
+
+        if isinstance(part, ImagePart):
+            # python-pptx dedups images by SHA1
+            clone = self.package.get_or_add_image_part(io.BytesIO(part.blob))
+            imported[part] = clone
+            return clone
+
+        # Themes and media are shared by content; everything else (masters,
+        # layouts, charts, embedded documents) gets its own copy
+        pool = None
+        if part.content_type == CT.OFC_THEME:
+            pool = self.themes
+        elif part.partname.startswith("/ppt/media/"):
+            pool = self.binaries
+        if pool is not None:
+            digest = hashlib.sha256(part.blob).hexdigest()
+            if digest in pool:
+                imported[part] = pool[digest]
+                return pool[digest]
+
+        clone = PartFactory(
+            partname=self._next_partname(part.partname),
+            content_type=part.content_type,
+            package=self.package,
+            blob=part.blob,
+        )
+        imported[part] = clone
+        if pool is not None:
+            pool[digest] = clone
+
+        rid_map = {}
+        for rId, rel in part.rels.items():
+            if rel.is_external:
+                rid_map[rId] = clone.relate_to(
+                    rel.target_ref, rel.reltype, is_external=True
+                )
+            elif rel.reltype not in {RT.SLIDE, RT.NOTES_SLIDE}:
+                rid_map[rId] = clone.relate_to(
+                    self.import_part(rel.target_part, None if shared else slide_parts),
+                    rel.reltype,
+                )
+        remap_part_relationship_ids(clone, rid_map)
+        return clone
+
+    def import_master(self, source_master):
+        """Import a slide master with its layouts and theme, and register it."""
+        master_part = self.import_part(source_master.part)
+        prs_part = self.prs.part
+
+        # Master and layout ids share one id space across the presentation
+        ids = [int(el.get("id")) for el in prs_part._element.iter(qn("p:sldMasterId"))]
+        for master in self.prs.slide_masters:
+            ids += [int(el.get("id")) for el in master.part._element.iter(qn("p:sldLayoutId"))]
+        next_id = max(ids, default=2147483647) + 1
+
+        rId = prs_part.relate_to(master_part, RT.SLIDE_MASTER)
+        master_list = prs_part._element.find(qn("p:sldMasterIdLst"))
+        etree.SubElement(
+            master_list, qn("p:sldMasterId"), {"id": str(next_id), qn("r:id"): rId}
+        )
+        for layout_id in master_part._element.iter(qn("p:sldLayoutId")):
+            next_id += 1
+            layout_id.set("id", str(next_id))
+
+        self._index_layouts(master_part.slide_master, source_master, self.source_digests)
+
+    def add_slide(self, source_slide):
+        """Append a copy of source_slide to the output and return it."""
+        source_part = source_slide.part
+        source_layout = source_slide.slide_layout
+        key = (
+            content_digest(source_layout.slide_master.part, self.source_digests),
+            content_digest(source_layout.part, self.source_digests),
+        )
+        if key not in self.layouts:
+            self.import_master(source_layout.slide_master)
+
+        new_slide = self.prs.slides.add_slide(self.layouts[key])
+        new_part = new_slide.part
+        copy_slide_xml(source_part, new_part)
+
+        slide_parts = {}  # source part -> output part, for this slide only
+        rid_map = {}
+        for rId, rel in source_part.rels.items():
+            if rel.reltype == RT.SLIDE_LAYOUT:
+                rid_map[rId] = layout_rId(new_part)
+            elif rel.reltype == RT.NOTES_SLIDE:
+                continue
+            elif rel.is_external:
+                rid_map[rId] = new_part.relate_to(
+                    rel.target_ref, rel.reltype, is_external=True
+                )
+            elif rel.reltype == RT.SLIDE:
+                # Links to other slides of the source deck can't be resolved
+                for el in new_part._element.xpath(f'.//*[@r:id="{rId}"]'):
+                    el.getparent().remove(el)
+            else:
+                rid_map[rId] = new_part.relate_to(
+                    self.import_part(rel.target_part, slide_parts), rel.reltype
+                )
+        remap_relationship_ids(new_part._element, rid_map)
+        remap_diagram_drawing_ids(slide_parts.values(), rid_map)
+
+        copy_notes(source_slide, new_slide)
+        return new_slide
 
-    # Remove slide element from current position
-    slide_element = slides[slide_index]
-    slides.remove(slide_element)
 
-    # Insert at target position
-    slides.insert(target_index, slide_element)
+def remove_slide_references(part, dropped_parts):
+    """Remove part's links to dropped slides so the slides can be garbage-collected.
+
+    Hyperlinks (or custom show entries) pointing at a dropped slide are removed
+    along with their relationship. Otherwise the dropped slide, and all of its
+    media, would stay reachable and be written to the saved package.
+    """
+    for rId, rel in list(part.rels.items()):
+        if rel.is_external or rel.target_part not in dropped_parts:
+            continue
+        for el in part._element.xpath(f'.//*[@r:id="{rId}"]'):
+            el.getparent().remove(el)
+        part.drop_rel(rId)
 
 
 def rearrange_presentation(template_path, output_path, slide_sequence):
     """
     Create a new presentation with slides from template in specified order.
 
+    The final sequence is planned up front: the first use of a slide keeps the
+    original, later uses get duplicates. The slide list is then rewritten in a
+    single pass, and slides that aren't used are dropped along with any links
+    to them, so their parts and media are left out of the saved package.
+
     Args:
         template_path: Path to template PPTX file
         output_path: Path for output PPTX file
@@ -169,57 +543,46 @@ def rearrange_presentation(template_path, output_path, slide_sequence):
         if idx < 0 or idx >= total_slides:
             raise ValueError(f"Slide index {idx} out of range (0-{total_slides - 1})")
 
-    # Track original slides and their duplicates
-    slide_map = []  # List of actual slide indices for final presentation
-    duplicated = {}  # Track duplicates: original_idx -> [duplicate_indices]
+    sldIdLst = prs.slides._sldIdLst
+    original_ids = list(sldIdLst)
+    original_parts = [slide.part for slide in prs.slides]
+    counts = Counter(slide_sequence)
 
-    # Step 1: DUPLICATE repeated slides
+    # Step 1: DUPLICATE repeated slides (appended after the originals, so
+    # template indices stay valid while duplicating)
     print(f"Processing {len(slide_sequence)} slides from template...")
-    for i, template_idx in enumerate(slide_sequence):
-        if template_idx in duplicated and duplicated[template_idx]:
-            # Already duplicated this slide, use the duplicate
-            slide_map.append(duplicated[template_idx].pop(0))
-            print(f"  [{i}] Using duplicate of slide {template_idx}")
-        elif slide_sequence.count(template_idx) > 1 and template_idx not in duplicated:
-            # First occurrence of a repeated slide - create duplicates
-            slide_map.append(template_idx)
-            duplicates = []
-            count = slide_sequence.count(template_idx) - 1
-            print(
-                f"  [{i}] Using original slide {template_idx}, creating {count} duplicate(s)"
-            )
-            for _ in range(count):
-                duplicate_slide(prs, template_idx)
-                duplicates.append(len(prs.slides) - 1)
-            duplicated[template_idx] = duplicates
+    copies = {}
+    for template_idx, count in counts.items():
+        copies[template_idx] = []
+        if count > 1:
+            print(f"  Creating {count - 1} duplicate(s) of slide {template_idx}")
+        for _ in range(count - 1):
+            duplicate_slide(prs, template_idx)
+            copies[template_idx].append(sldIdLst[-1])
+
+    # Step 2: PLAN the final sequence (first use keeps the original)
+    final_ids = []
+    used = set()
+    for template_idx in slide_sequence:
+        if template_idx not in used:
+            final_ids.append(original_ids[template_idx])
+            used.add(template_idx)
         else:
-            # Unique slide or first occurrence already handled, use original
-            slide_map.append(template_idx)
-            print(f"  [{i}] Using original slide {template_idx}")
-
-    # Step 2: DELETE unwanted slides (work backwards)
-    slides_to_keep = set(slide_map)
-    print(f"\nDeleting {len(prs.slides) - len(slides_to_keep)} unused slides...")
-    for i in range(len(prs.slides) - 1, -1, -1):
-        if i not in slides_to_keep:
-            delete_slide(prs, i)
-            # Update slide_map indices after deletion
-            slide_map = [idx - 1 if idx > i else idx for idx in slide_map]
-
-    # Step 3: REORDER to final sequence
-    print(f"Reordering {len(slide_map)} slides to final sequence...")
-    for target_pos in range(len(slide_map)):
-        # Find which slide should be at target_pos
-        current_pos = slide_map[target_pos]
-        if current_pos != target_pos:
-            reorder_slides(prs, current_pos, target_pos)
-            # Update slide_map: the move shifts other slides
-            for i in range(len(slide_map)):
-                if slide_map[i] > current_pos and slide_map[i] <= target_pos:
-                    slide_map[i] -= 1
-                elif slide_map[i] < current_pos and slide_map[i] >= target_pos:
-                    slide_map[i] += 1
-            slide_map[target_pos] = target_pos
+            final_ids.append(copies[template_idx].pop())
+
+    # Step 3: REWRITE the slide list in one pass, dropping unused slides
+    dropped = [i for i in range(total_slides) if i not in counts]
+    print(f"Writing {len(final_ids)} slides, dropping {len(dropped)} unused slides...")
+    for sldId in list(sldIdLst):
+        sldIdLst.remove(sldId)
+    sldIdLst.extend(final_ids)
+
+    # Step 4: GARBAGE-COLLECT dropped slides
+    dropped_parts = {original_parts[i] for i in dropped}
+    if dropped_parts:
+        remove_slide_references(prs.part, dropped_parts)
+        for slide in prs.slides:
+            remove_slide_references(slide.part, dropped_parts)
 
     # Save the presentation
     prs.save(output_path)
@@ -227,5 +590,91 @@ def rearrange_presentation(template_path, output_path, slide_sequence):
     print(f"Final presentation has {len(prs.slides)} slides")
 
 
+def assemble_presentation(entries, output_path):
+    """
+    Create a presentation from slides of several source presentations.
+
+    The output is based on the first source (slide size, masters). Sources are
+    opened one at a time, in order of first use, and released once their slides
+    are imported, so only one source is in memory at once.
+
+    Args:
+        entries: List of (source_path, slide_index) tuples, in output order
+        output_path: Path for output PPTX file
+    """
+    prs = Presentation(str(entries[0][0]))
+    sldIdLst = prs.slides._sldIdLst
+    original_parts = {slide.part for slide in prs.slides}
+    assembler = DeckAssembler(prs)
+
+    # Group entries by source so each source is opened once
+    by_source = {}
+    for position, (source_path, slide_index) in enumerate(entries):
+        by_source.setdefault(str(source_path), []).append((position, slide_index))
+
+    new_ids = [None] * len(entries)
+    for source_path, items in by_source.items():
+        print(f"Importing {len(items)} slide(s) from {source_path}...")
+        source = Presentation(source_path)
+        total_slides = len(source.slides)
+        for position, slide_index in items:
+            if slide_index < 0 or slide_index >= total_slides:
+                raise ValueError(
+                    f"Slide index {slide_index} out of range for {source_path} "
+                    f"(0-{total_slides - 1})"
+                )
+            assembler.add_slide(source.slides[slide_index])
+            new_ids[position] = sldIdLst[-1]
+        assembler.end_source()
+        del source
+
+    # Rewrite the slide list in one pass, dropping the base deck's own slides
+    for sldId in list(sldIdLst):
+        sldIdLst.remove(sldId)
+    sldIdLst.extend(new_ids)
+    remove_slide_references(prs.part, original_parts)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    prs.save(output_path)
+    print(f"\nSaved assembled presentation to: {output_path}")
+    print(f"Final presentation has {len(prs.slides)} slides")
+
+
+def main_assemble(argv):
+    """Command-line entry point for --assemble mode."""
+    parser = argparse.ArgumentParser(
+        prog="rearrange.py --assemble",
+        description="Assemble one presentation from slides of several presentations.",
+    )
+    parser.add_argument("output", help="Path for output PPTX file")
+    parser.add_argument(
+        "entries",
+        nargs="+",
+        help="Slides as source.pptx:index (0-based), in output order",
+    )
+    args = parser.parse_args(argv)
+
+    entries = []
+    for entry in args.entries:
+        source, _, index = entry.rpartition(":")
+        try:
+            entries.append((Path(source), int(index)))
+        except ValueError:
+            print(f"Error: Invalid entry '{entry}'. Use source.pptx:index")
+            sys.exit(1)
+        if not Path(source).exists():
+            print(f"Error: Source file not found: {source}")
+            sys.exit(1)
+
+    try:
+        assemble_presentation(entries, Path(args.output))
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error processing presentation: {e}")
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()
@@ -3,16 +3,23 @@
 
 Usage:
     python replace.py <input.pptx> <replacements.json> <output.pptx>
+    python replace.py --batch [--jobs N] <input.pptx> <output_dir> <replacements.json>...
+
+Batch mode parses and inventories the template once per worker and writes
+one <replacements stem>.pptx per JSON file into output_dir.
 
 The replacements JSON should have the structure output by inventory.py.
 ALL text shapes identified by inventory.py will have their text cleared
 unless "paragraphs" is specified in the replacements for that shape.
 """
 
+import io
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from inventory import InventoryData, extract_text_inventory
 from pptx import Presentation
@@ -20,6 +27,7 @@ from pptx.dml.color import RGBColor
 from pptx.enum.dml import MSO_THEME_COLOR
 from pptx.enum.text import PP_ALIGN
 from pptx.oxml.xmlchemy import OxmlElement
+from pptx.shapes.shapetree import SlideShapeFactory
 from pptx.util import Pt
 
 
@@ -159,6 +167,23 @@ def detect_frame_overflow(inventory: InventoryData) -> Dict[str, Dict[str, float
     return overflow_map
 
 
+def remeasure_shapes(
+    inventory: InventoryData, shape_keys: List[Tuple[str, str]]
+) -> InventoryData:
+    """Re-measure the given shapes in place and return them as a sub-inventory.
+
+    Shapes are read from the live in-memory presentation, so the result reflects
+    edits made since the inventory was built without saving and reloading.
+    Shape keys are kept from the original inventory.
+    """
+    remeasured: InventoryData = {}
+    for slide_key, shape_key in shape_keys:
+        shape_data = inventory[slide_key][shape_key]
+        shape_data.refresh_text_metrics()
+        remeasured.setdefault(slide_key, {})[shape_key] = shape_data
+    return remeasured
+
+
 def validate_replacements(inventory: InventoryData, replacements: Dict) -> List[str]:
     """Validate that all shapes in replacements exist in inventory.
 
@@ -211,24 +236,14 @@ def check_duplicate_keys(pairs):
     return result
 
 
-def apply_replacements(pptx_file: str, json_file: str, output_file: str):
-    """Apply text replacements from JSON to PowerPoint presentation."""
-
-    # Load presentation
-    prs = Presentation(pptx_file)
-
-    # Get inventory of all text shapes (returns ShapeData objects)
-    # Pass prs to use same Presentation instance
-    inventory = extract_text_inventory(Path(pptx_file), prs)
-
-    # Detect text overflow in original presentation
-    original_overflow = detect_frame_overflow(inventory)
-
-    # Load replacement data with duplicate key detection
+def load_replacements(json_file: str) -> Dict:
+    """Load replacement JSON with duplicate key detection."""
     with open(json_file, "r") as f:
-        replacements = json.load(f, object_pairs_hook=check_duplicate_keys)
+        return json.load(f, object_pairs_hook=check_duplicate_keys)
+
 
-    # Validate replacements
+def ensure_valid_replacements(inventory: InventoryData, replacements: Dict):
+    """Print validation errors and raise if replacements don't match inventory."""
     errors = validate_replacements(inventory, replacements)
     if errors:
         print("ERROR: Invalid shapes in replacement JSON:")
@@ -240,10 +255,17 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
         )
         raise ValueError(f"Found {len(errors)} validation error(s)")
 
+
+def replace_inventory_text(
+    prs: Any, inventory: InventoryData, replacements: Dict
+) -> Tuple[Dict[str, int], List[Tuple[str, str]]]:
+    """Clear every inventory shape and write replacement paragraphs into it.
+
+    Returns (statistics, keys of shapes that received replacement paragraphs).
+    """
     # Track statistics
-    shapes_processed = 0
-    shapes_cleared = 0
-    shapes_replaced = 0
+    stats = {"processed": 0, "cleared": 0, "replaced": 0}
+    replaced_keys: List[Tuple[str, str]] = []
 
     # Process each slide from inventory
     for slide_key, shapes_dict in inventory.items():
@@ -258,7 +280,7 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
 
         # Process each shape from inventory
         for shape_key, shape_data in shapes_dict.items():
-            shapes_processed += 1
+            stats["processed"] += 1
 
             # Get the shape directly from ShapeData
             shape = shape_data.shape
@@ -270,14 +292,15 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
             text_frame = shape.text_frame  # type: ignore
 
             text_frame.clear()  # type: ignore
-            shapes_cleared += 1
+            stats["cleared"] += 1
 
             # Check for replacement paragraphs
             replacement_shape_data = replacements.get(slide_key, {}).get(shape_key, {})
             if "paragraphs" not in replacement_shape_data:
                 continue
 
-            shapes_replaced += 1
+            stats["replaced"] += 1
+            replaced_keys.append((slide_key, shape_key))
 
             # Add replacement paragraphs
             for i, para_data in enumerate(replacement_shape_data["paragraphs"]):
@@ -288,20 +311,19 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
 
                 apply_paragraph_properties(p, para_data)
 
-    # Check for issues after replacements
-    # Save to a temporary file and reload to avoid modifying the presentation during inventory
-    # (extract_text_inventory accesses font.color which adds empty <a:solidFill/> elements)
-    import tempfile
+    return stats, replaced_keys
 
-    with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as tmp:
-        tmp_path = Path(tmp.name)
-        prs.save(str(tmp_path))
 
-    try:
-        updated_inventory = extract_text_inventory(tmp_path)
-        updated_overflow = detect_frame_overflow(updated_inventory)
-    finally:
-        tmp_path.unlink()  # Clean up temp file
+def check_replacement_issues(
+    inventory: InventoryData,
+    original_overflow: Dict[str, Dict[str, float]],
+    replaced_keys: List[Tuple[str, str]],
+):
+    """Raise if replaced text worsened overflow or introduced formatting warnings."""
+    # Cleared shapes have no text left to overflow, so only the shapes that
+    # received new text are re-measured.
+    updated_inventory = remeasure_shapes(inventory, replaced_keys)
+    updated_overflow = detect_frame_overflow(updated_inventory)
 
     # Check if any text overflow got worse
     overflow_errors = []
@@ -342,19 +364,190 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
             f"Found {len(overflow_errors)} overflow error(s) and {len(warnings)} warning(s)"
         )
 
+
+def apply_replacements(pptx_file: str, json_file: str, output_file: str):
+    """Apply text replacements from JSON to PowerPoint presentation."""
+
+    # Load presentation
+    prs = Presentation(pptx_file)
+
+    # Get inventory of all text shapes (returns ShapeData objects)
+    # Pass prs to use same Presentation instance
+    inventory = extract_text_inventory(Path(pptx_file), prs)
+
+    # Detect text overflow in original presentation
+    original_overflow = detect_frame_overflow(inventory)
+
+    # Load and validate replacement data
+    replacements = load_replacements(json_file)
+    ensure_valid_replacements(inventory, replacements)
+
+    stats, replaced_keys = replace_inventory_text(prs, inventory, replacements)
+    check_replacement_issues(inventory, original_overflow, replaced_keys)
+
     # Save the presentation
     prs.save(output_file)
 
     # Report results
     print(f"Saved updated presentation to: {output_file}")
     print(f"Processed {len(prs.slides)} slides")
-    print(f"  - Shapes processed: {shapes_processed}")
-    print(f"  - Shapes cleared: {shapes_cleared}")
-    print(f"  - Shapes replaced: {shapes_replaced}")
+    print(f"  - Shapes processed: {stats['processed']}")
+    print(f"  - Shapes cleared: {stats['cleared']}")
+    print(f"  - Shapes replaced: {stats['replaced']}")
+
+
+class TemplateDeck:
+    """A template presentation parsed and inventoried once, then cloned per output.
+
+    The .pptx bytes are kept in memory and each clone is parsed from them, so
+    the template file is read once. The inventory is built once as well; for
+    each clone its ShapeData entries are rebound to the clone's shapes by their
+    element path, without re-measuring any text.
+    """
+
+    def __init__(self, pptx_file: str):
+        self.pptx_file = pptx_file
+        self.data = Path(pptx_file).read_bytes()
+
+        prs = Presentation(io.BytesIO(self.data))
+        self.inventory = extract_text_inventory(Path(pptx_file), prs)
+        self.original_overflow = detect_frame_overflow(self.inventory)
+
+        # Element path of each inventory shape, relative to its slide root
+        self.shape_paths: Dict[str, Dict[str, str]] = {}
+        for slide_key, shapes_dict in self.inventory.items():
+            self.shape_paths[slide_key] = {
+                shape_key: shape_data.shape.element.getroottree().getelementpath(  # type: ignore
+                    shape_data.shape.element  # type: ignore
+                )
+                for shape_key, shape_data in shapes_dict.items()
+            }
+
+    def clone(self) -> Tuple[Any, InventoryData]:
+        """Return a fresh (presentation, inventory) pair for one output."""
+        prs = Presentation(io.BytesIO(self.data))
+        inventory: InventoryData = {}
+        for slide_key, shapes_dict in self.inventory.items():
+            slide = prs.slides[int(slide_key.split("-")[1])]
+            root = slide.element
+            inventory[slide_key] = {}
+            for shape_key, shape_data in shapes_dict.items():
+                path = self.shape_paths[slide_key][shape_key]
+                element = root if path == "." else root.find(path)
+                inventory[slide_key][shape_key] = shape_data.bind_to(
+                    SlideShapeFactory(element, slide.shapes)
+                )
+        return prs, inventory
+
+    def render(self, json_file: str, output_file: str) -> Dict[str, int]:
+        """Apply one replacement JSON to a clone of the template and save it."""
+        prs, inventory = self.clone()
+        replacements = load_replacements(json_file)
+        ensure_valid_replacements(inventory, replacements)
+
+        stats, replaced_keys = replace_inventory_text(prs, inventory, replacements)
+        check_replacement_issues(inventory, self.original_overflow, replaced_keys)
+
+        prs.save(output_file)
+        return stats
+
+
+# Per-process template for batch workers, loaded once by _init_batch_worker
+_batch_template: Optional[TemplateDeck] = None
+
+
+def _init_batch_worker(pptx_file: str):
+    """Load the template once in each worker process."""
+    global _batch_template
+    _batch_template = TemplateDeck(pptx_file)
+
+
+def _render_batch_output(json_file: str, output_file: str) -> Dict[str, int]:
+    """Render one batch output using this worker's template."""
+    assert _batch_template is not None, "Batch worker was not initialized"
+    return _batch_template.render(json_file, output_file)
+
+
+def apply_replacements_batch(
+    pptx_file: str,
+    json_files: List[str],
+    output_dir: str,
+    jobs: Optional[int] = None,
+) -> List[str]:
+    """Apply many replacement JSON files to one template.
+
+    Each output is written to output_dir as <json stem>.pptx. Work is spread
+    over a process pool of `jobs` workers (default: CPU count), each of which
+    parses and inventories the template once.
+
+    Returns list of JSON files that failed. Raises ValueError, before anything
+    is written, if two JSON files would be saved to the same output.
+    """
+    by_stem: Dict[str, List[str]] = {}
+    for f in json_files:
+        by_stem.setdefault(Path(f).stem, []).append(f)
+    clashes = [files for files in by_stem.values() if len(files) > 1]
+    if clashes:
+        raise ValueError(
+            "JSON files with the same name would overwrite each other's output: "
+            + "; ".join(", ".join(files) for files in clashes)
+        )
+
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    tasks = [(f, str(output_path / f"{Path(f).stem}.pptx")) for f in json_files]
+
+    jobs = jobs or os.cpu_count() or 1
+    jobs = min(jobs, len(tasks)) or 1
+    failed = []
+
+    def report(json_file: str, output_file: str, stats=None, error=None):
+        if error is not None:
+            print(f"FAILED {json_file}: {error}")
+            failed.append(json_file)
+        else:
+            print(
+                f"Saved {output_file} "
+                f"({stats['replaced']}/{stats['processed']} shapes replaced)"
+            )
+
+    if jobs == 1:
+        template = TemplateDeck(pptx_file)
+        for json_file, output_file in tasks:
+            try:
+                report(json_file, output_file, template.render(json_file, output_file))
+            except Exception as e:
+                report(json_file, output_file, error=e)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_batch_worker,
+            initargs=(pptx_file,),
+        ) as executor:
+            futures = {
+                executor.submit(_render_batch_output, json_file, output_file): (
+                    json_file,
+                    output_file,
+                )
+                for json_file, output_file in tasks
+            }
+            for future in as_completed(futures):
+                json_file, output_file = futures[future]
+                try:
+                    report(json_file, output_file, future.result())
+                except Exception as e:
+                    report(json_file, output_file, error=e)
+
+    print(f"Batch complete: {len(tasks) - len(failed)}/{len(tasks)} decks generated")
+    return failed
 
 
 def main():
     """Main entry point for command-line usage."""
+    if len(sys.argv) >= 2 and sys.argv[1] == "--batch":
+        main_batch(sys.argv[2:])
+        return
+
     if len(sys.argv) != 4:
         print(__doc__)
         sys.exit(1)
@@ -381,5 +574,45 @@ def main():
         sys.exit(1)
 
 
+def main_batch(args: List[str]):
+    """Command-line entry point for --batch mode."""
+    jobs = None
+    if args and args[0] == "--jobs":
+        try:
+            jobs = int(args[1])
+        except (IndexError, ValueError):
+            jobs = 0
+        if jobs < 1:
+            print("Error: --jobs needs a positive number of worker processes")
+            print(__doc__)
+            sys.exit(1)
+        args = args[2:]
+
+    if len(args) < 3:
+        print(__doc__)
+        sys.exit(1)
+
+    input_pptx = Path(args[0])
+    output_dir = args[1]
+    json_files = args[2:]
+
+    if not input_pptx.exists():
+        print(f"Error: Input file '{input_pptx}' not found")
+        sys.exit(1)
+
+    missing = [f for f in json_files if not Path(f).exists()]
+    if missing:
+        print(f"Error: Replacements JSON file(s) not found: {', '.join(missing)}")
+        sys.exit(1)
+
+    try:
+        failed = apply_replacements_batch(str(input_pptx), json_files, output_dir, jobs)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    if failed:
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()
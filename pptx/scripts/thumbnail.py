@@ -18,8 +18,16 @@ Grid limits by column count:
 - 5 cols: max 30 slides per grid (5×6) [default]
 - 6 cols: max 42 slides per grid (6×7)
 
+Only the slides selected with --slides are rasterized. Renders are cached by a
+hash of each slide's XML and the parts it depends on, so unchanged slides are
+reused on the next run; if every requested slide is cached, LibreOffice is not
+started at all. The least recently used renders are pruned once the cache
+grows past --cache-max-mb.
+
 Usage:
     python thumbnail.py input.pptx [output_prefix] [--cols N] [--outline-placeholders]
+                        [--slides 3,7-9] [--cache-dir DIR | --no-cache]
+                        [--cache-max-mb MB]
 
 Examples:
     python thumbnail.py presentation.pptx
@@ -38,24 +46,47 @@ Examples:
 
     python thumbnail.py template.pptx analysis --outline-placeholders
     # Creates thumbnail grids with red outlines around text placeholders
+
+    python thumbnail.py deck.pptx changed --slides 3,7-9
+    # Creates a grid of slides 3, 7, 8 and 9 only
 """
 
 import argparse
+import hashlib
+import os
+import re
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from inventory import extract_text_inventory
 from PIL import Image, ImageDraw, ImageFont
 from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+# Shared LibreOffice service lives with the OOXML tooling
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "ooxml" / "scripts"))
+import soffice  # noqa: E402
 
 # Constants
 THUMBNAIL_WIDTH = 300  # Fixed thumbnail width in pixels
-CONVERSION_DPI = 100  # DPI for PDF to image conversion
 MAX_COLS = 6  # Maximum number of columns
 DEFAULT_COLS = 5  # Default number of columns
 JPEG_QUALITY = 95  # JPEG compression quality
+DEFAULT_SLIDE_INCHES = (10.0, 5.625)  # 16:9 slide size when none is known
+PPM_HEADER = re.compile(rb"P6\s+(\d+)\s+(\d+)\s+\d+\s")  # pdftoppm output
+DEFAULT_CACHE_DIR = Path("~/.cache/pptx-thumbnails")  # Rendered slide cache
+DEFAULT_CACHE_MAX_MB = 100  # Cache size above which old renders are pruned
+
+# Relationships that don't affect how a slide renders (excluded from cache keys)
+CACHE_SKIPPED_RELTYPES = {
+    RT.NOTES_SLIDE,
+    RT.SLIDE,
+    RT.COMMENTS,
+    RT.COMMENT_AUTHORS,
+}
 
 # Grid layout constants
 GRID_PADDING = 20  # Padding between thumbnails
@@ -86,6 +117,31 @@ def main():
         action="store_true",
         help="Outline text placeholders with a colored border",
     )
+    parser.add_argument(
+        "--slides",
+        help="Only render these zero-based slides, e.g. 3,7-9 (default: all)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(DEFAULT_CACHE_DIR),
+        help=f"Reuse renders of unchanged slides from this directory (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Render every slide without reading or writing the cache",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=float,
+        default=DEFAULT_CACHE_MAX_MB,
+        help=f"Prune least recently used renders above this cache size (default: {DEFAULT_CACHE_MAX_MB})",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Parallel rasterizer processes (default: CPU count)",
+    )
 
     args = parser.parse_args()
 
@@ -100,6 +156,16 @@ def main():
         print(f"Error: Invalid PowerPoint file: {args.input}")
         sys.exit(1)
 
+    # Parse slide selection
+    slides = None
+    if args.slides:
+        try:
+            slides = parse_slide_selection(args.slides)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+    cache_dir = None if args.no_cache else Path(args.cache_dir).expanduser()
+
     # Construct output path (always JPG)
     output_path = Path(f"{args.output_prefix}.jpg")
 
@@ -119,7 +185,15 @@ def main():
                     print(f"Found placeholders on {len(placeholder_regions)} slides")
 
             # Convert slides to images
-            slide_images = convert_to_images(input_path, Path(temp_dir), CONVERSION_DPI)
+            slide_images = convert_to_images(
+                input_path,
+                Path(temp_dir),
+                THUMBNAIL_WIDTH,
+                slides,
+                cache_dir,
+                args.jobs,
+                args.cache_max_mb,
+            )
             if not slide_images:
                 print("Error: No slides found")
                 sys.exit(1)
@@ -150,7 +224,7 @@ def create_hidden_slide_placeholder(size):
     """Create placeholder image for hidden slides."""
     img = Image.new("RGB", size, color="#F0F0F0")
     draw = ImageDraw.Draw(img)
-    line_width = max(5, min(size) // 100)
+    line_width = max(2, min(size) // 50)
     draw.line([(0, 0), size], fill="#CCCCCC", width=line_width)
     draw.line([(size[0], 0), (0, size[1])], fill="#CCCCCC", width=line_width)
     return img
@@ -194,92 +268,302 @@ def get_placeholder_regions(pptx_path):
     return placeholder_regions, (slide_width_inches, slide_height_inches)
 
 
-def convert_to_images(pptx_path, temp_dir, dpi):
-    """Convert PowerPoint to images via PDF, handling hidden slides."""
+def convert_to_pdf(pptx_path, outdir):
+    """Convert PowerPoint to PDF, preferring the warm LibreOffice service."""
+    pdf_path = outdir / f"{pptx_path.stem}.pdf"
+    try:
+        soffice.convert(pptx_path, outdir, "pdf")
+    except soffice.ServiceUnavailable:
+        # Fall back to a one-shot soffice process
+        result = subprocess.run(
+            [
+                "soffice",
+                "--headless",
+                "--convert-to",
+                "pdf",
+                "--outdir",
+                str(outdir),
+                str(pptx_path),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise RuntimeError("PDF conversion failed")
+    if not pdf_path.exists():
+        raise RuntimeError("PDF conversion failed")
+    return pdf_path
+
+
+def parse_slide_selection(spec):
+    """Parse a slide selection like "3,7-9" into a sorted list of indices."""
+    slides = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        first, sep, last = part.partition("-")
+        try:
+            if sep:
+                slides.update(range(int(first), int(last) + 1))
+            else:
+                slides.add(int(first))
+        except ValueError:
+            raise ValueError(f"Invalid slide selection: {part!r}")
+    if not slides:
+        raise ValueError(f"Invalid slide selection: {spec!r}")
+    return sorted(slides)
+
+
+def slide_cache_keys(prs, width):
+    """Compute a render cache key for each slide.
+
+    The key hashes the slide XML together with every part it renders from
+    (layout, master, theme, images, charts, ...), the slide size and the width,
+    so a slide's key only changes when its rendered image can change.
+    """
+    part_digests = {}
+    keys = {}
+
+    for idx, slide in enumerate(prs.slides):
+        entries = []
+        seen = set()
+        stack = [slide.part]
+        while stack:
+            part = stack.pop()
+            name = str(part.partname)
+            if name in seen:
+                continue
+            seen.add(name)
+            if name not in part_digests:
+                part_digests[name] = hashlib.sha256(part.blob).hexdigest()
+            entries.append(f"{name}:{part_digests[name]}")
+            for rel in part.rels.values():
+                if rel.is_external or rel.reltype in CACHE_SKIPPED_RELTYPES:
+                    continue
+                stack.append(rel.target_part)
+
+        key = hashlib.sha256(f"{prs.slide_width}x{prs.slide_height}@{width}".encode())
+        # Slide number fields render the slide's position
+        if b'type="slidenum"' in slide.part.blob:
+            key.update(f"#{idx}".encode())
+        key.update("\n".join(sorted(entries)).encode())
+        keys[idx] = key.hexdigest()
+
+    return keys
+
+
+def read_ppm_stream(data):
+    """Split a stream of concatenated binary PPM (P6) images into PIL images."""
+    images = []
+    pos = 0
+    while pos < len(data):
+        match = PPM_HEADER.match(data, pos)
+        if not match:
+            break
+        w, h = int(match.group(1)), int(match.group(2))
+        start = match.end()
+        end = start + w * h * 3
+        images.append(Image.frombuffer("RGB", (w, h), data[start:end], "raw", "RGB", 0, 1))
+        pos = end
+    return images
+
+
+def rasterize_pages(pdf_path, pages, width, jobs=None):
+    """Rasterize the given 1-based PDF pages straight at thumbnail width.
+
+    Pages are grouped into contiguous ranges, split so each CPU core gets a
+    share, and the ranges are rendered by parallel pdftoppm processes. pdftoppm
+    scales while rendering (-scale-to-x) and streams PPM to stdout, so no
+    full-resolution or intermediate image files are produced.
+
+    Returns a dict mapping page number to PIL image.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    chunk_size = max(1, -(-len(pages) // jobs))
+    ranges = []
+    for page in sorted(set(pages)):
+        if ranges:
+            first, last = ranges[-1]
+            if page == last + 1 and last - first + 1 < chunk_size:
+                ranges[-1][1] = page
+                continue
+        ranges.append([page, page])
+
+    def run(first, last):
+        result = subprocess.run(
+            [
+                "pdftoppm",
+                "-scale-to-x",
+                str(width),
+                "-scale-to-y",
+                "-1",
+                "-f",
+                str(first),
+                "-l",
+                str(last),
+                str(pdf_path),
+            ],
+            capture_output=True,
+        )
+        if result.returncode != 0:
+            raise RuntimeError("Image conversion failed")
+        return dict(zip(range(first, last + 1), read_ppm_stream(result.stdout)))
+
+    rendered = {}
+    with ThreadPoolExecutor(max_workers=min(jobs, len(ranges)) or 1) as executor:
+        for result in executor.map(lambda r: run(*r), ranges):
+            rendered.update(result)
+    return rendered
+
+
+def prune_cache(cache_dir, max_mb):
+    """Delete the least recently used renders until the cache fits in max_mb.
+
+    Cache hits touch their file, so modification times order renders by last use.
+    """
+    entries = []
+    for path in cache_dir.glob("*.jpg"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:  # Pruned by a concurrent run
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    max_bytes = max_mb * 1024 * 1024
+    for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def convert_to_images(
+    pptx_path,
+    temp_dir,
+    width,
+    slides=None,
+    cache_dir=None,
+    jobs=None,
+    cache_max_mb=DEFAULT_CACHE_MAX_MB,
+):
+    """Convert PowerPoint to thumbnail images via PDF, handling hidden slides.
+
+    Args:
+        pptx_path: Path to the PowerPoint file
+        temp_dir: Directory for the intermediate PDF
+        width: Thumbnail width in pixels; pages are rendered at this size
+        slides: Optional list of zero-based slide indices to render (default: all)
+        cache_dir: Optional directory of slide renders to reuse, keyed by
+            slide_cache_keys(); new renders are added to it
+        jobs: Number of parallel rasterizer processes (default: CPU count)
+        cache_max_mb: Size the cache is pruned back to, least recently used
+            renders first
+
+    Returns:
+        List of (slide_index, PIL image) tuples in slide order
+    """
     # Detect hidden slides
     print("Analyzing presentation...")
     prs = Presentation(str(pptx_path))
     total_slides = len(prs.slides)
 
-    # Find hidden slides (1-based indexing for display)
+    # Find hidden slides (0-based indexing, matching grid labels)
     hidden_slides = {
-        idx + 1
-        for idx, slide in enumerate(prs.slides)
-        if slide.element.get("show") == "0"
+        idx for idx, slide in enumerate(prs.slides) if slide.element.get("show") == "0"
     }
 
     print(f"Total slides: {total_slides}")
     if hidden_slides:
         print(f"Hidden slides: {sorted(hidden_slides)}")
 
-    pdf_path = temp_dir / f"{pptx_path.stem}.pdf"
-
-    # Convert to PDF
-    print("Converting to PDF...")
-    result = subprocess.run(
-        [
-            "soffice",
-            "--headless",
-            "--convert-to",
-            "pdf",
-            "--outdir",
-            str(temp_dir),
-            str(pptx_path),
-        ],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0 or not pdf_path.exists():
-        raise RuntimeError("PDF conversion failed")
+    if slides is None:
+        slides = list(range(total_slides))
+    invalid = [idx for idx in slides if not 0 <= idx < total_slides]
+    if invalid:
+        raise ValueError(
+            f"Slide(s) {invalid} out of range (presentation has {total_slides} slides)"
+        )
 
-    # Convert PDF to images
-    print(f"Converting to images at {dpi} DPI...")
-    result = subprocess.run(
-        ["pdftoppm", "-jpeg", "-r", str(dpi), str(pdf_path), str(temp_dir / "slide")],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        raise RuntimeError("Image conversion failed")
+    # PDF export skips hidden slides, so visible slides map to consecutive pages
+    page_numbers = {}
+    for idx in range(total_slides):
+        if idx not in hidden_slides:
+            page_numbers[idx] = len(page_numbers) + 1
+
+    # Reuse cached renders of unchanged slides
+    cache_keys = slide_cache_keys(prs, width) if cache_dir else {}
+    images = {}
+    to_render = []
+    for idx in slides:
+        if idx in hidden_slides:
+            continue
+        if not cache_dir:
+            to_render.append(idx)
+            continue
+        cached = cache_dir / f"{cache_keys[idx]}.jpg"
+        try:
+            with Image.open(cached) as img:
+                images[idx] = img.convert("RGB")
+            os.utime(cached)  # Mark as recently used
+        except FileNotFoundError:  # Not rendered yet, or pruned by another run
+            to_render.append(idx)
+
+    if cache_dir:
+        print(f"Reusing {len(images)} cached slide(s), rendering {len(to_render)}")
+
+    if to_render:
+        # Convert to PDF
+        print("Converting to PDF...")
+        pdf_path = convert_to_pdf(pptx_path, temp_dir)
+
+        # Convert only the needed PDF pages to images
+        print(f"Converting {len(to_render)} page(s) to {width}px images...")
+        rendered = rasterize_pages(
+            pdf_path, [page_numbers[idx] for idx in to_render], width, jobs
+        )
+        for idx in to_render:
+            img = rendered.get(page_numbers[idx])
+            if img is None:
+                continue
+            if cache_dir:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                img.save(cache_dir / f"{cache_keys[idx]}.jpg", quality=JPEG_QUALITY)
+            images[idx] = img
+
+    if cache_dir and cache_dir.is_dir():
+        prune_cache(cache_dir, cache_max_mb)
 
-    visible_images = sorted(temp_dir.glob("slide-*.jpg"))
+    # Get placeholder dimensions from first visible slide
+    if images:
+        placeholder_size = next(iter(images.values())).size
+    else:
+        placeholder_size = (width, width * 9 // 16)
 
     # Create full list with placeholders for hidden slides
     all_images = []
-    visible_idx = 0
-
-    # Get placeholder dimensions from first visible slide
-    if visible_images:
-        with Image.open(visible_images[0]) as img:
-            placeholder_size = img.size
-    else:
-        placeholder_size = (1920, 1080)
-
-    for slide_num in range(1, total_slides + 1):
-        if slide_num in hidden_slides:
-            # Create placeholder image for hidden slide
-            placeholder_path = temp_dir / f"hidden-{slide_num:03d}.jpg"
-            placeholder_img = create_hidden_slide_placeholder(placeholder_size)
-            placeholder_img.save(placeholder_path, "JPEG")
-            all_images.append(placeholder_path)
-        else:
-            # Use the actual visible slide image
-            if visible_idx < len(visible_images):
-                all_images.append(visible_images[visible_idx])
-                visible_idx += 1
+    for idx in slides:
+        if idx in hidden_slides:
+            all_images.append((idx, create_hidden_slide_placeholder(placeholder_size)))
+        elif idx in images:
+            all_images.append((idx, images[idx]))
 
     return all_images
 
 
 def create_grids(
-    image_paths,
+    slide_images,
     cols,
     width,
     output_path,
     placeholder_regions=None,
     slide_dimensions=None,
 ):
-    """Create multiple thumbnail grids from slide images, max cols×(cols+1) images per grid."""
+    """Create multiple thumbnail grids from slide images, max cols×(cols+1) images per grid.
+
+    slide_images is a list of (slide_index, PIL image) tuples, composed in memory.
+    """
     # Maximum images per grid is cols × (cols + 1) for better proportions
     max_images_per_grid = cols * (cols + 1)
     grid_files = []
@@ -290,18 +574,18 @@ def create_grids(
 
     # Split images into chunks
     for chunk_idx, start_idx in enumerate(
-        range(0, len(image_paths), max_images_per_grid)
+        range(0, len(slide_images), max_images_per_grid)
     ):
-        end_idx = min(start_idx + max_images_per_grid, len(image_paths))
-        chunk_images = image_paths[start_idx:end_idx]
+        end_idx = min(start_idx + max_images_per_grid, len(slide_images))
+        chunk_images = slide_images[start_idx:end_idx]
 
         # Create grid for this chunk
         grid = create_grid(
-            chunk_images, cols, width, start_idx, placeholder_regions, slide_dimensions
+            chunk_images, cols, width, placeholder_regions, slide_dimensions
         )
 
         # Generate output filename
-        if len(image_paths) <= max_images_per_grid:
+        if len(slide_images) <= max_images_per_grid:
             # Single grid - use base filename without suffix
             grid_filename = output_path
         else:
@@ -319,24 +603,23 @@ def create_grids(
 
 
 def create_grid(
-    image_paths,
+    slide_images,
     cols,
     width,
-    start_slide_num=0,
     placeholder_regions=None,
     slide_dimensions=None,
 ):
-    """Create thumbnail grid from slide images with optional placeholder outlining."""
+    """Create thumbnail grid from (slide_index, image) tuples with optional placeholder outlining."""
     font_size = int(width * FONT_SIZE_RATIO)
     label_padding = int(font_size * LABEL_PADDING_RATIO)
 
     # Get dimensions
-    with Image.open(image_paths[0]) as img:
-        aspect = img.height / img.width
+    first_img = slide_images[0][1]
+    aspect = first_img.height / first_img.width
     height = int(width * aspect)
 
     # Calculate grid size
-    rows = (len(image_paths) + cols - 1) // cols
+    rows = (len(slide_images) + cols - 1) // cols
     grid_w = cols * width + (cols + 1) * GRID_PADDING
     grid_h = rows * (height + font_size + label_padding * 2) + (rows + 1) * GRID_PADDING
 
@@ -353,7 +636,7 @@ def create_grid(
         font = ImageFont.load_default()
 
     # Place thumbnails
-    for i, img_path in enumerate(image_paths):
+    for i, (slide_num, img) in enumerate(slide_images):
         row, col = i // cols, i % cols
         x = col * width + (col + 1) * GRID_PADDING
         y_base = (
@@ -361,7 +644,7 @@ def create_grid(
         )
 
         # Add label with actual slide number
-        label = f"{start_slide_num + i}"
+        label = f"{slide_num}"
         bbox = draw.textbbox((0, 0), label, font=font)
         text_w = bbox[2] - bbox[0]
         draw.text(
@@ -374,75 +657,55 @@ def create_grid(
         # Add thumbnail below label with proportional spacing
         y_thumbnail = y_base + label_padding + font_size + label_padding
 
-        with Image.open(img_path) as img:
-            # Get original dimensions before thumbnail
-            orig_w, orig_h = img.size
-
-            # Apply placeholder outlines if enabled
-            if placeholder_regions and (start_slide_num + i) in placeholder_regions:
-                # Convert to RGBA for transparency support
-                if img.mode != "RGBA":
-                    img = img.convert("RGBA")
-
-                # Get the regions for this slide
-                regions = placeholder_regions[start_slide_num + i]
-
-                # Calculate scale factors using actual slide dimensions
-                if slide_dimensions:
-                    slide_width_inches, slide_height_inches = slide_dimensions
-                else:
-                    # Fallback: estimate from image size at CONVERSION_DPI
-                    slide_width_inches = orig_w / CONVERSION_DPI
-                    slide_height_inches = orig_h / CONVERSION_DPI
-
-                x_scale = orig_w / slide_width_inches
-                y_scale = orig_h / slide_height_inches
-
-                # Create a highlight overlay
-                overlay = Image.new("RGBA", img.size, (255, 255, 255, 0))
-                overlay_draw = ImageDraw.Draw(overlay)
-
-                # Highlight each placeholder region
-                for region in regions:
-                    # Convert from inches to pixels in the original image
-                    px_left = int(region["left"] * x_scale)
-                    px_top = int(region["top"] * y_scale)
-                    px_width = int(region["width"] * x_scale)
-                    px_height = int(region["height"] * y_scale)
-
-                    # Draw highlight outline with red color and thick stroke
-                    # Using a bright red outline instead of fill
-                    stroke_width = max(
-                        5, min(orig_w, orig_h) // 150
-                    )  # Thicker proportional stroke width
-                    overlay_draw.rectangle(
-                        [(px_left, px_top), (px_left + px_width, px_top + px_height)],
-                        outline=(255, 0, 0, 255),  # Bright red, fully opaque
-                        width=stroke_width,
-                    )
-
-                # Composite the overlay onto the image using alpha blending
-                img = Image.alpha_composite(img, overlay)
-                # Convert back to RGB for JPEG saving
-                img = img.convert("RGB")
+        # Apply placeholder outlines if enabled
+        if placeholder_regions and slide_num in placeholder_regions:
+            # Draw on a copy so cached images stay untouched
+            img = img.copy()
+            img_w, img_h = img.size
+            outline_draw = ImageDraw.Draw(img)
 
-            img.thumbnail((width, height), Image.Resampling.LANCZOS)
-            w, h = img.size
-            tx = x + (width - w) // 2
-            ty = y_thumbnail + (height - h) // 2
-            grid.paste(img, (tx, ty))
-
-            # Add border
-            if BORDER_WIDTH > 0:
-                draw.rectangle(
-                    [
-                        (tx - BORDER_WIDTH, ty - BORDER_WIDTH),
-                        (tx + w + BORDER_WIDTH - 1, ty + h + BORDER_WIDTH - 1),
-                    ],
-                    outline="gray",
-                    width=BORDER_WIDTH,
+            # Calculate scale factors using actual slide dimensions
+            slide_width_inches, slide_height_inches = (
+                slide_dimensions or DEFAULT_SLIDE_INCHES
+            )
+            x_scale = img_w / slide_width_inches
+            y_scale = img_h / slide_height_inches
+
+            # Proportional stroke width at thumbnail resolution
+            stroke_width = max(2, min(img_w, img_h) // 100)
+
+            # Outline each placeholder region in bright red
+            for region in placeholder_regions[slide_num]:
+                px_left = int(region["left"] * x_scale)
+                px_top = int(region["top"] * y_scale)
+                px_width = int(region["width"] * x_scale)
+                px_height = int(region["height"] * y_scale)
+                outline_draw.rectangle(
+                    [(px_left, px_top), (px_left + px_width, px_top + px_height)],
+                    outline=(255, 0, 0),
+                    width=stroke_width,
                 )
 
+        # Pages are rendered at thumbnail width; only resize if they don't fit
+        if img.width > width or img.height > height:
+            img = img.copy()
+            img.thumbnail((width, height), Image.Resampling.LANCZOS)
+        w, h = img.size
+        tx = x + (width - w) // 2
+        ty = y_thumbnail + (height - h) // 2
+        grid.paste(img, (tx, ty))
+
+        # Add border
+        if BORDER_WIDTH > 0:
+            draw.rectangle(
+                [
+                    (tx - BORDER_WIDTH, ty - BORDER_WIDTH),
+                    (tx + w + BORDER_WIDTH - 1, ty + h + BORDER_WIDTH - 1),
+                ],
+                outline="gray",
+                width=BORDER_WIDTH,
+            )
+
     return grid
 
 
@@ -4,10 +4,15 @@ Easing Functions - Timing functions for smooth animations.
 
 Provides various easing functions for natural motion and timing.
 All functions take a value t (0.0 to 1.0) and return eased value (0.0 to 1.0).
+
+The *_array variants and Timeline take NumPy arrays of t values and compute
+a whole animation's parameters in one call instead of once per frame.
 """
 
 import math
 
+import numpy as np
+
 
 def linear(t: float) -> float:
     """Linear interpolation (no easing)."""
@@ -232,3 +237,255 @@ EASING_FUNCTIONS.update(
         "overshoot": ease_back_out,  # Alias
     }
 )
+
+
+# Array versions. The polynomial and back curves above have no branches, so
+# they already work on arrays; the others select their pieces with np.where.
+
+
+def frame_progress(num_frames: int) -> np.ndarray:
+    """Return progress t for each frame, from 0.0 at the first to 1.0 at the last."""
+    return np.linspace(0.0, 1.0, num_frames)
+
+
+def ease_in_out_quad_array(t: np.ndarray) -> np.ndarray:
+    """Quadratic ease-in-out for an array of t values."""
+    t = np.asarray(t, dtype=float)
+    return np.where(t < 0.5, 2 * t * t, -1 + (4 - 2 * t) * t)
+
+
+def ease_out_bounce_array(t: np.ndarray) -> np.ndarray:
+    """Bounce ease-out for an array of t values."""
+    t = np.asarray(t, dtype=float)
+    # Each bounce is the same parabola, shifted to its own interval
+    shift = np.where(
+        t < 1 / 2.75,
+        0.0,
+        np.where(t < 2 / 2.75, 1.5 / 2.75, np.where(t < 2.5 / 2.75, 2.25 / 2.75, 2.625 / 2.75)),
+    )
+    offset = np.where(
+        t < 1 / 2.75, 0.0, np.where(t < 2 / 2.75, 0.75, np.where(t < 2.5 / 2.75, 0.9375, 0.984375))
+    )
+    t = t - shift
+    return 7.5625 * t * t + offset
+
+
+def ease_in_bounce_array(t: np.ndarray) -> np.ndarray:
+    """Bounce ease-in for an array of t values."""
+    return 1 - ease_out_bounce_array(1 - np.asarray(t, dtype=float))
+
+
+def ease_in_out_bounce_array(t: np.ndarray) -> np.ndarray:
+    """Bounce ease-in-out for an array of t values."""
+    t = np.asarray(t, dtype=float)
+    return np.where(
+        t < 0.5,
+        ease_in_bounce_array(t * 2) * 0.5,
+        ease_out_bounce_array(t * 2 - 1) * 0.5 + 0.5,
+    )
+
+
+def ease_in_elastic_array(t: np.ndarray) -> np.ndarray:
+    """Elastic ease-in for an array of t values."""
+    t = np.asarray(t, dtype=float)
+    eased = -np.power(2, 10 * (t - 1)) * np.sin((t - 1.1) * 5 * np.pi)
+    return np.where((t == 0) | (t == 1), t, eased)
+
+
+def ease_out_elastic_array(t: np.ndarray) -> np.ndarray:
+    """Elastic ease-out for an array of t values."""
+    t = np.asarray(t, dtype=float)
+    eased = np.power(2, -10 * t) * np.sin((t - 0.1) * 5 * np.pi) + 1
+    return np.where((t == 0) | (t == 1), t, eased)
+
+
+def ease_in_out_elastic_array(t: np.ndarray) -> np.ndarray:
+    """Elastic ease-in-out for an array of t values."""
+    t = np.asarray(t, dtype=float)
+    u = t * 2 - 1
+    wave = np.sin((u - 0.1) * 5 * np.pi)
+    eased = np.where(
+        u < 0,
+        -0.5 * np.power(2, 10 * u) * wave,
+        np.power(2, -10 * u) * wave * 0.5 + 1,
+    )
+    return np.where((t == 0) | (t == 1), t, eased)
+
+
+def ease_back_in_out_array(t: np.ndarray) -> np.ndarray:
+    """Back ease-in-out for an array of t values."""
+    t = np.asarray(t, dtype=float)
+    c2 = 1.70158 * 1.525
+    return np.where(
+        t < 0.5,
+        ((2 * t) ** 2 * ((c2 + 1) * 2 * t - c2)) / 2,
+        ((2 * t - 2) ** 2 * ((c2 + 1) * (t * 2 - 2) + c2) + 2) / 2,
+    )
+
+
+ARRAY_EASING_FUNCTIONS = {
+    **EASING_FUNCTIONS,
+    "ease_in_out": ease_in_out_quad_array,
+    "bounce_in": ease_in_bounce_array,
+    "bounce_out": ease_out_bounce_array,
+    "bounce": ease_in_out_bounce_array,
+    "elastic_in": ease_in_elastic_array,
+    "elastic_out": ease_out_elastic_array,
+    "elastic": ease_in_out_elastic_array,
+    "back_in_out": ease_back_in_out_array,
+}
+
+
+def get_easing_array(name: str = "linear"):
+    """Get the array version of an easing function by name."""
+    return ARRAY_EASING_FUNCTIONS.get(name, linear)
+
+
+def interpolate_array(start, end, t: np.ndarray, easing: str = "linear") -> np.ndarray:
+    """
+    Interpolate between two values with easing for an array of t values.
+
+    Args:
+        start: Start value, or a tuple such as an (x, y) position
+        end: End value, same shape as start
+        t: Array of progress values from 0.0 to 1.0 (e.g. frame_progress(n))
+        easing: Name of easing function
+
+    Returns:
+        Array of shape t.shape, or t.shape + (len(start),) for tuples
+    """
+    eased_t = np.asarray(get_easing_array(easing)(np.asarray(t, dtype=float)), dtype=float)
+    start = np.asarray(start, dtype=float)
+    end = np.asarray(end, dtype=float)
+    return start + (end - start) * eased_t.reshape(eased_t.shape + (1,) * start.ndim)
+
+
+def apply_squash_stretch_array(
+    base_scale: tuple[float, float], intensity: np.ndarray, direction: str = "vertical"
+) -> np.ndarray:
+    """
+    Calculate squash and stretch scales for an array of intensities.
+
+    Args:
+        base_scale: (width_scale, height_scale) base scales
+        intensity: Array of squash/stretch intensities (0.0-1.0)
+        direction: 'vertical', 'horizontal', or 'both'
+
+    Returns:
+        (N, 2) array of (width_scale, height_scale)
+    """
+    intensity = np.asarray(intensity, dtype=float)
+    factors = {
+        "vertical": (1 + intensity * 0.5, 1 - intensity * 0.5),
+        "horizontal": (1 - intensity * 0.5, 1 + intensity * 0.5),
+        "both": (1 - intensity * 0.3, 1 - intensity * 0.3),
+    }
+    width_factor, height_factor = factors.get(
+        direction, (np.ones_like(intensity), np.ones_like(intensity))
+    )
+    return np.stack([width_factor, height_factor], axis=-1) * np.asarray(base_scale, dtype=float)
+
+
+def calculate_arc_motion_array(
+    start: tuple[float, float], end: tuple[float, float], height: float, t: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate positions along a parabolic arc for an array of t values.
+
+    Args:
+        start: (x, y) starting position
+        end: (x, y) ending position
+        height: Arc height at midpoint (positive = upward)
+        t: Array of progress values (0.0-1.0)
+
+    Returns:
+        (N, 2) array of (x, y) positions
+    """
+    positions = interpolate_array(start, end, t)
+    t = np.asarray(t, dtype=float)
+    positions[..., 1] -= 4 * height * t * (1 - t)
+    return positions
+
+
+class Timeline:
+    """
+    Keyframed animation tracks, precomputed for every frame.
+
+    Each track interpolates between keyframes given as (frame, value) or
+    (frame, value, easing), where the easing applies to the segment that
+    ends at that keyframe. Values can be numbers (scale, rotation) or tuples
+    (positions, colors). Before the first and after the last keyframe the
+    track holds its value.
+
+    Example:
+        timeline = Timeline(30)
+        timeline.add_track("position", [(0, (50, 400)), (20, (240, 240), "ease_out")])
+        timeline.add_track("rotation", [(0, 0), (29, 360, "ease_in_out")])
+        for i, params in enumerate(timeline):
+            ...  # params["position"], params["rotation"]
+    """
+
+    def __init__(self, num_frames: int):
+        """
+        Args:
+            num_frames: Number of frames in the animation
+        """
+        self.num_frames = num_frames
+        self.tracks: dict[str, np.ndarray] = {}
+
+    def add_track(self, name: str, keyframes: list[tuple], easing: str = "linear") -> "Timeline":
+        """
+        Add a track and compute its value for every frame.
+
+        Args:
+            name: Track name (e.g. 'position', 'scale', 'rotation')
+            keyframes: (frame, value) or (frame, value, easing) tuples
+            easing: Easing for keyframes that don't name their own
+
+        Returns:
+            self, for chaining
+        """
+        if not keyframes:
+            raise ValueError(f"Track '{name}' needs at least one keyframe")
+        keyframes = sorted(keyframes, key=lambda keyframe: keyframe[0])
+
+        frames = np.arange(self.num_frames)
+        first_value = np.asarray(keyframes[0][1], dtype=float)
+        values = np.empty((self.num_frames,) + first_value.shape)
+        values[...] = first_value
+
+        for previous, keyframe in zip(keyframes, keyframes[1:]):
+            start_frame, start_value = previous[0], previous[1]
+            end_frame, end_value = keyframe[0], keyframe[1]
+            segment_easing = keyframe[2] if len(keyframe) > 2 else easing
+            span = slice(max(start_frame, 0), min(end_frame, self.num_frames - 1) + 1)
+            if end_frame == start_frame or span.start >= span.stop:
+                continue
+            t = (frames[span] - start_frame) / (end_frame - start_frame)
+            values[span] = interpolate_array(start_value, end_value, t, segment_easing)
+
+        last_frame = keyframes[-1][0]
+        if last_frame < self.num_frames:
+            values[max(last_frame, 0) :] = np.asarray(keyframes[-1][1], dtype=float)
+
+        self.tracks[name] = values
+        return self
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Return a track's values for all frames."""
+        return self.tracks[name]
+
+    def frame(self, index: int) -> dict:
+        """Return every track's value at one frame, as floats or tuples."""
+        params = {}
+        for name, values in self.tracks.items():
+            value = values[index]
+            params[name] = float(value) if value.ndim == 0 else tuple(value.tolist())
+        return params
+
+    def __len__(self) -> int:
+        return self.num_frames
+
+    def __iter__(self):
+        for index in range(self.num_frames):
+            yield self.frame(index)
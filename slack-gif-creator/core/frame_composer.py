@@ -4,8 +4,22 @@ Frame Composer - Utilities for composing visual elements into frames.
 
 Provides functions for drawing shapes, text, emojis, and compositing elements
 together to create animation frames.
+
+Frames can be PIL Images or (H, W, 3) uint8 NumPy arrays. For arrays, shapes
+and text are rasterized once into cached RGBA sprites and alpha-blended onto
+the frame, and gradients are built by broadcasting and cached, so per-frame
+work is a few array operations and GIFBuilder.add_frame needs no conversion:
+
+    background = gradient_array(480, 480, (20, 20, 60), (90, 30, 120))
+    for i in range(60):
+        frame = background.copy()
+        draw_circle(frame, (40 + i * 6, 240), 30, fill_color=(255, 200, 0))
+        draw_text(frame, "Hello", (240, 60), color=(255, 255, 255), centered=True)
+        builder.add_frame(frame)
 """
 
+import math
+from functools import lru_cache
 from typing import Optional
 
 import numpy as np
@@ -29,19 +43,89 @@ def create_blank_frame(
     return Image.new("RGB", (width, height), color)
 
 
+def _readonly(array: np.ndarray) -> np.ndarray:
+    """Mark a cached array read-only so callers can't change it by accident."""
+    array.setflags(write=False)
+    return array
+
+
+def blit(
+    frame: np.ndarray, sprite: np.ndarray, position: tuple[int, int]
+) -> np.ndarray:
+    """
+    Alpha-blend a sprite onto a frame array in place.
+
+    Args:
+        frame: (H, W, 3) uint8 frame to draw on
+        sprite: (h, w, 4) uint8 RGBA sprite, or (h, w, 3) RGB to copy as-is
+        position: (x, y) of the sprite's top-left corner; may be partly or
+            entirely outside the frame
+
+    Returns:
+        Modified frame
+    """
+    x, y = int(position[0]), int(position[1])
+    sprite_height, sprite_width = sprite.shape[:2]
+    frame_height, frame_width = frame.shape[:2]
+    left, top = max(x, 0), max(y, 0)
+    right = min(x + sprite_width, frame_width)
+    bottom = min(y + sprite_height, frame_height)
+    if left >= right or top >= bottom:
+        return frame
+
+    source = sprite[top - y : bottom - y, left - x : right - x]
+    target = frame[top:bottom, left:right]
+    if source.shape[2] == 3:
+        target[...] = source
+        return frame
+
+    alpha = source[..., 3:]
+    if alpha.min() == 255:
+        target[...] = source[..., :3]
+        return frame
+    alpha = alpha.astype(np.uint16)
+    blended = source[..., :3] * alpha + target * (255 - alpha) + 127
+    target[...] = blended // 255
+    return frame
+
+
+@lru_cache(maxsize=256)
+def circle_sprite(
+    radius: int,
+    fill_color: Optional[tuple[int, int, int]] = None,
+    outline_color: Optional[tuple[int, int, int]] = None,
+    outline_width: int = 1,
+) -> np.ndarray:
+    """
+    Rasterize a circle once into a cached (2r+1, 2r+1, 4) RGBA sprite.
+
+    Blit it at (x - radius, y - radius) to center it on (x, y).
+    """
+    size = 2 * radius + 1
+    sprite = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    ImageDraw.Draw(sprite).ellipse(
+        [0, 0, 2 * radius, 2 * radius],
+        fill=fill_color,
+        outline=outline_color,
+        width=outline_width,
+    )
+    return _readonly(np.array(sprite))
+
+
 def draw_circle(
-    frame: Image.Image,
+    frame: Image.Image | np.ndarray,
     center: tuple[int, int],
     radius: int,
     fill_color: Optional[tuple[int, int, int]] = None,
     outline_color: Optional[tuple[int, int, int]] = None,
     outline_width: int = 1,
-) -> Image.Image:
+) -> Image.Image | np.ndarray:
     """
     Draw a circle on a frame.
 
     Args:
-        frame: PIL Image to draw on
+        frame: PIL Image or (H, W, 3) uint8 array to draw on (arrays get a
+            cached sprite blended in)
         center: (x, y) center position
         radius: Circle radius
         fill_color: RGB fill color (None for no fill)
@@ -51,6 +135,16 @@ def draw_circle(
     Returns:
         Modified frame
     """
+    if isinstance(frame, np.ndarray):
+        sprite = circle_sprite(
+            int(radius),
+            _color(fill_color),
+            _color(outline_color),
+            outline_width,
+        )
+        x, y = center
+        return blit(frame, sprite, (round(x) - int(radius), round(y) - int(radius)))
+
     draw = ImageDraw.Draw(frame)
     x, y = center
     bbox = [x - radius, y - radius, x + radius, y + radius]
@@ -58,18 +152,38 @@ def draw_circle(
     return frame
 
 
+@lru_cache(maxsize=256)
+def text_sprite(
+    text: str, color: tuple[int, int, int] = (0, 0, 0)
+) -> tuple[np.ndarray, tuple[int, int, int, int]]:
+    """
+    Rasterize text once in Pillow's default font into a cached RGBA sprite.
+
+    Returns:
+        Tuple of (h, w, 4) RGBA sprite and the text's bounding box relative
+        to the drawing position, as given by ImageDraw.textbbox
+    """
+    font = ImageFont.load_default()
+    bbox = ImageDraw.Draw(Image.new("L", (1, 1))).textbbox((0, 0), text, font=font)
+    width, height = max(bbox[2] - bbox[0], 1), max(bbox[3] - bbox[1], 1)
+    sprite = Image.new("RGBA", (width, height), (*color, 0))
+    ImageDraw.Draw(sprite).text((-bbox[0], -bbox[1]), text, fill=color, font=font)
+    return _readonly(np.array(sprite)), bbox
+
+
 def draw_text(
-    frame: Image.Image,
+    frame: Image.Image | np.ndarray,
     text: str,
     position: tuple[int, int],
     color: tuple[int, int, int] = (0, 0, 0),
     centered: bool = False,
-) -> Image.Image:
+) -> Image.Image | np.ndarray:
     """
     Draw text on a frame.
 
     Args:
-        frame: PIL Image to draw on
+        frame: PIL Image or (H, W, 3) uint8 array to draw on (arrays get a
+            cached text bitmap blended in)
         text: Text to draw
         position: (x, y) position (top-left unless centered=True)
         color: RGB text color
@@ -78,6 +192,14 @@ def draw_text(
     Returns:
         Modified frame
     """
+    if isinstance(frame, np.ndarray):
+        sprite, bbox = text_sprite(text, _color(color))
+        x, y = position
+        if centered:
+            x -= (bbox[2] - bbox[0]) // 2
+            y -= (bbox[3] - bbox[1]) // 2
+        return blit(frame, sprite, (x + bbox[0], y + bbox[1]))
+
     draw = ImageDraw.Draw(frame)
 
     # Uses Pillow's default font.
@@ -96,6 +218,36 @@ def draw_text(
     return frame
 
 
+@lru_cache(maxsize=32)
+def gradient_array(
+    width: int,
+    height: int,
+    top_color: tuple[int, int, int],
+    bottom_color: tuple[int, int, int],
+) -> np.ndarray:
+    """
+    Create a vertical gradient as a cached, read-only (H, W, 3) uint8 array.
+
+    Repeated calls with the same size and colors return the same array;
+    use .copy() to get a frame to draw on.
+
+    Args:
+        width: Frame width
+        height: Frame height
+        top_color: RGB color at top
+        bottom_color: RGB color at bottom
+
+    Returns:
+        Read-only gradient array
+    """
+    # Interpolate each row's color, then broadcast the column across the width
+    ratio = (np.arange(height) / height)[:, None]
+    rows = np.asarray(top_color) * (1 - ratio) + np.asarray(bottom_color) * ratio
+    rows = rows.astype(np.uint8)
+    frame = np.broadcast_to(rows[:, None, :], (height, width, 3))
+    return _readonly(np.ascontiguousarray(frame))
+
+
 def create_gradient_background(
     width: int,
     height: int,
@@ -114,39 +266,61 @@ def create_gradient_background(
     Returns:
         PIL Image with gradient
     """
-    frame = Image.new("RGB", (width, height))
-    draw = ImageDraw.Draw(frame)
+    return Image.fromarray(
+        gradient_array(width, height, _color(top_color), _color(bottom_color))
+    )
 
-    # Calculate color step for each row
-    r1, g1, b1 = top_color
-    r2, g2, b2 = bottom_color
 
-    for y in range(height):
-        # Interpolate color
-        ratio = y / height
-        r = int(r1 * (1 - ratio) + r2 * ratio)
-        g = int(g1 * (1 - ratio) + g2 * ratio)
-        b = int(b1 * (1 - ratio) + b2 * ratio)
+def _star_points(x: float, y: float, size: float) -> list[tuple[float, float]]:
+    """Return the 10 corner points of a 5-pointed star centered on (x, y)."""
+    points = []
+    for i in range(10):
+        angle = (i * 36 - 90) * math.pi / 180  # 36 degrees per point, start at top
+        radius = size if i % 2 == 0 else size * 0.4  # Alternate between outer and inner
+        px = x + radius * math.cos(angle)
+        py = y + radius * math.sin(angle)
+        points.append((px, py))
+    return points
 
-        # Draw horizontal line
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
 
-    return frame
+@lru_cache(maxsize=256)
+def star_sprite(
+    size: int,
+    fill_color: tuple[int, int, int],
+    outline_color: Optional[tuple[int, int, int]] = None,
+    outline_width: int = 1,
+) -> np.ndarray:
+    """
+    Rasterize a 5-pointed star once into a cached RGBA sprite.
+
+    The star is centered in the sprite; blit it at (x - w // 2, y - h // 2)
+    to center it on (x, y).
+    """
+    half = size + outline_width
+    sprite = Image.new("RGBA", (2 * half + 1, 2 * half + 1), (0, 0, 0, 0))
+    ImageDraw.Draw(sprite).polygon(
+        _star_points(half, half, size),
+        fill=fill_color,
+        outline=outline_color,
+        width=outline_width,
+    )
+    return _readonly(np.array(sprite))
 
 
 def draw_star(
-    frame: Image.Image,
+    frame: Image.Image | np.ndarray,
     center: tuple[int, int],
     size: int,
     fill_color: tuple[int, int, int],
     outline_color: Optional[tuple[int, int, int]] = None,
     outline_width: int = 1,
-) -> Image.Image:
+) -> Image.Image | np.ndarray:
     """
     Draw a 5-pointed star.
 
     Args:
-        frame: PIL Image to draw on
+        frame: PIL Image or (H, W, 3) uint8 array to draw on (arrays get a
+            cached sprite blended in)
         center: (x, y) center position
         size: Star size (outer radius)
         fill_color: RGB fill color
@@ -156,21 +330,27 @@ def draw_star(
     Returns:
         Modified frame
     """
-    import math
-
-    draw = ImageDraw.Draw(frame)
     x, y = center
+    if isinstance(frame, np.ndarray):
+        sprite = star_sprite(
+            int(size), _color(fill_color), _color(outline_color), outline_width
+        )
+        half = sprite.shape[0] // 2
+        return blit(frame, sprite, (round(x) - half, round(y) - half))
 
-    # Calculate star points
-    points = []
-    for i in range(10):
-        angle = (i * 36 - 90) * math.pi / 180  # 36 degrees per point, start at top
-        radius = size if i % 2 == 0 else size * 0.4  # Alternate between outer and inner
-        px = x + radius * math.cos(angle)
-        py = y + radius * math.sin(angle)
-        points.append((px, py))
+    draw = ImageDraw.Draw(frame)
 
     # Draw star
-    draw.polygon(points, fill=fill_color, outline=outline_color, width=outline_width)
+    draw.polygon(
+        _star_points(x, y, size),
+        fill=fill_color,
+        outline=outline_color,
+        width=outline_width,
+    )
 
     return frame
+
+
+def _color(color) -> Optional[tuple[int, ...]]:
+    """Normalize a color to a hashable tuple for the sprite caches."""
+    return None if color is None else tuple(int(c) for c in color)
@@ -9,15 +9,39 @@ generated frames, with automatic optimization for Slack's requirements.
 from pathlib import Path
 from typing import Optional
 
-import imageio.v3 as imageio
 import numpy as np
 from PIL import Image
 
+from core.gif_writer import GIFWriter
+from core.palette import build_lut, cached_palette, get_palette, map_frames
 
-class GIFBuilder:
-    """Builder for creating optimized GIFs from frames."""
 
-    def __init__(self, width: int = 480, height: int = 480, fps: int = 15):
+class GIFBuilder:
+    """Builder for creating optimized GIFs from frames.
+
+    By default frames are kept as a list of separate arrays. Pass max_frames
+    to store them in one preallocated (max_frames, height, width, 3) uint8
+    buffer instead: frames are written into it in place, resized straight
+    into their slot, and save() quantizes the buffer in place, so memory use
+    is fixed up front. Quantizing in place is destructive: after save() the
+    buffer holds the quantized (dithered) colors, not the original frames.
+    Pass save(keep_frames=True) to keep them, at the cost of a separate
+    (N, H, W) array of palette indices.
+
+    Peak memory for 600 frames at 480x480 (measured with tracemalloc, save
+    with remove_duplicates=True):
+    - max_frames=600: 396 MiB buffer, save peaks at 423 MiB
+    - list of frames: 396 MiB of frames, save peaks at 536 MiB (the frames
+      plus a separate (N, H, W) array of palette indices)
+    """
+
+    def __init__(
+        self,
+        width: int = 480,
+        height: int = 480,
+        fps: int = 15,
+        max_frames: int | None = None,
+    ):
         """
         Initialize GIF builder.
 
@@ -25,19 +49,86 @@ class GIFBuilder:
             width: Frame width in pixels
             height: Frame height in pixels
             fps: Frames per second
+            max_frames: Preallocate a contiguous buffer for this many frames
+                (adding more raises ValueError). Default: grow a list as needed.
         """
         self.width = width
         self.height = height
         self.fps = fps
-        self.frames: list[np.ndarray] = []
+        self._frames: list[np.ndarray] = []
+        self._buffer: np.ndarray | None = None
+        self._count = 0
+        # Set once save() has quantized the buffer in place
+        self._quantized = False
+        if max_frames is not None:
+            self._buffer = np.empty((max_frames, height, width, 3), dtype=np.uint8)
+        # Per-frame display time in ms; None means 1000 / fps
+        self.durations: list[float | None] = []
+
+    @property
+    def frames(self) -> list[np.ndarray] | np.ndarray:
+        """The frames added so far (an (N, H, W, 3) view when preallocated)."""
+        if self._buffer is None:
+            return self._frames
+        return self._buffer[: self._count]
+
+    @frames.setter
+    def frames(self, frames: list[np.ndarray]):
+        self.clear()
+        self.add_frames(frames)
+
+    def _next_slot(self) -> np.ndarray:
+        """Return the buffer slot for the next frame."""
+        if self._count >= len(self._buffer):
+            raise ValueError(
+                f"Frame buffer is full ({len(self._buffer)} frames); increase max_frames"
+            )
+        self._count += 1
+        return self._buffer[self._count - 1]
+
+    def _keep(self, indices: list[int]):
+        """Keep only the frames at the given increasing indices, in place."""
+        if self._buffer is None:
+            self._frames = [self._frames[i] for i in indices]
+            return
+        for dst, src in enumerate(indices):
+            # Indices increase, so src >= dst and sources are never overwritten early
+            if src != dst:
+                self._buffer[dst] = self._buffer[src]
+        self._count = len(indices)
+
+    def _resize_all(self, width: int, height: int):
+        """Resize every frame, e.g. to emoji size."""
+        if self._buffer is None:
+            self._frames = [
+                np.array(
+                    Image.fromarray(frame).resize((width, height), Image.Resampling.LANCZOS)
+                )
+                for frame in self._frames
+            ]
+        else:
+            resized = np.empty((len(self._buffer), height, width, 3), dtype=np.uint8)
+            for i in range(self._count):
+                resized[i] = Image.fromarray(self._buffer[i]).resize(
+                    (width, height), Image.Resampling.LANCZOS
+                )
+            self._buffer = resized
+        self.width = width
+        self.height = height
 
-    def add_frame(self, frame: np.ndarray | Image.Image):
+    def add_frame(self, frame: np.ndarray | Image.Image, duration: float | None = None):
         """
         Add a frame to the GIF.
 
         Args:
             frame: Frame as numpy array or PIL Image (will be converted to RGB)
+            duration: How long to show this frame in milliseconds (default: 1000 / fps)
         """
+        if self._buffer is not None:
+            self._write_frame(self._next_slot(), frame)
+            self.durations.append(duration)
+            return
+
         if isinstance(frame, Image.Image):
             frame = np.array(frame.convert("RGB"))
 
@@ -49,120 +140,310 @@ class GIFBuilder:
             )
             frame = np.array(pil_frame)
 
-        self.frames.append(frame)
+        self._frames.append(frame)
+        self.durations.append(duration)
+
+    def _write_frame(self, slot: np.ndarray, frame: np.ndarray | Image.Image):
+        """Convert and resize a frame directly into a buffer slot."""
+        if isinstance(frame, np.ndarray):
+            if frame.dtype == np.uint8 and frame.shape == slot.shape:
+                slot[...] = frame
+                return
+            frame = Image.fromarray(frame)
+        if frame.mode != "RGB":
+            frame = frame.convert("RGB")
+        if frame.size != (self.width, self.height):
+            frame = frame.resize((self.width, self.height), Image.Resampling.LANCZOS)
+        slot[...] = frame
+
+    def add_frames(
+        self,
+        frames: list[np.ndarray | Image.Image] | np.ndarray,
+        duration: float | None = None,
+    ):
+        """
+        Add multiple frames at once.
+
+        Args:
+            frames: List of frames, or an (N, H, W, 3) uint8 array of frames
+            duration: Display time of each frame in milliseconds (default: 1000 / fps)
+        """
+        if (
+            self._buffer is not None
+            and isinstance(frames, np.ndarray)
+            and frames.dtype == np.uint8
+            and frames.shape[1:] == self._buffer.shape[1:]
+        ):
+            # Already the right size: copy the whole batch in one go
+            if self._count + len(frames) > len(self._buffer):
+                raise ValueError(
+                    f"Frame buffer is full ({len(self._buffer)} frames); increase max_frames"
+                )
+            self._buffer[self._count : self._count + len(frames)] = frames
+            self._count += len(frames)
+            self.durations.extend([duration] * len(frames))
+            return
 
-    def add_frames(self, frames: list[np.ndarray | Image.Image]):
-        """Add multiple frames at once."""
         for frame in frames:
-            self.add_frame(frame)
+            self.add_frame(frame, duration)
+
+    def quantize_frames(
+        self,
+        num_colors: int = 128,
+        palette_key: str | None = None,
+        palette_cache_dir: str | Path | None = None,
+        dither: bool = True,
+        in_place: bool = False,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Map all frames to one global palette.
+
+        The palette is built with k-means from a stratified pixel sample of all
+        frames, and frames are mapped through a 32x32x32 lookup table.
+
+        Args:
+            num_colors: Target number of colors (8-256)
+            palette_key: Reuse the palette cached under this theme key (built
+                from these frames the first time)
+            palette_cache_dir: Also persist keyed palettes in this directory
+            dither: Apply ordered dithering to soften banding in gradients
+            in_place: With a preallocated buffer, write the indices into the
+                start of the buffer instead of a new array. This destroys the
+                frames; expand_quantized_frames() turns the buffer back into
+                RGB frames, but with the quantized colors.
+
+        Returns:
+            Tuple of (N, H, W) uint8 palette indices and (K, 3) uint8 palette
+        """
+        palette, lut = get_palette(
+            self.frames, num_colors, key=palette_key, cache_dir=palette_cache_dir
+        )
+        out = None
+        if in_place and self._buffer is not None:
+            # Indices for frame i land inside frame i // 3, already mapped
+            size = self._count * self.height * self.width
+            out = self._buffer.reshape(-1)[:size].reshape(
+                self._count, self.height, self.width
+            )
+        return map_frames(self.frames, palette, lut, dither=dither, out=out), palette
+
+    def expand_quantized_frames(self, palette: np.ndarray):
+        """
+        Expand indices written by quantize_frames(in_place=True) to RGB frames.
+
+        Lossy: each frame becomes palette[indices], i.e. its quantized and
+        dithered colors. The original frames can't be recovered.
+        """
+        size = self._count * self.height * self.width
+        indices = self._buffer.reshape(-1)[:size].reshape(
+            self._count, self.height, self.width
+        )
+        # Backwards: frame i's slot holds indices 3i..3i+2, expanded already,
+        # and indices[i] lives in frame i // 3's slot, not yet overwritten
+        for i in reversed(range(self._count)):
+            self._buffer[i] = palette[indices[i]]
 
     def optimize_colors(
-        self, num_colors: int = 128, use_global_palette: bool = True
-    ) -> list[np.ndarray]:
+        self,
+        num_colors: int = 128,
+        use_global_palette: bool = True,
+        in_place: bool = False,
+    ) -> list[np.ndarray] | np.ndarray:
         """
         Reduce colors in all frames using quantization.
 
         Args:
             num_colors: Target number of colors (8-256)
             use_global_palette: Use a single palette for all frames (better compression)
+            in_place: Overwrite the builder's frames instead of returning copies
 
         Returns:
-            List of color-optimized frames
+            List of color-optimized frames (the builder's own frames if in_place)
         """
-        optimized = []
+        optimized = self.frames if in_place else []
 
         if use_global_palette and len(self.frames) > 1:
-            # Create a global palette from all frames
-            # Sample frames to build palette
-            sample_size = min(5, len(self.frames))
-            sample_indices = [
-                int(i * len(self.frames) / sample_size) for i in range(sample_size)
-            ]
-            sample_frames = [self.frames[i] for i in sample_indices]
-
-            # Combine sample frames into a single image for palette generation
-            # Flatten each frame to get all pixels, then stack them
-            all_pixels = np.vstack(
-                [f.reshape(-1, 3) for f in sample_frames]
-            )  # (total_pixels, 3)
-
-            # Create a properly-shaped RGB image from the pixel data
-            # We'll make a roughly square image from all the pixels
-            total_pixels = len(all_pixels)
-            width = min(512, int(np.sqrt(total_pixels)))  # Reasonable width, max 512
-            height = (total_pixels + width - 1) // width  # Ceiling division
-
-            # Pad if necessary to fill the rectangle
-            pixels_needed = width * height
-            if pixels_needed > total_pixels:
-                padding = np.zeros((pixels_needed - total_pixels, 3), dtype=np.uint8)
-                all_pixels = np.vstack([all_pixels, padding])
-
-            # Reshape to proper RGB image format (H, W, 3)
-            img_array = (
-                all_pixels[:pixels_needed].reshape(height, width, 3).astype(np.uint8)
-            )
-            combined_img = Image.fromarray(img_array, mode="RGB")
-
-            # Generate global palette
-            global_palette = combined_img.quantize(colors=num_colors, method=2)
-
-            # Apply global palette to all frames
-            for frame in self.frames:
-                pil_frame = Image.fromarray(frame)
-                quantized = pil_frame.quantize(palette=global_palette, dither=1)
-                optimized.append(np.array(quantized.convert("RGB")))
+            indices, palette = self.quantize_frames(num_colors)
+            for i, frame_indices in enumerate(indices):
+                self._store(optimized, i, palette[frame_indices], in_place)
         else:
             # Use per-frame quantization
-            for frame in self.frames:
+            for i, frame in enumerate(self.frames):
                 pil_frame = Image.fromarray(frame)
                 quantized = pil_frame.quantize(colors=num_colors, method=2, dither=1)
-                optimized.append(np.array(quantized.convert("RGB")))
+                self._store(optimized, i, quantized.convert("RGB"), in_place)
 
         return optimized
 
-    def deduplicate_frames(self, threshold: float = 0.9995) -> int:
+    @staticmethod
+    def _store(frames, index: int, image: Image.Image | np.ndarray, in_place: bool):
+        """Write a processed frame back (in place) or append it to a new list."""
+        if not in_place:
+            frames.append(np.asarray(image) if isinstance(image, np.ndarray) else np.array(image))
+        elif isinstance(frames, np.ndarray):
+            frames[index] = image
+        else:
+            frames[index] = np.array(image)
+
+    def frame_durations(self) -> list[float]:
+        """Return the display time of every frame in milliseconds."""
+        default = 1000 / self.fps
+        return [default if d is None else d for d in self.durations]
+
+    @staticmethod
+    def _mean_abs_diff(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Mean absolute difference per frame of two (N, H, W, C) uint8 stacks.
+
+        Computed in uint8 (max - min never wraps), so no float copies of the
+        frames are made.
+        """
+        diff = np.maximum(a, b)
+        diff -= np.minimum(a, b)
+        return diff.reshape(len(diff), -1).mean(axis=1)
+
+    def _neighbor_differences(
+        self, frames: list[np.ndarray] | np.ndarray, chunk: int = 8
+    ) -> np.ndarray:
+        """Mean absolute difference between each frame and the next one."""
+        diffs = np.empty(max(len(frames) - 1, 0))
+        for start in range(0, len(diffs), chunk):
+            stop = min(start + chunk, len(diffs))
+            stack = frames[start : stop + 1]
+            if not isinstance(stack, np.ndarray):
+                stack = np.stack(stack)
+            diffs[start:stop] = self._mean_abs_diff(stack[:-1], stack[1:])
+        return diffs
+
+    @staticmethod
+    def _thumbnails(frames: list[np.ndarray], size: int) -> list[np.ndarray]:
+        """Box-downsample frames; each pixel is the mean of the pixels it covers."""
+        return [
+            np.asarray(Image.fromarray(f).resize((size, size), Image.Resampling.BOX))
+            for f in frames
+        ]
+
+    @staticmethod
+    def _perceptual_hashes(frames: list[np.ndarray]) -> np.ndarray:
+        """64-bit difference hash (dHash) of each frame, as (N, 64) booleans."""
+        small = np.stack(
+            [
+                np.asarray(
+                    Image.fromarray(f).convert("L").resize((9, 8), Image.Resampling.BOX),
+                    dtype=np.int16,
+                )
+                for f in frames
+            ]
+        )
+        return (small[:, :, 1:] > small[:, :, :-1]).reshape(len(frames), -1)
+
+    def deduplicate_frames(
+        self,
+        threshold: float = 0.9995,
+        prefilter: str | None = None,
+        thumbnail_size: int = 32,
+    ) -> int:
         """
         Remove duplicate or near-duplicate consecutive frames.
 
+        Each frame is compared with the last kept frame. The display time of a
+        removed frame is added to the kept frame, so the animation's timing is
+        unchanged.
+
         Args:
             threshold: Similarity threshold (0.0-1.0). Higher = more strict (0.9995 = nearly identical).
                       Use 0.9995+ to preserve subtle animations, 0.98 for aggressive removal.
+            prefilter: Cheap comparison run first to skip full-size comparisons:
+                      "thumbnail" compares box-downsampled frames; frames that already
+                      differ there are kept without a full comparison (same result as
+                      no prefilter). "hash" keeps frames whose perceptual hashes differ
+                      and only compares frames with equal hashes at full size (fastest,
+                      but may keep a few frames the full comparison would remove).
+            thumbnail_size: Side length of the thumbnails used by the "thumbnail" prefilter
 
         Returns:
             Number of frames removed
         """
+        if prefilter not in (None, "thumbnail", "hash"):
+            raise ValueError(f"Unknown prefilter: {prefilter!r}")
         if len(self.frames) < 2:
             return 0
 
-        deduplicated = [self.frames[0]]
-        removed_count = 0
-
-        for i in range(1, len(self.frames)):
-            # Compare with previous frame
-            prev_frame = np.array(deduplicated[-1], dtype=np.float32)
-            curr_frame = np.array(self.frames[i], dtype=np.float32)
-
-            # Calculate similarity (normalized)
-            diff = np.abs(prev_frame - curr_frame)
-            similarity = 1.0 - (np.mean(diff) / 255.0)
+        frames = self.frames
+        # Mean absolute difference (0-255) up to which frames count as duplicates
+        max_diff = (1.0 - threshold) * 255.0
+
+        # Compare every frame with its predecessor in one vectorized pass. The
+        # predecessor is the last kept frame unless it was removed itself.
+        if prefilter == "thumbnail":
+            # A thumbnail's mean difference never exceeds the full-size one, so
+            # frames that differ as thumbnails certainly differ at full size
+            thumbs = self._thumbnails(frames, thumbnail_size)
+            neighbor_differs = self._neighbor_differences(thumbs) > max_diff
+        elif prefilter == "hash":
+            hashes = self._perceptual_hashes(frames)
+            neighbor_differs = (hashes[1:] != hashes[:-1]).any(axis=1)
+        else:
+            neighbor_duplicate = self._neighbor_differences(frames) <= max_diff
+
+        def is_duplicate(a: int, b: int) -> bool:
+            if prefilter == "thumbnail":
+                if self._mean_abs_diff(thumbs[a][None], thumbs[b][None])[0] > max_diff:
+                    return False
+            elif prefilter == "hash" and (hashes[a] != hashes[b]).any():
+                return False
+            return self._mean_abs_diff(frames[a][None], frames[b][None])[0] <= max_diff
+
+        durations = self.frame_durations()
+        kept = [0]
+        kept_durations = [durations[0]]
+        for i in range(1, len(frames)):
+            anchor = kept[-1]
+            if anchor != i - 1:
+                duplicate = is_duplicate(anchor, i)
+            elif prefilter is None:
+                duplicate = neighbor_duplicate[i - 1]
+            else:
+                duplicate = not neighbor_differs[i - 1] and is_duplicate(anchor, i)
 
-            # Keep frame if sufficiently different
-            # High threshold (0.9995+) means only remove nearly identical frames
-            if similarity < threshold:
-                deduplicated.append(self.frames[i])
+            if duplicate:
+                # Show the kept frame for as long as the removed one would have been
+                kept_durations[-1] += durations[i]
             else:
-                removed_count += 1
+                kept.append(i)
+                kept_durations.append(durations[i])
 
-        self.frames = deduplicated
+        removed_count = len(frames) - len(kept)
+        self._keep(kept)
+        self.durations = kept_durations
         return removed_count
 
+    def decimate_frames(self, step: int) -> int:
+        """
+        Keep every `step`-th frame, showing each kept frame for the display
+        time of the frames it replaces (so the animation's length is unchanged).
+
+        Returns:
+            Number of frames removed
+        """
+        count = len(self.frames)
+        if step <= 1 or count < 2:
+            return 0
+        durations = self.frame_durations()
+        kept = list(range(0, count, step))
+        self._keep(kept)
+        self.durations = [sum(durations[i : i + step]) for i in kept]
+        return count - len(kept)
+
     def save(
         self,
         output_path: str | Path,
         num_colors: int = 128,
         optimize_for_emoji: bool = False,
         remove_duplicates: bool = False,
+        palette_key: str | None = None,
+        palette_cache_dir: str | Path | None = None,
+        delta: bool = True,
+        keep_frames: bool = False,
     ) -> dict:
         """
         Save frames as optimized GIF for Slack.
@@ -172,13 +453,30 @@ class GIFBuilder:
             num_colors: Number of colors to use (fewer = smaller file)
             optimize_for_emoji: If True, optimize for emoji size (128x128, fewer colors)
             remove_duplicates: If True, remove duplicate consecutive frames (opt-in)
+            palette_key: Theme key; GIFs saved with the same key and num_colors
+                share one cached palette instead of building a new one
+            palette_cache_dir: Also persist keyed palettes in this directory
+            delta: Write only the changed part of each frame, with unchanged
+                pixels transparent (much smaller when little moves). Frames
+                identical to the previous one are merged into it.
+            keep_frames: With a preallocated buffer, quantize into a separate
+                array (width * height bytes per frame) instead of in place, so
+                the frames are unchanged afterwards and can be saved again
+                without further quality loss. No effect without a buffer.
 
         Returns:
             Dictionary with file info (path, size, dimensions, frame_count)
         """
-        if not self.frames:
+        if not len(self.frames):
             raise ValueError("No frames to save. Add frames with add_frame() first.")
 
+        if self._quantized:
+            print(
+                "  Warning: an earlier save() quantized these frames in place; saving "
+                "again re-quantizes the degraded frames. Use save(keep_frames=True) "
+                "to save a max_frames builder more than once."
+            )
+
         output_path = Path(output_path)
 
         # Remove duplicate frames to reduce file size
@@ -186,7 +484,7 @@ class GIFBuilder:
             removed = self.deduplicate_frames(threshold=0.9995)
             if removed > 0:
                 print(
-                    f"  Removed {removed} nearly identical frames (preserved subtle animations)"
+                    f"  Removed {removed} nearly identical frames (preserved subtle animations and timing)"
                 )
 
         # Optimize for emoji if requested
@@ -195,15 +493,7 @@ class GIFBuilder:
                 print(
                     f"  Resizing from {self.width}x{self.height} to 128x128 for emoji"
                 )
-                self.width = 128
-                self.height = 128
-                # Resize all frames
-                resized_frames = []
-                for frame in self.frames:
-                    pil_frame = Image.fromarray(frame)
-                    pil_frame = pil_frame.resize((128, 128), Image.Resampling.LANCZOS)
-                    resized_frames.append(np.array(pil_frame))
-                self.frames = resized_frames
+                self._resize_all(128, 128)
             num_colors = min(num_colors, 48)  # More aggressive color limit for emoji
 
             # More aggressive FPS reduction for emoji
@@ -212,25 +502,67 @@ class GIFBuilder:
                     f"  Reducing frames from {len(self.frames)} to ~12 for emoji size"
                 )
                 # Keep every nth frame to get close to 12 frames
-                keep_every = max(1, len(self.frames) // 12)
-                self.frames = [
-                    self.frames[i] for i in range(0, len(self.frames), keep_every)
-                ]
-
-        # Optimize colors with global palette
-        optimized_frames = self.optimize_colors(num_colors, use_global_palette=True)
+                # (kept frames take over the dropped frames' display time)
+                self.decimate_frames(max(1, len(self.frames) // 12))
 
-        # Calculate frame duration in milliseconds
-        frame_duration = 1000 / self.fps
+        if delta:
+            # One palette index is reserved for transparency
+            num_colors = min(num_colors, 255)
 
-        # Save GIF
-        imageio.imwrite(
+        frame_count = self._encode(
+            output_path, num_colors, palette_key, palette_cache_dir, delta, keep_frames
+        )
+        return self._report(
             output_path,
-            optimized_frames,
-            duration=frame_duration,
-            loop=0,  # Infinite loop
+            frame_count,
+            sum(self.frame_durations()),
+            num_colors,
+            optimize_for_emoji,
         )
 
+    def _encode(
+        self,
+        output,
+        num_colors: int,
+        palette_key: str | None = None,
+        palette_cache_dir: str | Path | None = None,
+        delta: bool = True,
+        keep_frames: bool = False,
+    ) -> int:
+        """Quantize the frames and write them as a GIF to a path or binary file.
+
+        Returns the number of frames written.
+        """
+        # Map frames to a global palette (in place for a preallocated buffer,
+        # unless keep_frames); indexed frames go to the writer as-is
+        in_place = self._buffer is not None and not keep_frames
+        indices, palette = self.quantize_frames(
+            num_colors,
+            palette_key=palette_key,
+            palette_cache_dir=palette_cache_dir,
+            in_place=in_place,
+        )
+        try:
+            with GIFWriter(
+                output, self.width, self.height, palette, loop=0, delta=delta
+            ) as writer:
+                for frame_indices, duration in zip(indices, self.frame_durations()):
+                    writer.add_frame(frame_indices, duration)
+            return writer.frames_written
+        finally:
+            if in_place:
+                self.expand_quantized_frames(palette)
+                self._quantized = True
+
+    def _report(
+        self,
+        output_path: Path,
+        frame_count: int,
+        total_ms: float,
+        num_colors: int,
+        optimize_for_emoji: bool = False,
+    ) -> dict:
+        """Print a summary of a written GIF and return its info dictionary."""
         # Get file info
         file_size_kb = output_path.stat().st_size / 1024
         file_size_mb = file_size_kb / 1024
@@ -240,9 +572,9 @@ class GIFBuilder:
             "size_kb": file_size_kb,
             "size_mb": file_size_mb,
             "dimensions": f"{self.width}x{self.height}",
-            "frame_count": len(optimized_frames),
+            "frame_count": frame_count,
             "fps": self.fps,
-            "duration_seconds": len(optimized_frames) / self.fps,
+            "duration_seconds": total_ms / 1000,
             "colors": num_colors,
         }
 
@@ -251,7 +583,7 @@ class GIFBuilder:
         print(f"  Path: {output_path}")
         print(f"  Size: {file_size_kb:.1f} KB ({file_size_mb:.2f} MB)")
         print(f"  Dimensions: {self.width}x{self.height}")
-        print(f"  Frames: {len(optimized_frames)} @ {self.fps} fps")
+        print(f"  Frames: {frame_count} @ {self.fps} fps")
         print(f"  Duration: {info['duration_seconds']:.1f}s")
         print(f"  Colors: {num_colors}")
 
@@ -264,6 +596,206 @@ class GIFBuilder:
 
         return info
 
+    def open_stream(self, output_path: str | Path, **options) -> "GIFStream":
+        """
+        Start writing a GIF that receives frames as they are produced.
+
+        Frames added to the returned stream are quantized and written right
+        away instead of being kept in the builder. See GIFStream for options.
+
+        Example:
+            with builder.open_stream("out.gif", palette_key="fire") as stream:
+                for i in range(600):
+                    stream.add_frame(render(i))
+        """
+        return GIFStream(self, output_path, **options)
+
     def clear(self):
         """Clear all frames (useful for creating multiple GIFs)."""
-        self.frames = []
+        self._frames = []
+        self._count = 0
+        self._quantized = False
+        self.durations = []
+
+
+class GIFStream:
+    """Quantize and write frames to a GIF as soon as they are added.
+
+    Memory use does not grow with the animation's length: only the warm-up
+    window (until the palette is fixed), the last kept frame (for
+    deduplication) and the writer's previous frame are held.
+
+    Created with GIFBuilder.open_stream(); the builder provides the size and
+    fps. Use as a context manager, or call close() to finish the file.
+    """
+
+    def __init__(
+        self,
+        builder: GIFBuilder,
+        output_path: str | Path,
+        num_colors: int = 128,
+        palette: np.ndarray | None = None,
+        palette_key: str | None = None,
+        palette_cache_dir: str | Path | None = None,
+        warmup_frames: int = 8,
+        remove_duplicates: bool = False,
+        threshold: float = 0.9995,
+        delta: bool = True,
+        dither: bool = True,
+    ):
+        """
+        Args:
+            builder: GIFBuilder providing width, height and fps
+            output_path: Where to write the GIF
+            num_colors: Number of colors to use (fewer = smaller file)
+            palette: Fixed (K, 3) uint8 palette to use for every frame
+            palette_key: Use the palette cached under this theme key, or build
+                it from the warm-up window and cache it under the key
+            palette_cache_dir: Also persist keyed palettes in this directory
+            warmup_frames: Frames to collect before building the palette
+                when none is given or cached
+            remove_duplicates: Merge frames that are nearly identical to the
+                last kept frame into it (their duration is added to it)
+            threshold: Similarity threshold for remove_duplicates (see
+                GIFBuilder.deduplicate_frames)
+            delta: Write only the changed part of each frame
+            dither: Apply ordered dithering when mapping to the palette
+        """
+        self.builder = builder
+        self.output_path = Path(output_path)
+        # One palette index is reserved for transparency with delta encoding
+        self.num_colors = min(num_colors, 255) if delta else num_colors
+        self.palette_key = palette_key
+        self.palette_cache_dir = palette_cache_dir
+        self.warmup_frames = max(1, warmup_frames)
+        self.remove_duplicates = remove_duplicates
+        self.max_diff = (1.0 - threshold) * 255.0
+        self.delta = delta
+        self.dither = dither
+
+        self.closed = False
+        self.frames_added = 0
+        self.frames_removed = 0
+        self.total_ms = 0.0
+        self._warmup: list[list] = []  # [frame, duration] pairs
+        self._last_kept: np.ndarray | None = None
+        self._writer: GIFWriter | None = None
+        self._palette: np.ndarray | None = None
+        self._lut: np.ndarray | None = None
+        self._indices = np.empty((1, builder.height, builder.width), dtype=np.uint8)
+
+        if palette is not None:
+            palette = np.asarray(palette, dtype=np.uint8).reshape(-1, 3)
+            self._start(palette, build_lut(palette))
+        elif palette_key is not None:
+            cached = cached_palette(palette_key, self.num_colors, palette_cache_dir)
+            if cached is not None:
+                self._start(*cached)
+
+    def _start(self, palette: np.ndarray, lut: np.ndarray):
+        """Fix the palette and open the output file."""
+        self._palette = palette
+        self._lut = lut
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._writer = GIFWriter(
+            self.output_path,
+            self.builder.width,
+            self.builder.height,
+            palette,
+            loop=0,
+            delta=self.delta,
+        )
+
+    def _start_from_warmup(self):
+        """Build the palette from the warm-up frames and write them."""
+        frames = [frame for frame, _ in self._warmup]
+        self._start(
+            *get_palette(
+                frames,
+                self.num_colors,
+                key=self.palette_key,
+                cache_dir=self.palette_cache_dir,
+            )
+        )
+        for frame, duration in self._warmup:
+            self._write(frame, duration)
+        self._warmup = []
+
+    def _write(self, frame: np.ndarray, duration: float):
+        indices = map_frames(
+            [frame], self._palette, self._lut, dither=self.dither, out=self._indices
+        )
+        self._writer.add_frame(indices[0], duration)
+
+    def add_frame(self, frame: np.ndarray | Image.Image, duration: float | None = None):
+        """
+        Quantize a frame and write it to the GIF.
+
+        Args:
+            frame: Frame as numpy array or PIL Image (converted and resized like
+                GIFBuilder.add_frame)
+            duration: How long to show this frame in milliseconds (default: 1000 / fps)
+        """
+        if self.closed:
+            raise ValueError("Stream is closed")
+        if duration is None:
+            duration = 1000 / self.builder.fps
+        rgb = np.empty((self.builder.height, self.builder.width, 3), dtype=np.uint8)
+        self.builder._write_frame(rgb, frame)
+        self.frames_added += 1
+        self.total_ms += duration
+
+        if self.remove_duplicates and self._last_kept is not None:
+            diff = GIFBuilder._mean_abs_diff(self._last_kept[None], rgb[None])[0]
+            if diff <= self.max_diff:
+                # Show the kept frame for as long as this one would have been
+                self.frames_removed += 1
+                if self._writer is None:
+                    self._warmup[-1][1] += duration
+                else:
+                    self._writer.extend_last_frame(duration)
+                return
+        self._last_kept = rgb
+
+        if self._writer is None:
+            self._warmup.append([rgb, duration])
+            if len(self._warmup) >= self.warmup_frames:
+                self._start_from_warmup()
+        else:
+            self._write(rgb, duration)
+
+    def add_frames(
+        self, frames: list[np.ndarray | Image.Image], duration: float | None = None
+    ):
+        """Add multiple frames at once."""
+        for frame in frames:
+            self.add_frame(frame, duration)
+
+    def close(self) -> dict:
+        """
+        Write any remaining frames and finish the file.
+
+        Returns:
+            Dictionary with file info, as returned by GIFBuilder.save()
+        """
+        if self._writer is None:
+            if not self._warmup:
+                raise ValueError("No frames to save. Add frames with add_frame() first.")
+            self._start_from_warmup()
+        frame_count = self._writer.close()
+        self.closed = True
+        if self.frames_removed:
+            print(f"  Removed {self.frames_removed} nearly identical frames")
+        return self.builder._report(
+            self.output_path, frame_count, self.total_ms, self.num_colors
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        elif self._writer is not None:
+            self._writer.close()
+            self.closed = True
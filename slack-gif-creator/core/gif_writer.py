@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+GIF Writer - Incremental GIF encoder for palette-indexed frames.
+
+Frames are written one at a time as (H, W) arrays of palette indices, so an
+animation never has to be held in memory as a whole. With delta encoding
+(the default) each frame after the first is compared with the previous one
+and only the bounding box of the changed pixels is written, with unchanged
+pixels inside it set to a transparent index. Frames are drawn on top of the
+previous frame (disposal method 1), so the result looks the same as writing
+full frames, but LZW gets long runs of one index to compress and much less
+data to encode when only a small part of the picture moves. Frames that
+don't change anything are not written; their display time goes to the
+previous frame.
+
+The header is written here; frame data is LZW-encoded with Pillow.
+"""
+
+import struct
+from pathlib import Path
+
+import numpy as np
+from PIL import GifImagePlugin, Image
+
+DISPOSAL_NONE = 1  # Leave the frame in place; the next frame draws on top
+
+
+class GIFWriter:
+    """Write palette-indexed frames to a looping GIF as they are produced."""
+
+    def __init__(
+        self,
+        output,
+        width: int,
+        height: int,
+        palette: np.ndarray,
+        loop: int = 0,
+        delta: bool = True,
+    ):
+        """
+        Open a GIF for writing and write its header.
+
+        Args:
+            output: Output path or binary file object
+            width: Canvas width in pixels
+            height: Canvas height in pixels
+            palette: (K, 3) uint8 global palette; K must be at most 255 with
+                delta encoding, which needs one more index for transparency
+            loop: Number of loops (0 = forever)
+            delta: Write only the changed part of each frame
+        """
+        palette = np.asarray(palette, dtype=np.uint8).reshape(-1, 3)
+        if delta and len(palette) > 255:
+            raise ValueError("Delta encoding needs a palette of at most 255 colors")
+
+        self.width = width
+        self.height = height
+        self.delta = delta
+        self.transparent = len(palette) if delta else None
+        self.frames_written = 0
+        # GIF delays are in centiseconds; round the running total rather than
+        # each frame, so e.g. 15 fps doesn't play back at 16.7 fps
+        self._elapsed_ms = 0.0
+        self._elapsed_cs = 0
+
+        # Global color table: palette plus the transparent slot, padded to 2^n
+        table = palette.tobytes() + (b"\0\0\0" if delta else b"")
+        size_bits = max(1, (len(table) // 3 - 1).bit_length())
+        table += b"\0" * (3 * (1 << size_bits) - len(table))
+        self._palette_bytes = table
+
+        self._owns_file = isinstance(output, (str, Path))
+        self._file = open(output, "wb") if self._owns_file else output
+        self._file.write(
+            b"GIF89a"
+            + struct.pack("<HHBBB", width, height, 0x80 | (size_bits - 1), 0, 0)
+            + table
+            # NETSCAPE2.0 application extension: loop count
+            + b"!\xff\x0bNETSCAPE2.0\x03\x01"
+            + struct.pack("<H", loop)
+            + b"\0"
+        )
+
+        self._previous: np.ndarray | None = None
+        # Frame waiting for its final duration: (indices, (x, y), duration)
+        self._pending: tuple[np.ndarray, tuple[int, int], float] | None = None
+
+    def add_frame(self, indices: np.ndarray, duration: float):
+        """
+        Add a frame of palette indices.
+
+        Args:
+            indices: (H, W) uint8 array of palette indices
+            duration: Display time in milliseconds
+        """
+        indices = np.asarray(indices, dtype=np.uint8)
+        if indices.shape != (self.height, self.width):
+            raise ValueError(
+                f"Frame is {indices.shape[1]}x{indices.shape[0]}, "
+                f"expected {self.width}x{self.height}"
+            )
+
+        if not self.delta or self._previous is None:
+            self._queue(indices.copy(), (0, 0), duration)
+            self._previous = indices.copy()
+            return
+
+        changed = indices != self._previous
+        rows = np.flatnonzero(changed.any(axis=1))
+        if not len(rows):
+            # Nothing changed: show the previous frame for longer instead
+            self.extend_last_frame(duration)
+            return
+        cols = np.flatnonzero(changed.any(axis=0))
+        top, bottom = rows[0], rows[-1] + 1
+        left, right = cols[0], cols[-1] + 1
+
+        region = indices[top:bottom, left:right].copy()
+        region[~changed[top:bottom, left:right]] = self.transparent
+        self._queue(region, (int(left), int(top)), duration)
+        self._previous[top:bottom, left:right] = indices[top:bottom, left:right]
+
+    def extend_last_frame(self, duration: float):
+        """Show the last added frame for `duration` more milliseconds."""
+        if self._pending is None:
+            raise ValueError("No frame to extend")
+        self._pending = (*self._pending[:2], self._pending[2] + duration)
+
+    def _queue(self, region: np.ndarray, offset: tuple[int, int], duration: float):
+        """Write the pending frame, now that its duration is final, and queue this one."""
+        self._flush()
+        self._pending = (region, offset, duration)
+
+    def _flush(self):
+        if self._pending is None:
+            return
+        region, offset, duration = self._pending
+        image = Image.fromarray(region)
+        image.putpalette(self._palette_bytes)
+        self._elapsed_ms += duration
+        delay_cs = max(1, round(self._elapsed_ms / 10) - self._elapsed_cs)
+        self._elapsed_cs += delay_cs
+        params = {"duration": delay_cs * 10}
+        if self.delta:
+            params["disposal"] = DISPOSAL_NONE
+            if self.frames_written:
+                params["transparency"] = self.transparent
+        for chunk in GifImagePlugin.getdata(image, offset, **params):
+            self._file.write(chunk)
+        self.frames_written += 1
+        self._pending = None
+
+    def close(self) -> int:
+        """Write the last frame and the trailer. Returns the number of frames written."""
+        if self._file is None:
+            return self.frames_written
+        self._flush()
+        self._file.write(b";")
+        if self._owns_file:
+            self._file.close()
+        self._file = None
+        return self.frames_written
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
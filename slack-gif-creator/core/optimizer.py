@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Optimizer - Find the best-looking GIF that fits a file size budget.
+
+Instead of saving with fixed settings and checking the size afterwards,
+save_within_size searches the settings that trade quality for size:
+
+- num_colors: palette size
+- frame_step: keep every n-th frame (timing is preserved)
+- scale: output dimensions relative to the builder's
+- threshold: near-duplicate frame removal (see GIFBuilder.deduplicate_frames)
+
+Every combination of frame step, scale and threshold (a "geometry") is
+searched for the most colors that still fit, with a binary search over the
+palette sizes, encoding in memory. Geometries are tried best first, several
+at a time across CPU cores, and geometries that can't beat the best fit
+found so far even with all colors are skipped. Each palette size is built
+once from all source frames and shared by every geometry, so an encode
+costs little more than mapping and LZW compression.
+"""
+
+import io
+import math
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from pathlib import Path
+
+import numpy as np
+
+from core.gif_builder import GIFBuilder
+from core.palette import clear_palette_cache, get_palette
+
+SLACK_EMOJI_MAX_BYTES = 128 * 1024
+
+DEFAULT_COLORS = (255, 192, 128, 96, 64, 48, 32, 24, 16)
+DEFAULT_FRAME_STEPS = (1, 2, 3, 4)
+DEFAULT_SCALES = (1.0, 0.875, 0.75, 0.625, 0.5)
+DEFAULT_THRESHOLDS = (None, 0.999, 0.995, 0.98)  # None = keep near-duplicates
+
+# Frames, durations, fps and palette cache key of the GIF being optimized,
+# set once per worker
+_source: tuple[list[np.ndarray], list[float], int, str] | None = None
+
+
+def _init_worker(
+    frames: list[np.ndarray], durations: list[float], fps: int, palette_key: str
+):
+    global _source
+    _source = (frames, durations, fps, palette_key)
+
+
+def _source_builder() -> GIFBuilder:
+    """A list-mode builder over the worker's source frames (not copied)."""
+    frames, durations, fps, _ = _source
+    height, width = frames[0].shape[:2]
+    builder = GIFBuilder(width, height, fps)
+    builder._frames = list(frames)  # Variants replace the list, never the frames
+    builder.durations = list(durations)
+    return builder
+
+
+def quality_score(variant: dict) -> float:
+    """
+    Score a variant's visual quality, from 1.0 (unchanged) down to 0.
+
+    Heuristic: colors count by bits per pixel, frames by the square root of
+    the share kept (a lower frame rate hurts less than blur), dimensions
+    linearly, and dedup by how different removed frames may be.
+    """
+    colors = math.log2(variant.get("num_colors", 256)) / 8
+    frames = 1 / math.sqrt(variant["frame_step"])
+    threshold = variant["threshold"]
+    dedup = 1.0 if threshold is None else 1 - (1 - threshold) * 5
+    return colors * frames * variant["scale"] * dedup
+
+
+def apply_variant(builder: GIFBuilder, variant: dict):
+    """Decimate, deduplicate and resize a builder's frames as a variant says."""
+    builder.decimate_frames(variant["frame_step"])
+    if variant["threshold"] is not None:
+        builder.deduplicate_frames(variant["threshold"])
+    if variant["scale"] != 1.0:
+        builder._resize_all(
+            max(1, round(builder.width * variant["scale"])),
+            max(1, round(builder.height * variant["scale"])),
+        )
+
+
+def _search_colors(
+    geometry: dict, colors: list[int], max_bytes: int, try_most_first: bool = False
+) -> dict:
+    """
+    Find the most colors with which a geometry fits in max_bytes.
+
+    Args:
+        geometry: frame_step, scale and threshold
+        colors: Palette sizes to consider, most first; fewer colors are
+            assumed never to make the file larger
+        max_bytes: Size budget
+        try_most_first: Encode with the most colors first, in case the
+            budget is generous enough for them
+
+    Returns:
+        Dict with num_colors (None if nothing fits), data and frame_count of
+        the fitting encode, smallest (size of the smallest encode) and encodes
+    """
+    frames, _, _, palette_key = _source
+    builder = _source_builder()
+    apply_variant(builder, geometry)
+    result = {"num_colors": None, "data": None, "frame_count": 0, "encodes": 0}
+
+    def fits(index: int) -> bool:
+        # Build (or reuse) this palette size's palette from all source frames
+        get_palette(frames, colors[index], key=palette_key)
+        output = io.BytesIO()
+        frame_count = builder._encode(output, colors[index], palette_key)
+        result["encodes"] += 1
+        size = output.tell()
+        result["smallest"] = min(result.get("smallest", size), size)
+        if size > max_bytes:
+            return False
+        result.update(
+            num_colors=colors[index], data=output.getvalue(), frame_count=frame_count
+        )
+        return True
+
+    low, high = 0, len(colors) - 1
+    if try_most_first:
+        if fits(low):
+            return result
+        low += 1
+    # If the fewest colors don't fit, nothing does
+    if not fits(high):
+        return result
+    while low < high:
+        middle = (low + high) // 2
+        if fits(middle):
+            high = middle
+        else:
+            low = middle + 1
+    if result["num_colors"] != colors[high]:
+        fits(high)  # The last probe was a miss; re-encode the best fit
+    return result
+
+
+def _effective_thresholds(builder: GIFBuilder, frame_step: int, thresholds: list) -> list:
+    """Drop dedup thresholds that remove no more frames than a stricter one."""
+    effective = []
+    last_count = None
+    for threshold in thresholds:
+        if threshold is None:
+            count = len(range(0, len(builder.frames), frame_step))
+        else:
+            trial = _source_builder()
+            trial.decimate_frames(frame_step)
+            trial.deduplicate_frames(threshold)
+            count = len(trial.frames)
+        if count != last_count:
+            effective.append(threshold)
+            last_count = count
+    return effective
+
+
+def save_within_size(
+    builder: GIFBuilder,
+    output_path: str | Path,
+    max_bytes: int = SLACK_EMOJI_MAX_BYTES,
+    colors=DEFAULT_COLORS,
+    frame_steps=DEFAULT_FRAME_STEPS,
+    scales=DEFAULT_SCALES,
+    thresholds=DEFAULT_THRESHOLDS,
+    workers: int | None = None,
+) -> dict:
+    """
+    Save the builder's frames as the highest-quality GIF within a size budget.
+
+    The builder ends up holding the chosen variant's frames, as after save().
+
+    Args:
+        builder: GIFBuilder with the frames to save
+        output_path: Where to save the GIF
+        max_bytes: Size budget in bytes (default: Slack's emoji limit)
+        colors: Palette sizes to try (at most 255)
+        frame_steps: Frame decimation steps to try (1 = all frames)
+        scales: Dimension scales to try (1.0 = builder's size)
+        thresholds: Dedup thresholds to try (None = no dedup)
+        workers: Worker processes (default: CPU count; 1 = no subprocesses)
+
+    Returns:
+        Dictionary with file info as returned by GIFBuilder.save(), plus
+        "variant" (the chosen settings) and "encodes" (candidates encoded)
+
+    Raises:
+        ValueError: If no frames were added, or no candidate fits
+    """
+    if not len(builder.frames):
+        raise ValueError("No frames to save. Add frames with add_frame() first.")
+
+    colors = sorted({min(c, 255) for c in colors}, reverse=True)
+    thresholds = sorted(set(thresholds), key=lambda t: 2.0 if t is None else t, reverse=True)
+    palette_key = f"size-search-{uuid.uuid4().hex}"
+    source = (list(builder.frames), builder.frame_durations(), builder.fps, palette_key)
+    _init_worker(*source)
+
+    geometries = [
+        {"frame_step": step, "scale": scale, "threshold": threshold}
+        for step in sorted(set(frame_steps))
+        for scale, threshold in product(
+            sorted(set(scales), reverse=True),
+            _effective_thresholds(builder, step, thresholds),
+        )
+    ]
+    # Best possible quality first (what each geometry would score with all colors)
+    geometries.sort(key=lambda geometry: -quality_score(geometry))
+
+    workers = workers or os.cpu_count() or 1
+    executor = None
+    if workers > 1:
+        executor = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=source)
+
+    best = None  # (quality, variant, result)
+    smallest = None
+    encodes = 0
+    try:
+        remaining = geometries
+        while remaining:
+            best_quality = best[0] if best else 0.0
+            # Skip geometries that can't beat the best fit even with all colors
+            remaining = [g for g in remaining if quality_score(g) > best_quality]
+            batch, remaining = remaining[:workers], remaining[workers:]
+            if not batch:
+                break
+
+            # Only palette sizes that would improve on the best fit are worth trying
+            jobs = []
+            for geometry in batch:
+                useful = [
+                    c for c in colors
+                    if quality_score({**geometry, "num_colors": c}) > best_quality
+                ]
+                if useful:
+                    jobs.append((geometry, useful))
+            args = (
+                [g for g, _ in jobs],
+                [c for _, c in jobs],
+                [max_bytes] * len(jobs),
+                # Start the very first search at full quality: often it just fits
+                [g is geometries[0] for g, _ in jobs],
+            )
+            if executor is None:
+                results = list(map(_search_colors, *args))
+            else:
+                results = list(executor.map(_search_colors, *args))
+
+            for (geometry, _), result in zip(jobs, results):
+                encodes += result["encodes"]
+                smallest = min(filter(None, (smallest, result.get("smallest"))))
+                if result["num_colors"] is None:
+                    continue
+                variant = {"num_colors": result["num_colors"], **geometry}
+                quality = quality_score(variant)
+                if best is None or quality > best[0]:
+                    best = (quality, variant, result)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        clear_palette_cache(palette_key)
+
+    if best is None:
+        raise ValueError(
+            f"No variant fits in {max_bytes} bytes (smallest tried: {smallest} bytes); "
+            "try smaller scales, fewer colors or larger frame steps"
+        )
+
+    _, variant, result = best
+    apply_variant(builder, variant)
+    output_path = Path(output_path)
+    output_path.write_bytes(result["data"])
+    info = builder._report(
+        output_path,
+        result["frame_count"],
+        sum(builder.frame_durations()),
+        variant["num_colors"],
+    )
+    info["variant"] = variant
+    info["encodes"] = encodes
+    return info
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Palette - Global color palettes for GIF frames.
+
+GIFs store up to 256 colors per frame. This module builds one palette for a
+whole animation and maps every frame to it with NumPy:
+
+- build_palette: k-means on a stratified sample of pixels from all frames
+- build_lut: nearest palette color for each cell of a 32x32x32 RGB grid
+- map_frames: look up every pixel's palette index in the LUT, optionally
+  with ordered (Bayer) dithering, giving palette-indexed frames
+
+Palettes can be cached under a theme key, so repeated renders in the same
+style skip palette generation.
+"""
+
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+LUT_BITS = 5  # 32 levels per channel
+LUT_SHIFT = 8 - LUT_BITS
+
+# 4x4 Bayer matrix, normalized to offsets in [-0.5, 0.5)
+BAYER_4X4 = (
+    np.array(
+        [[0, 8, 2, 10], [12, 4, 14, 6], [3, 11, 1, 9], [15, 7, 13, 5]],
+        dtype=np.float32,
+    )
+    / 16.0
+    - 0.5
+)
+
+# (theme key, num_colors) -> (palette, lut)
+_palette_cache: dict[tuple[str, int], tuple[np.ndarray, np.ndarray]] = {}
+
+
+def sample_pixels(frames, max_samples: int = 65536, seed: int = 0) -> np.ndarray:
+    """
+    Take a stratified sample of pixels from all frames.
+
+    Every frame contributes (frames are spread evenly if there are more frames
+    than samples), and within a frame samples are spread evenly across the
+    image, so short-lived colors and small regions are still represented.
+
+    Args:
+        frames: Sequence of (H, W, 3) uint8 frames, or an (N, H, W, 3) array
+        max_samples: Total number of pixels to sample
+        seed: Random seed for the jitter within each stratum
+
+    Returns:
+        (S, 3) uint8 array of sampled pixels
+    """
+    rng = np.random.default_rng(seed)
+    frame_count = len(frames)
+    if frame_count > max_samples:
+        picked = np.linspace(0, frame_count - 1, max_samples).astype(int)
+    else:
+        picked = range(frame_count)
+    per_frame = max(1, max_samples // len(picked))
+
+    samples = []
+    for i in picked:
+        flat = np.asarray(frames[i]).reshape(-1, 3)
+        count = min(per_frame, len(flat))
+        stride = len(flat) / count
+        offsets = (np.arange(count) * stride + rng.random(count) * stride).astype(int)
+        samples.append(flat[np.minimum(offsets, len(flat) - 1)])
+    return np.concatenate(samples)
+
+
+def nearest_colors(pixels: np.ndarray, palette: np.ndarray, chunk: int = 16384) -> np.ndarray:
+    """Return the index of the nearest palette color for each (R, G, B) pixel."""
+    palette = palette.astype(np.float32)
+    palette_norms = (palette**2).sum(axis=1)
+    labels = np.empty(len(pixels), dtype=np.intp)
+    for start in range(0, len(pixels), chunk):
+        block = pixels[start : start + chunk].astype(np.float32)
+        # |p - c|^2 = |p|^2 - 2 p.c + |c|^2; |p|^2 is the same for every c
+        distances = palette_norms - 2.0 * block @ palette.T
+        labels[start : start + chunk] = distances.argmin(axis=1)
+    return labels
+
+
+def build_palette(frames, num_colors: int = 128, iterations: int = 8) -> np.ndarray:
+    """
+    Build a global palette for frames with k-means.
+
+    Starts from a median-cut palette of a stratified pixel sample and refines
+    it with a few k-means iterations on the same sample.
+
+    Args:
+        frames: Sequence of (H, W, 3) uint8 frames, or an (N, H, W, 3) array
+        num_colors: Palette size (at most 256)
+        iterations: k-means iterations
+
+    Returns:
+        (K, 3) uint8 palette with K <= num_colors
+    """
+    num_colors = max(2, min(256, num_colors))
+    pixels = sample_pixels(frames)
+
+    unique = np.unique(pixels, axis=0)
+    if len(unique) <= num_colors:
+        return unique.astype(np.uint8)
+
+    seed_image = Image.fromarray(pixels.reshape(1, -1, 3))
+    seeded = seed_image.quantize(colors=num_colors, method=Image.Quantize.MEDIANCUT)
+    used = len(seeded.getcolors(256))
+    centers = np.array(seeded.getpalette()[: used * 3], dtype=np.float64).reshape(-1, 3)
+
+    for _ in range(iterations):
+        labels = nearest_colors(pixels, centers)
+        counts = np.bincount(labels, minlength=len(centers))
+        sums = np.stack(
+            [np.bincount(labels, weights=pixels[:, c], minlength=len(centers)) for c in range(3)],
+            axis=1,
+        )
+        filled = counts > 0
+        moved = sums[filled] / counts[filled, None]
+        if np.allclose(moved, centers[filled], atol=0.5):
+            centers[filled] = moved
+            break
+        centers[filled] = moved
+
+    return np.clip(np.rint(centers), 0, 255).astype(np.uint8)
+
+
+def build_lut(palette: np.ndarray) -> np.ndarray:
+    """
+    Precompute the nearest palette index for every cell of a 32x32x32 RGB grid.
+
+    Returns:
+        Flat uint8 array of 32768 palette indices, indexed by
+        (r >> 3) << 10 | (g >> 3) << 5 | (b >> 3)
+    """
+    levels = (np.arange(1 << LUT_BITS) << LUT_SHIFT) + (1 << LUT_SHIFT) // 2
+    r, g, b = np.meshgrid(levels, levels, levels, indexing="ij")
+    cells = np.stack([r, g, b], axis=-1).reshape(-1, 3)
+    return nearest_colors(cells, palette).astype(np.uint8)
+
+
+def map_frames(
+    frames,
+    palette: np.ndarray,
+    lut: np.ndarray,
+    dither: bool = True,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Map RGB frames to palette indices with a LUT lookup.
+
+    Args:
+        frames: Sequence of (H, W, 3) uint8 frames, or an (N, H, W, 3) array
+        palette: (K, 3) uint8 palette the LUT was built for
+        lut: Lookup table from build_lut
+        dither: Apply ordered (Bayer) dithering to soften banding in gradients
+        out: Optional (N, H, W) uint8 array for the result. Frame i is read
+            completely before out[i] is written, so out may overlap frames
+            that were already mapped.
+
+    Returns:
+        (N, H, W) uint8 array of palette indices
+    """
+    first = np.asarray(frames[0])
+    height, width = first.shape[:2]
+    indices = out
+    if indices is None:
+        indices = np.empty((len(frames), height, width), dtype=np.uint8)
+
+    if dither:
+        # Spread thresholds over roughly the distance between palette colors
+        spacing = 255.0 / max(len(palette), 2) ** (1 / 3)
+        tiles = (-(-height // 4), -(-width // 4))
+        offsets = (np.tile(BAYER_4X4, tiles)[:height, :width] * spacing)[..., None]
+
+    for i, frame in enumerate(frames):
+        frame = np.asarray(frame)
+        if dither:
+            frame = np.clip(frame + offsets, 0, 255).astype(np.uint8)
+        cells = frame >> LUT_SHIFT
+        keys = (
+            (cells[..., 0].astype(np.uint16) << (2 * LUT_BITS))
+            | (cells[..., 1].astype(np.uint16) << LUT_BITS)
+            | cells[..., 2]
+        )
+        indices[i] = lut[keys]
+    return indices
+
+
+def _cache_file(key: str, num_colors: int, cache_dir: str | Path) -> Path:
+    safe_key = "".join(c if c.isalnum() or c in "-_" else "_" for c in key)
+    return Path(cache_dir) / f"{safe_key}-{num_colors}.npy"
+
+
+def cached_palette(
+    key: str, num_colors: int = 128, cache_dir: str | Path | None = None
+) -> tuple[np.ndarray, np.ndarray] | None:
+    """Return the cached (palette, lut) pair for a theme key, or None."""
+    cache_key = (key, num_colors)
+    if cache_key not in _palette_cache and cache_dir is not None:
+        cache_file = _cache_file(key, num_colors, cache_dir)
+        if cache_file.exists():
+            palette = np.load(cache_file)
+            _palette_cache[cache_key] = (palette, build_lut(palette))
+    return _palette_cache.get(cache_key)
+
+
+def get_palette(
+    frames,
+    num_colors: int = 128,
+    key: str | None = None,
+    cache_dir: str | Path | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return a (palette, lut) pair for frames, using the cache when possible.
+
+    Args:
+        frames: Frames to build the palette from if it is not cached
+        num_colors: Palette size
+        key: Theme key (e.g. "fire" or "brand-blue"); renders with the same key
+            and num_colors reuse one palette. None always builds a new palette.
+        cache_dir: Also persist keyed palettes in this directory, so they are
+            reused across processes
+
+    Returns:
+        Tuple of (K, 3) uint8 palette and its lookup table
+    """
+    if key is None:
+        palette = build_palette(frames, num_colors)
+        return palette, build_lut(palette)
+
+    cached = cached_palette(key, num_colors, cache_dir)
+    if cached is not None:
+        return cached
+
+    palette = build_palette(frames, num_colors)
+    if cache_dir is not None:
+        cache_file = _cache_file(key, num_colors, cache_dir)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        np.save(cache_file, palette)
+
+    _palette_cache[(key, num_colors)] = (palette, build_lut(palette))
+    return _palette_cache[(key, num_colors)]
+
+
+def clear_palette_cache(key: str | None = None):
+    """Forget the in-memory cached palettes for a theme key, or all of them."""
+    if key is None:
+        _palette_cache.clear()
+        return
+    for cache_key in [k for k in _palette_cache if k[0] == key]:
+        del _palette_cache[cache_key]
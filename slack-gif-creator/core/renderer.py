@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Renderer - Render animation frames in parallel.
+
+Frames of most animations are pure functions of the frame index, so they can
+be drawn independently. render_frames fans the indices out over a process
+pool; workers write each frame straight into its slot of one shared memory
+block (multiprocessing.shared_memory), so no frame is ever pickled, and
+frame order is kept no matter which worker finishes first.
+
+    def draw(i):
+        frame = background.copy()
+        draw_circle(frame, (20 + i * 4, 240), 30, fill_color=(255, 200, 0))
+        return frame
+
+    builder = GIFBuilder(480, 480, fps=20, max_frames=120)
+    render_frames(draw, 120, builder=builder)
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable
+
+import numpy as np
+from PIL import Image
+
+from core.gif_builder import GIFBuilder
+
+# Per-worker state: (frame function, shared block, frames array over it, builder
+# used to convert frames to the output size)
+_worker: tuple | None = None
+
+
+def _init_worker(fn: Callable, name: str, shape: tuple[int, ...]):
+    global _worker
+    # Pool workers share the parent's resource tracker, so attaching doesn't
+    # register the block a second time; the parent alone unlinks it
+    block = shared_memory.SharedMemory(name=name)
+    frames = np.ndarray(shape, dtype=np.uint8, buffer=block.buf)
+    _worker = (fn, block, frames, GIFBuilder(shape[2], shape[1]))
+
+
+def _render_range(start: int, stop: int):
+    """Render frames [start, stop) into their slots of the shared block."""
+    fn, _, frames, converter = _worker
+    for index in range(start, stop):
+        converter._write_frame(frames[index], fn(index))
+
+
+def render_frames(
+    fn: Callable[[int], np.ndarray | Image.Image],
+    n_frames: int,
+    jobs: int | None = None,
+    builder: GIFBuilder | None = None,
+    width: int | None = None,
+    height: int | None = None,
+    duration: float | None = None,
+) -> np.ndarray | GIFBuilder:
+    """
+    Render frames fn(0), ..., fn(n_frames - 1) in parallel, in order.
+
+    fn is sent to the workers once. With the "fork" start method (the Linux
+    default) it can be any callable, including a closure over a Timeline or
+    background; otherwise it must be picklable (e.g. a module-level function
+    or functools.partial).
+
+    Args:
+        fn: Function from frame index to an (H, W, 3) uint8 array or PIL
+            Image; frames of another size or mode are converted like
+            GIFBuilder.add_frame does
+        n_frames: Number of frames to render
+        jobs: Worker processes (default: CPU count; 1 renders in this process)
+        builder: Add the frames to this builder (size taken from it)
+        width: Frame width when no builder is given
+        height: Frame height when no builder is given
+        duration: Display time of each frame in milliseconds when adding to
+            a builder (default: 1000 / fps)
+
+    Returns:
+        The builder if one was given, else an (n_frames, H, W, 3) uint8 array
+    """
+    if builder is not None:
+        width, height = builder.width, builder.height
+    if width is None or height is None:
+        raise ValueError("Give a builder, or width and height")
+    shape = (n_frames, height, width, 3)
+    jobs = max(1, min(jobs or os.cpu_count() or 1, n_frames))
+
+    if jobs == 1 or n_frames == 0:
+        frames = np.empty(shape, dtype=np.uint8)
+        converter = GIFBuilder(width, height)
+        for index in range(n_frames):
+            converter._write_frame(frames[index], fn(index))
+    else:
+        block = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)))
+        try:
+            shared = np.ndarray(shape, dtype=np.uint8, buffer=block.buf)
+            # A few chunks per worker balance frames that take uneven time
+            chunk = -(-n_frames // (jobs * 4))
+            with ProcessPoolExecutor(
+                jobs, initializer=_init_worker, initargs=(fn, block.name, shape)
+            ) as executor:
+                futures = [
+                    executor.submit(_render_range, start, min(start + chunk, n_frames))
+                    for start in range(0, n_frames, chunk)
+                ]
+                for future in futures:
+                    future.result()  # Re-raise the first error from a worker
+            if builder is not None and builder._buffer is not None:
+                # One copy straight from shared memory into the builder's buffer
+                builder.add_frames(shared, duration)
+                frames = None
+            else:
+                frames = shared.copy()
+            del shared  # Release the view so the block can be closed
+        finally:
+            block.close()
+            block.unlink()
+
+    if builder is None:
+        return frames
+    if frames is not None:
+        builder.add_frames(frames, duration)
+    return builder
@@ -3,16 +3,115 @@
 Validators - Check if GIFs meet Slack's requirements.
 
 These validators help ensure your GIFs meet Slack's size and dimension constraints.
+
+GIFs are read by walking their block structure (screen descriptor, graphic
+control extensions, image descriptors) without decoding any pixel data, so
+validating is limited by reading the file rather than by LZW decoding.
 """
 
+import struct
 from pathlib import Path
 
+# Delay browsers (and Pillow's decoder) use for frames without one
+DEFAULT_DELAY_MS = 100
+
+
+def _skip_sub_blocks(data: bytes, pos: int) -> int:
+    """Return the position after a chain of data sub-blocks."""
+    while pos < len(data):
+        size = data[pos]
+        pos += 1 + size
+        if size == 0:
+            return pos
+    raise EOFError
+
+
+def read_gif_info(gif_path: str | Path) -> dict:
+    """
+    Read a GIF's dimensions, frames and timing from its block structure.
+
+    No pixel data is decoded. Delays are reported as stored (GIFs store
+    them in centiseconds, 0 if a frame has none); viewers typically show
+    delays under 20 ms slower. The duration counts a missing or zero delay
+    as DEFAULT_DELAY_MS, as browsers show it.
+
+    Args:
+        gif_path: Path to GIF file
+
+    Returns:
+        Dict with width, height, frame_count, frame_delays_ms (one per
+        frame), duration_ms (their sum, with the default for 0), loop (None if not looping, 0 =
+        forever), global_palette_size (None if absent), palette_sizes (the
+        color table each frame uses: its local one, else the global one) and
+        truncated (True if the file ends before the trailer)
+
+    Raises:
+        ValueError: If the file is not a GIF
+    """
+    data = Path(gif_path).read_bytes()
+    if len(data) < 13 or data[:6] not in (b"GIF87a", b"GIF89a"):
+        raise ValueError("Not a GIF file")
+
+    width, height, flags = struct.unpack_from("<HHB", data, 6)
+    pos = 13
+    global_palette_size = None
+    if flags & 0x80:
+        global_palette_size = 2 << (flags & 0x07)
+        pos += 3 * global_palette_size
+
+    delays = []
+    palette_sizes = []
+    loop = None
+    delay_cs = 0  # From the graphic control extension before the next image
+    truncated = True
+    try:
+        while pos < len(data):
+            block = data[pos]
+            if block == 0x3B:  # Trailer
+                truncated = False
+                break
+            elif block == 0x21:  # Extension
+                label = data[pos + 1]
+                pos += 2
+                if label == 0xF9 and data[pos] >= 4:  # Graphic control
+                    (delay_cs,) = struct.unpack_from("<H", data, pos + 2)
+                elif label == 0xFF and data[pos : pos + 12] == b"\x0bNETSCAPE2.0":
+                    (loop,) = struct.unpack_from("<H", data, pos + 14)
+                pos = _skip_sub_blocks(data, pos)
+            elif block == 0x2C:  # Image descriptor
+                flags = data[pos + 9]
+                pos += 10
+                palette_size = global_palette_size
+                if flags & 0x80:
+                    palette_size = 2 << (flags & 0x07)
+                    pos += 3 * palette_size
+                pos = _skip_sub_blocks(data, pos + 1)  # After the LZW code size
+                delays.append(delay_cs * 10)
+                palette_sizes.append(palette_size)
+                delay_cs = 0
+            else:
+                raise ValueError(f"Unknown GIF block 0x{block:02x} at byte {pos}")
+    except (EOFError, IndexError, struct.error):
+        pass  # Truncated file: report the frames that were complete
+
+    return {
+        "width": width,
+        "height": height,
+        "frame_count": len(delays),
+        "frame_delays_ms": delays,
+        "duration_ms": sum(delay or DEFAULT_DELAY_MS for delay in delays),
+        "loop": loop,
+        "global_palette_size": global_palette_size,
+        "palette_sizes": palette_sizes,
+        "truncated": truncated,
+    }
+
 
 def validate_gif(
     gif_path: str | Path, is_emoji: bool = True, verbose: bool = True
 ) -> tuple[bool, dict]:
     """
-    Validate GIF for Slack (dimensions, size, frame count).
+    Validate GIF for Slack (dimensions, size, frame count, complete file).
 
     Args:
         gif_path: Path to GIF file
@@ -22,8 +121,6 @@ def validate_gif(
     Returns:
         Tuple of (passes: bool, results: dict with all details)
     """
-    from PIL import Image
-
     gif_path = Path(gif_path)
 
     if not gif_path.exists():
@@ -36,30 +133,15 @@ def validate_gif(
 
     # Get dimensions and frame info
     try:
-        with Image.open(gif_path) as img:
-            width, height = img.size
-
-            # Count frames
-            frame_count = 0
-            try:
-                while True:
-                    img.seek(frame_count)
-                    frame_count += 1
-            except EOFError:
-                pass
-
-            # Get duration
-            try:
-                duration_ms = img.info.get("duration", 100)
-                total_duration = (duration_ms * frame_count) / 1000
-                fps = frame_count / total_duration if total_duration > 0 else 0
-            except:
-                total_duration = None
-                fps = None
-
+        info = read_gif_info(gif_path)
     except Exception as e:
         return False, {"error": f"Failed to read GIF: {e}"}
 
+    width, height = info["width"], info["height"]
+    frame_count = info["frame_count"]
+    total_duration = info["duration_ms"] / 1000
+    fps = frame_count / total_duration if total_duration > 0 else 0
+
     # Validate dimensions
     if is_emoji:
         optimal = width == height == 128
@@ -73,9 +155,13 @@ def validate_gif(
         )
         dim_pass = aspect_ratio <= 2.0 and 320 <= min(width, height) <= 640
 
+    # A file cut off before its trailer is broken even if its first frames read
+    truncated = info["truncated"]
+    passes = dim_pass and not truncated
+
     results = {
         "file": str(gif_path),
-        "passes": dim_pass,
+        "passes": passes,
         "width": width,
         "height": height,
         "size_kb": size_kb,
@@ -83,6 +169,9 @@ def validate_gif(
         "frame_count": frame_count,
         "duration_seconds": total_duration,
         "fps": fps,
+        "frame_delays_ms": info["frame_delays_ms"],
+        "palette_sizes": info["palette_sizes"],
+        "truncated": truncated,
         "is_emoji": is_emoji,
         "optimal": optimal if is_emoji else None,
     }
@@ -115,7 +204,10 @@ def validate_gif(
         if size_mb > 5.0:
             print(f"  Note: Large file size - consider fewer frames/colors")
 
-    return dim_pass, results
+        if truncated:
+            print("  Error: File is truncated (no GIF trailer) - re-save it")
+
+    return passes, results
 
 
 def is_slack_ready(
@@ -130,7 +222,28 @@ def is_slack_ready(
         verbose: Print feedback
 
     Returns:
-        True if dimensions are acceptable
+        True if dimensions are acceptable and the file is complete
     """
     passes, _ = validate_gif(gif_path, is_emoji, verbose)
     return passes
+
+
+def validate_gifs(
+    gif_paths, is_emoji: bool = True, verbose: bool = False
+) -> dict[str, tuple[bool, dict]]:
+    """
+    Validate many GIFs, e.g. a whole emoji library.
+
+    Args:
+        gif_paths: Iterable of GIF paths, or a directory to search for *.gif
+        is_emoji: True for emoji GIFs, False for message GIFs
+        verbose: Print validation details for each GIF
+
+    Returns:
+        Dict mapping each path to validate_gif's (passes, results)
+    """
+    if isinstance(gif_paths, (str, Path)) and Path(gif_paths).is_dir():
+        gif_paths = sorted(Path(gif_paths).rglob("*.gif"))
+    return {
+        str(path): validate_gif(path, is_emoji, verbose) for path in gif_paths
+    }
@@ -12,6 +12,8 @@ import platform
 from pathlib import Path
 from openpyxl import load_workbook
 
+import soffice
+
 
 def setup_libreoffice_macro():
     """Setup LibreOffice macro for recalculation if not already configured"""
@@ -50,22 +52,13 @@ def setup_libreoffice_macro():
         return False
 
 
-def recalc(filename, timeout=30):
+def recalc_with_subprocess(abs_path, timeout):
     """
-    Recalculate formulas in Excel file and report any errors
-    
-    Args:
-        filename: Path to Excel file
-        timeout: Maximum time to wait for recalculation (seconds)
+    Recalculate using a one-shot soffice process and the RecalculateAndSave macro
     
     Returns:
-        dict with error locations and counts
+        dict with an 'error' key on failure, None on success
     """
-    if not Path(filename).exists():
-        return {'error': f'File {filename} does not exist'}
-    
-    abs_path = str(Path(filename).absolute())
-    
     if not setup_libreoffice_macro():
         return {'error': 'Failed to setup LibreOffice macro'}
     
@@ -98,6 +91,35 @@ def recalc(filename, timeout=30):
         else:
             return {'error': error_msg}
     
+    return None
+
+
+def recalc(filename, timeout=30):
+    """
+    Recalculate formulas in Excel file and report any errors
+    
+    Args:
+        filename: Path to Excel file
+        timeout: Maximum time to wait for recalculation (seconds)
+    
+    Returns:
+        dict with error locations and counts
+    """
+    if not Path(filename).exists():
+        return {'error': f'File {filename} does not exist'}
+    
+    abs_path = str(Path(filename).absolute())
+    
+    try:
+        soffice.recalculate(abs_path, timeout=timeout)
+    except soffice.ServiceUnavailable:
+        # Fall back to a one-shot soffice process running the Basic macro
+        error = recalc_with_subprocess(abs_path, timeout)
+        if error:
+            return error
+    except Exception as e:
+        return {'error': f'LibreOffice recalculation failed: {e}'}
+    
     # Check for Excel errors in the recalculated file - scan ALL cells
     try:
         wb = load_workbook(filename, data_only=True)